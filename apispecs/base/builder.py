@@ -0,0 +1,302 @@
+from apispecs.base.models import specification
+from apispecs.base.reference import ReferenceIndex, active_external_documents
+from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.deserialization.instrumentation import active_instrumentation
+from abc import ABC, abstractmethod
+from importlib import import_module
+from time import perf_counter
+from typing import Dict, Iterable, Optional
+
+METHOD_TYPES = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch')
+
+"""
+Builds the specification models from the data of a specification, in a single pass over
+its path items. References are resolved through an index built once per document, and
+identical parameters are built once. Subclasses describe a specification format: the keys
+its data is read with, where the base URL comes from and how parameters are read.
+Loaders of validated data and of trusted raw data only differ in their keys, so both
+produce exactly the same models.
+"""
+class SpecificationBuilder(ABC):
+    ref_key = 'ref'
+    operation_id_key = 'operation_id'
+    method_types = METHOD_TYPES
+    # Keys of the validation keywords, in the order of the `Constraints` arguments.
+    constraint_keys = (
+        'pattern', 'enum', 'minimum', 'maximum', 'exclusive_minimum', 'exclusive_maximum',
+        'min_length', 'max_length', 'min_items', 'max_items', 'unique_items', 'multiple_of'
+    )
+    # Identical parameters are built once and shared by every endpoint and method using them.
+    share_parameters = True
+    # Module of the format's `EXTERNAL_OBJECTS`, the schemas of objects of other documents by kind.
+    # Imported on first use, the schema module depends on the builder.
+    external_objects_module: str = None
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.refs = ReferenceIndex(data, self.ref_key, active_external_documents.get())
+        # Objects of other documents, loaded once per target.
+        self._external = {}
+        # Shared parameters by value, and by the object they were built from.
+        self._parameters: Dict[tuple, specification.Parameter] = {}
+        self._built_parameters: Dict[int, specification.Parameter] = {}
+        self.parameter_references = 0
+
+    def build_specification(self, lazy: bool = False) -> specification.Specification:
+        """
+        Builds the specification. Lazy specifications build each endpoint on first access.
+        """
+        instrumentation = active_instrumentation.get()
+
+        if instrumentation is None:
+            return self._build_specification(lazy)
+
+        start = perf_counter()
+        result = self._build_specification(lazy)
+        instrumentation.on_stage('build', perf_counter() - start, {
+            'paths': len(self.data['paths']),
+            'refs_resolved': len(self.refs),
+            'parameters': self.parameter_references,
+            'unique_parameters': self.unique_parameters,
+            'lazy': lazy
+        })
+        return result
+
+    def _build_specification(self, lazy: bool) -> specification.Specification:
+        data = self.data
+        info = data['info']
+        license = info.get('license', {})
+
+        if lazy:
+            endpoints = specification.LazyEndpoints(data['paths'], self.build_endpoint, self.find_operation_ids)
+        else:
+            endpoints = [self.build_endpoint(url, item) for url, item in data['paths'].items()]
+
+        return specification.Specification(
+            title=info['title'],
+            description=info.get('description', ''),
+            license_name=license.get('name', ''),
+            license_url=license.get('url', ''),
+            version=info['version'],
+            base_url=self.build_base_url(),
+            endpoints=endpoints
+        )
+
+    @abstractmethod
+    def build_base_url(self) -> str:
+        pass
+
+    def build_endpoint(self, url: str, item: dict) -> specification.Endpoint:
+        item = self.resolve(item, 'path_item')
+
+        return specification.Endpoint(
+            url=url,
+            parameters=[self.build_parameter(parameter) for parameter in item.get('parameters', [])],
+            methods=[self.build_method(method, item[method]) for method in self.method_types if method in item]
+        )
+
+    def find_operation_ids(self, item: dict) -> Iterable[str]:
+        item = self.resolve(item, 'path_item')
+        return [item[method][self.operation_id_key] for method in self.method_types if self.operation_id_key in item.get(method, ())]
+
+    def build_method(self, type: str, item: dict) -> specification.Method:
+        return specification.Method(
+            method=type,
+            operation_id=item.get(self.operation_id_key, ''),
+            summary=item.get('summary', ''),
+            description=item.get('description', ''),
+            deprecated=item.get('deprecated', False),
+            parameters=self.build_method_parameters(item)
+        )
+
+    def build_method_parameters(self, item: dict) -> list:
+        return [self.build_parameter(parameter) for parameter in item.get('parameters', [])]
+
+    @property
+    def unique_parameters(self) -> int:
+        return len(self._parameters) if self.share_parameters else self.parameter_references
+
+    def build_parameter(self, item: dict) -> specification.Parameter:
+        resolved = self.resolve(item, 'parameter')
+        self.parameter_references += 1
+
+        if not self.share_parameters:
+            return specification.Parameter(*self.parameter_values(resolved))
+
+        # Inline objects are used once, and may be freed (and their id reused) once streamed.
+        if resolved is item:
+            return self.share_parameter(self.parameter_values(item))
+
+        # Objects reached through a reference are the same object wherever they are used.
+        parameter = self._built_parameters.get(id(resolved))
+
+        if parameter is None:
+            parameter = self.share_parameter(self.parameter_values(resolved))
+            self._built_parameters[id(resolved)] = parameter
+
+        return parameter
+
+    @abstractmethod
+    def parameter_values(self, item: dict) -> tuple:
+        """
+        Reads the values of a parameter, in the order of the `Parameter` arguments.
+        """
+        pass
+
+    def build_constraints(self, item: dict) -> Optional[specification.Constraints]:
+        values = tuple(map(item.get, self.constraint_keys))
+        items = item.get('items')
+
+        if items is not None:
+            items = self.resolve(items, 'schema')
+            values += (self.read_type(items) or None, self.build_constraints(items))
+
+        if values.count(None) == len(values):
+            return None
+
+        # Enums may hold unhashable values (objects), those parameters are simply not shared.
+        return specification.Constraints(*values)
+
+    def read_type(self, item: dict) -> str:
+        type = item.get('type', '')
+
+        if type.__class__ is list:
+            # OpenAPI 3.1 types may list `null` along with the actual type.
+            type = next((value for value in type if value != 'null'), '')
+
+        return type
+
+    def share_parameter(self, values: tuple) -> specification.Parameter:
+        if not self.share_parameters:
+            return specification.Parameter(*values)
+
+        # Python compares `1 == True`, so the types of the non-string values are part of the key.
+        key = values + (type(values[3]), type(values[6]))
+
+        try:
+            parameter = self._parameters.get(key)
+        except TypeError:
+            # Parameters with unhashable default values (lists, objects) are not shared.
+            return specification.Parameter(*values)
+
+        if parameter is None:
+            parameter = self._parameters[key] = specification.Parameter(*values)
+
+        return parameter
+
+    def resolve(self, item: dict, kind: str) -> dict:
+        """
+        Resolves a possible reference to an object of the given kind (e.g. `parameter` or `path_item`).
+        """
+        if not self.refs.is_ref(item):
+            return item
+
+        target, location = self.refs.locate(item[self.ref_key])
+
+        if location is None:
+            return target
+
+        key = id(target)
+        if key not in self._external:
+            self._external[key] = self.load_external(kind, target)
+
+        return self._external[key]
+
+    def load_external(self, kind: str, item: dict) -> dict:
+        """
+        Validates an object of another document, which was not validated along with the specification.
+        """
+        return import_module(self.external_objects_module).EXTERNAL_OBJECTS[kind]().load(item)
+
+"""
+Reads the raw document instead of data validated by marshmallow, so the keys are the ones of
+the document (`$ref`, `operationId`) and objects of other documents are used as they are.
+Only meant for documents that are known to be valid (e.g. checked in CI). Mixed in before
+the builder of a format, which then only maps its own raw keys.
+"""
+class TrustedBuilder(object):
+    ref_key = '$ref'
+    operation_id_key = 'operationId'
+    constraint_keys = (
+        'pattern', 'enum', 'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum',
+        'minLength', 'maxLength', 'minItems', 'maxItems', 'uniqueItems', 'multipleOf'
+    )
+
+    def load_external(self, kind: str, item: dict) -> dict:
+        return item
+
+"""
+Loader with the same `load` interface as the validating schemas for trusted documents,
+building the models straight from the raw document with `builder`, skipping marshmallow.
+"""
+class TrustedSchema(object):
+    builder: type = None
+
+    def __init__(self, lazy: bool = False):
+        self.lazy = lazy
+
+    def load(self, data: dict) -> specification.Specification:
+        try:
+            return self.builder(data).build_specification(self.lazy)
+        except (KeyError, TypeError, AttributeError) as e:
+            raise DeserializationException(f'Failed to build trusted specification: {e!r}')
+
+"""
+Builds the endpoints of a streamed specification one path item at a time.
+Top-level entries are validated as they arrive and kept to resolve references against,
+path items are validated and built on their own, so they can be dropped right after.
+Subclasses give the builders and the schemas of their format.
+"""
+class SchemaEndpointBuilder(ABC):
+    builder: type = None
+    trusted_builder: type = None
+    # Top-level fields a specification must have.
+    required_keys = ()
+
+    def __init__(self, trusted: bool = False):
+        self.trusted = trusted
+        self.head = {}
+        self._keys = set()
+
+        if trusted:
+            self.builder = self.trusted_builder(self.head)
+            self._errors = (KeyError, TypeError, AttributeError)
+        else:
+            # Trusted builds never import marshmallow.
+            from marshmallow import ValidationError
+
+            self.builder = self.builder(self.head)
+            self._head_schema, self._item_schema = self.create_schemas()
+            # Only top-level fields may be missing, `partial=True` would skip required fields of nested objects too.
+            self._partial = tuple(self._head_schema.fields)
+            self._errors = (ValidationError,)
+
+    @abstractmethod
+    def create_schemas(self) -> tuple:
+        """
+        Creates the schemas validating the top-level entries (partially) and single path items.
+        """
+        pass
+
+    def add(self, key: str, value):
+        self._keys.add(key)
+
+        try:
+            self.head.update({key: value} if self.trusted else self._head_schema.load({key: value}, partial=self._partial))
+        except self._errors as e:
+            raise DeserializationException(f'Failed to validate specification: {e}')
+
+    def build(self, url: str, item: dict) -> specification.Endpoint:
+        try:
+            if not self.trusted:
+                item = self._item_schema.load(item)
+
+            return self.builder.build_endpoint(url, item)
+        except self._errors as e:
+            raise DeserializationException(f'Failed to build path {url}: {e!r}' if self.trusted else f'Failed to validate path {url}: {e}')
+
+    def finish(self):
+        missing = [key for key in self.required_keys if key not in self._keys]
+
+        if missing:
+            raise DeserializationException(f'Failed to validate specification: missing {", ".join(missing)}.')
@@ -11,3 +11,20 @@ which schema the specification belongs to.
 """
 class UnknownSchemaException(DeserializationException):
     pass
+
+"""
+Thrown when a reference ($ref) inside the specification
+points nowhere or forms a cycle.
+"""
+class ReferenceException(DeserializationException):
+    pass
+
+"""
+Thrown when the parameters of a request do not satisfy
+the specification of its operation.
+"""
+class RequestValidationException(Exception):
+
+    def __init__(self, errors):
+        super().__init__('; '.join(errors))
+        self.errors = tuple(errors)
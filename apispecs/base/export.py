@@ -0,0 +1,350 @@
+from apispecs.base.models.specification import Specification
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import json
+import mmap
+import sys
+import os
+
+MAGIC = b'APISCOL1'
+FORMAT_VERSION = 1
+# Columns are aligned to this many bytes, so they can be cast in place.
+ALIGNMENT = 8
+# Type code of string columns, which hold ids into the string table.
+STRING = 's'
+STRING_ID = 'I'
+
+# Columns of every table and their array type codes. Rows of other tables are referred to
+# by their index; parameters of path items have no operation (-1).
+TABLES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    'specifications': (
+        ('title', STRING), ('description', STRING), ('version', STRING), ('base_url', STRING),
+        ('license_name', STRING), ('license_url', STRING)
+    ),
+    'endpoints': (
+        ('specification', 'I'), ('url', STRING)
+    ),
+    'operations': (
+        ('specification', 'I'), ('endpoint', 'I'), ('method', STRING), ('operation_id', STRING),
+        ('summary', STRING), ('description', STRING), ('deprecated', 'B')
+    ),
+    'parameters': (
+        ('specification', 'I'), ('endpoint', 'I'), ('operation', 'i'), ('name', STRING), ('description', STRING),
+        ('location', STRING), ('required', 'B'), ('type', STRING), ('format', STRING), ('collection_format', STRING)
+    ),
+}
+
+# Type codes by table and column; files store every column in the narrowest code holding its values.
+TABLES_CODES = {table: {name: code for name, code in columns} for table, columns in TABLES.items()}
+
+def _padding(size: int) -> int:
+    return -size % ALIGNMENT
+
+def _narrow(column: array) -> array:
+    """
+    Stores a column in the narrowest type code that holds all of its values.
+    """
+    if not column:
+        return column
+
+    low, high = min(column), max(column)
+    signed = low < 0
+
+    for code in ('bhiq' if signed else 'BHIQ'):
+        bits = array(code).itemsize * 8
+
+        if (-(1 << bits - 1) <= low and high < 1 << bits - 1) if signed else high < 1 << bits:
+            break
+
+    return column if code == column.typecode else array(code, column.tolist())
+
+"""
+Flattens specifications into one column per field of each table (specifications, endpoints,
+operations and parameters), with every string stored once in a shared string table and
+referred to by id. `write` stores the columns in a file `ColumnarFile` maps back.
+"""
+class ColumnarWriter(object):
+
+    def __init__(self):
+        self.columns: Dict[str, Dict[str, array]] = {
+            table: {name: array(STRING_ID if code == STRING else code) for name, code in columns}
+            for table, columns in TABLES.items()
+        }
+        # The empty string is always id 0.
+        self._strings: Dict[str, int] = {'': 0}
+
+    def __len__(self) -> int:
+        return len(self.columns['specifications']['title'])
+
+    def string(self, value) -> int:
+        if type(value) is not str:
+            value = '' if value is None else str(value)
+
+        strings = self._strings
+        id = strings.get(value)
+
+        if id is None:
+            id = strings[value] = len(strings)
+
+        return id
+
+    def add(self, specification: Specification) -> int:
+        """
+        Adds a specification and returns its row in the specifications table.
+        """
+        string = self.string
+        specifications, endpoints, operations, parameters = (self.columns[table] for table in TABLES)
+        index = len(self)
+
+        for name, _ in TABLES['specifications']:
+            specifications[name].append(string(getattr(specification, name)))
+
+        endpoint_specification, endpoint_url = endpoints['specification'].append, endpoints['url'].append
+        operation_columns = [operations[name].append for name, _ in TABLES['operations']]
+        parameter_columns = [parameters[name].append for name, _ in TABLES['parameters']]
+        endpoint_index = len(endpoints['url'])
+        operation_index = len(operations['method'])
+
+        for endpoint in specification.endpoints:
+            endpoint_specification(index)
+            endpoint_url(string(endpoint.url))
+            self._add_parameters(parameter_columns, index, endpoint_index, -1, endpoint.parameters)
+
+            for method in endpoint.methods:
+                values = (
+                    index, endpoint_index, string(method.method), string(method.operation_id),
+                    string(method.summary), string(method.description), 1 if method.deprecated else 0
+                )
+
+                for append, value in zip(operation_columns, values):
+                    append(value)
+
+                self._add_parameters(parameter_columns, index, endpoint_index, operation_index, method.parameters)
+                operation_index += 1
+
+            endpoint_index += 1
+
+        return index
+
+    def _add_parameters(self, columns: list, specification: int, endpoint: int, operation: int, parameters: Iterable):
+        string = self.string
+
+        for parameter in parameters:
+            values = (
+                specification, endpoint, operation, string(parameter.name), string(parameter.description),
+                string(parameter.location), 1 if parameter.required else 0, string(parameter.type),
+                string(parameter.format), string(parameter.collection_format)
+            )
+
+            for append, value in zip(columns, values):
+                append(value)
+
+    @staticmethod
+    def _place_column(place, code: str, column: array) -> list:
+        column = _narrow(column)
+        # [stored type code, offset, whether it holds string ids]
+        return [column.typecode, place(column.tobytes()), code == STRING]
+
+    def write(self, path: Union[str, os.PathLike]):
+        """
+        Writes the columns: the magic, the length of the JSON header, the header, and the
+        aligned columns and string table at the offsets the header gives (from the end of the header).
+        Columns are written in the byte order of this machine, which the header records.
+        """
+        blocks: List[bytes] = []
+        offset = 0
+
+        def place(data: bytes) -> int:
+            nonlocal offset
+            start = offset
+            blocks.append(data)
+            blocks.append(b'\0' * _padding(len(data)))
+            offset += len(data) + _padding(len(data))
+            return start
+
+        tables = {}
+
+        for table, columns in self.columns.items():
+            rows = len(next(iter(columns.values())))
+            tables[table] = {
+                'rows': rows,
+                'columns': {name: self._place_column(place, TABLES_CODES[table][name], column) for name, column in columns.items()}
+            }
+
+        encoded = [value.encode('utf-8') for value in self._strings]
+        offsets = array('Q', accumulate((len(value) for value in encoded), initial=0))
+        header = {
+            'version': FORMAT_VERSION,
+            'byteorder': sys.byteorder,
+            'tables': tables,
+            'strings': {'count': len(encoded), 'offsets': place(offsets.tobytes()), 'data': place(b''.join(encoded))},
+        }
+        header = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        header += b' ' * _padding(len(MAGIC) + 4 + len(header))
+
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(4, 'little'))
+            f.write(header)
+
+            for block in blocks:
+                f.write(block)
+
+def export_specifications(specifications: Iterable[Specification], path: Union[str, os.PathLike]) -> int:
+    """
+    Exports specifications into a columnar file and returns how many were exported.
+    """
+    writer = ColumnarWriter()
+
+    for specification in specifications:
+        writer.add(specification)
+
+    writer.write(path)
+    return len(writer)
+
+"""
+Columns of a table of a `ColumnarFile`, as memory views over the mapped file.
+String columns hold ids, `ColumnarFile.string` turns them back into strings.
+"""
+class ColumnarTable(object):
+
+    def __init__(self, name: str, rows: int, columns: Dict[str, memoryview], strings: Tuple[str, ...]):
+        self.name = name
+        self.rows = rows
+        self.columns = columns
+        self.string_columns = strings
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, column: str) -> memoryview:
+        return self.columns[column]
+
+    def __str__(self):
+        return f'ColumnarTable(name={self.name}, rows={self.rows}, columns={list(self.columns)})'
+
+"""
+Read-only view of a file written by `ColumnarWriter`. The file is memory-mapped and its
+columns are exposed as typed memory views, so nothing is read or built until it is used:
+aggregations run over the integer columns and only the strings that are shown are decoded.
+Must be closed (or used as a context manager) once the views are no longer used.
+"""
+class ColumnarFile(object):
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._views: List[memoryview] = []
+
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self):
+        buffer = self._mmap
+
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError('Not a columnar specifications file.')
+
+        size = int.from_bytes(buffer[len(MAGIC):len(MAGIC) + 4], 'little')
+        start = len(MAGIC) + 4
+        header = json.loads(buffer[start:start + size])
+
+        if header['version'] != FORMAT_VERSION:
+            raise ValueError(f'Unsupported columnar file version {header["version"]}.')
+
+        if header['byteorder'] != sys.byteorder:
+            raise ValueError(f'The file was written on a {header["byteorder"]} endian machine.')
+
+        self._base = start + size
+        self._data = memoryview(buffer)
+        self.tables: Dict[str, ColumnarTable] = {}
+
+        for table, description in header['tables'].items():
+            rows = description['rows']
+            columns = {}
+
+            for name, (code, offset, _) in description['columns'].items():
+                columns[name] = self._view(offset, rows, code)
+
+            strings = tuple(name for name, (_, _, string) in description['columns'].items() if string)
+            self.tables[table] = ColumnarTable(table, rows, columns, strings)
+
+        strings = header['strings']
+        self._offsets = self._view(strings['offsets'], strings['count'] + 1, 'Q')
+        self._strings_start = self._base + strings['data']
+
+    def _view(self, offset: int, rows: int, code: str) -> memoryview:
+        start = self._base + offset
+        raw = self._data[start:start + rows * array(code).itemsize]
+        view = raw.cast(code)
+        self._views.extend((view, raw))
+        return view
+
+    def __getitem__(self, table: str) -> ColumnarTable:
+        return self.tables[table]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def string_count(self) -> int:
+        return len(self._offsets) - 1
+
+    def string(self, id: int) -> str:
+        start = self._strings_start
+        return str(self._mmap[start + self._offsets[id]:start + self._offsets[id + 1]], 'utf-8')
+
+    def strings(self, ids: Iterable[int]) -> Iterator[str]:
+        string = self.string
+        return (string(id) for id in ids)
+
+    def find_string(self, value: str) -> Optional[int]:
+        """
+        Finds the id of a string, to filter string columns by comparing ids. Searches the
+        string table instead of indexing it, so looking up a few strings stays cheap.
+        """
+        if not value:
+            return 0
+
+        encoded = value.encode('utf-8')
+        offsets = self._offsets
+        start = self._strings_start
+        end = start + offsets[len(offsets) - 1]
+        position = self._mmap.find(encoded, start, end)
+
+        while position != -1:
+            relative = position - start
+            # The last string starting there; only the empty string (id 0) starts where another one does.
+            id = bisect_right(offsets, relative) - 1
+
+            # Only matches spanning a whole string count, not a part of one or of several.
+            if offsets[id] == relative and offsets[id + 1] - relative == len(encoded):
+                return id
+
+            position = self._mmap.find(encoded, position + 1, end)
+
+        return None
+
+    def close(self):
+        # Views must be released before the mapping they point into can be closed.
+        for view in self._views:
+            view.release()
+
+        self._views = []
+        data = getattr(self, '_data', None)
+
+        if data is not None:
+            data.release()
+            self._data = None
+
+        if not self._mmap.closed:
+            self._mmap.close()
@@ -0,0 +1,14 @@
+from marshmallow import fields
+
+"""
+Number keeping the type of the value it reads, so bounds like `maximum: 10` stay
+integers as they are in the raw document (and in the messages quoting them).
+Other values (e.g. numeric strings) are read as floats, like `fields.Number` does.
+"""
+class Number(fields.Number):
+
+    def _format_num(self, value):
+        if value.__class__ is int or value.__class__ is float:
+            return value
+
+        return super()._format_num(value)
@@ -0,0 +1,130 @@
+from apispecs.base.models.specification import Specification, Endpoint, Method, Parameter
+from apispecs.base.utils import format_list
+from typing import Dict, Iterable, Optional, Tuple
+
+METHOD_FIELDS = ('operation_id', 'summary', 'description', 'deprecated')
+
+def parameter_key(parameter: Parameter) -> Tuple[str, str]:
+    return parameter.name, parameter.location
+
+def format_parameter(parameter: Parameter) -> str:
+    # Constraints take part in equality but not in `Parameter.__str__`, so constraint-only changes must show them here.
+    if parameter.constraints is None:
+        return str(parameter)
+
+    return f'{parameter}, constraints={parameter.constraints}'
+
+"""
+Differences between two lists of parameters, matched by name and location.
+"""
+class ParametersDiff(object):
+
+    def __init__(self, old: Iterable[Parameter], new: Iterable[Parameter]):
+        old = {parameter_key(parameter): parameter for parameter in old}
+        new = {parameter_key(parameter): parameter for parameter in new}
+
+        self.added = tuple(parameter for key, parameter in new.items() if key not in old)
+        self.removed = tuple(parameter for key, parameter in old.items() if key not in new)
+        self.changed = tuple((old[key], parameter) for key, parameter in new.items() if key in old and old[key] != parameter)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __str__(self):
+        return (
+            f'ParametersDiff(added={format_list(map(format_parameter, self.added))}, '
+            f'removed={format_list(map(format_parameter, self.removed))}, '
+            f'changed={format_list(f"{format_parameter(old)} -> {format_parameter(new)}" for old, new in self.changed)})'
+        )
+
+class MethodDiff(object):
+
+    def __init__(self, old: Method, new: Method):
+        self.method = new.method
+        self.old = old
+        self.new = new
+        self.changed_fields = tuple(field for field in METHOD_FIELDS if getattr(old, field) != getattr(new, field))
+        self.parameters = ParametersDiff(old.parameters, new.parameters)
+
+    def __bool__(self):
+        return bool(self.changed_fields or self.parameters)
+
+    def __str__(self):
+        return f'MethodDiff(method={self.method}, changed_fields={list(self.changed_fields)}, parameters={self.parameters})'
+
+class EndpointDiff(object):
+
+    def __init__(self, old: Endpoint, new: Endpoint):
+        self.url = new.url
+        self.old = old
+        self.new = new
+        self.parameters = ParametersDiff(old.parameters, new.parameters)
+
+        old_methods = {method.method: method for method in old.methods}
+        new_methods = {method.method: method for method in new.methods}
+
+        self.added_methods = tuple(method for name, method in new_methods.items() if name not in old_methods)
+        self.removed_methods = tuple(method for name, method in old_methods.items() if name not in new_methods)
+        self.changed_methods = tuple(
+            MethodDiff(old_methods[name], method) for name, method in new_methods.items()
+            if name in old_methods and old_methods[name] != method
+        )
+
+    def __bool__(self):
+        return bool(self.parameters or self.added_methods or self.removed_methods or self.changed_methods)
+
+    def __str__(self):
+        return (
+            f'EndpointDiff(url={self.url}, parameters={self.parameters}, '
+            f'added_methods={format_list(method.method for method in self.added_methods)}, '
+            f'removed_methods={format_list(method.method for method in self.removed_methods)}, '
+            f'changed_methods={format_list(self.changed_methods)})'
+        )
+
+"""
+Structural differences between two versions of a specification.
+Endpoints are matched by URL, methods by HTTP method and parameters by name and location.
+"""
+class SpecificationDiff(object):
+
+    def __init__(self, added: Tuple[Endpoint, ...], removed: Tuple[Endpoint, ...], changed: Tuple[EndpointDiff, ...], changed_fields: Tuple[str, ...] = ()):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self.changed_fields = changed_fields
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed or self.changed_fields)
+
+    def __str__(self):
+        return (
+            f'SpecificationDiff(changed_fields={list(self.changed_fields)}, '
+            f'added={format_list(endpoint.url for endpoint in self.added)}, '
+            f'removed={format_list(endpoint.url for endpoint in self.removed)}, '
+            f'changed={format_list(self.changed)})'
+        )
+
+SPECIFICATION_FIELDS = ('title', 'description', 'license_name', 'license_url', 'version', 'base_url')
+
+def diff_specifications(old: Specification, new: Specification, candidates: Optional[Iterable[str]] = None) -> SpecificationDiff:
+    """
+    Compares two specifications. When `candidates` is given, only those URLs are compared,
+    which is enough when every other endpoint is known to be shared between both versions.
+    """
+    old_endpoints: Dict[str, Endpoint] = {endpoint.url: endpoint for endpoint in old.endpoints}
+    new_endpoints: Dict[str, Endpoint] = {endpoint.url: endpoint for endpoint in new.endpoints}
+    urls = new_endpoints if candidates is None else candidates
+    changed = []
+
+    for url in urls:
+        previous, current = old_endpoints.get(url), new_endpoints.get(url)
+
+        if previous is not None and current is not None and previous is not current and previous != current:
+            changed.append(EndpointDiff(previous, current))
+
+    return SpecificationDiff(
+        added=tuple(endpoint for url, endpoint in new_endpoints.items() if url not in old_endpoints),
+        removed=tuple(endpoint for url, endpoint in old_endpoints.items() if url not in new_endpoints),
+        changed=tuple(changed),
+        changed_fields=tuple(field for field in SPECIFICATION_FIELDS if getattr(old, field) != getattr(new, field))
+    )
@@ -1,11 +1,15 @@
 from abc import ABCMeta
+from threading import RLock
 
 class Singleton(type):
     _instances = {}
+    _lock = RLock()
 
     def __call__(cls, *args: tuple, **kwargs: dict):
         if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+            with Singleton._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
 
         return cls._instances[cls]
 
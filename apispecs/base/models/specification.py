@@ -1,11 +1,43 @@
-from apispecs.base.utils import format_list
+from apispecs.base.utils import format_list, intern_string
+from collections.abc import Sequence
+from threading import Lock
+from typing import Callable, Iterable, Optional, Tuple
+
+"""
+Base of all specification models.
+Models are slotted and compare by value, so they stay small when large specifications
+are held in memory and can be used as dictionary keys. They are treated as immutable
+once built; collections are stored as tuples.
+"""
+class Model(object):
+    __slots__ = ()
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def _hash_values(self) -> tuple:
+        return self._values()
+
+    def __eq__(self, other):
+        if type(self) is not type(other):
+            return NotImplemented
+
+        return self._values() == other._values()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash(self._hash_values())
 
 """
 Denotes a single specification.
 All specification implementations must extend this class.
 """
-class Specification(object):
-    
+class Specification(Model):
+    __slots__ = ('title', 'description', 'license_name', 'license_url', 'version', 'base_url', 'endpoints')
+
     def __init__(self, title, description, license_name, license_url, version, base_url, endpoints):
         self.title = title
         self.description = description
@@ -13,7 +45,27 @@ class Specification(object):
         self.license_url = license_url
         self.version = version
         self.base_url = base_url
-        self.endpoints = endpoints
+        self.endpoints = endpoints if isinstance(endpoints, LazyEndpoints) else tuple(endpoints)
+
+    def _values(self) -> tuple:
+        return (self.title, self.description, self.license_name, self.license_url, self.version, self.base_url, tuple(self.endpoints))
+
+    def get_endpoint(self, url: str) -> Optional['Endpoint']:
+        if isinstance(self.endpoints, LazyEndpoints):
+            return self.endpoints.get(url)
+
+        return next((endpoint for endpoint in self.endpoints if endpoint.url == url), None)
+
+    def find_method(self, operation_id: str) -> Optional[Tuple['Endpoint', 'Method']]:
+        if isinstance(self.endpoints, LazyEndpoints):
+            return self.endpoints.find_method(operation_id)
+
+        for endpoint in self.endpoints:
+            for method in endpoint.methods:
+                if method.operation_id == operation_id:
+                    return endpoint, method
+
+        return None
 
     def __str__(self):
         return (
@@ -22,27 +74,29 @@ class Specification(object):
             f'endpoints={format_list(self.endpoints)}'
         )
 
-class Endpoint(object):
+class Endpoint(Model):
+    __slots__ = ('url', 'parameters', 'methods')
 
     def __init__(self, url, parameters, methods):
         self.url = url
-        self.parameters = parameters
-        self.methods = methods
-    
+        self.parameters = tuple(parameters)
+        self.methods = tuple(methods)
+
     def __str__(self):
         return (
             f'Endpoint(url={self.url}, parameters={format_list(self.parameters)}, methods={format_list(self.methods)}'
         )
 
-class Method(object):
+class Method(Model):
+    __slots__ = ('method', 'operation_id', 'summary', 'description', 'deprecated', 'parameters')
 
     def __init__(self, method, operation_id, summary, description, deprecated, parameters):
-        self.method = method
+        self.method = intern_string(method)
         self.operation_id = operation_id
         self.summary = summary
         self.description = description
         self.deprecated = deprecated
-        self.parameters = parameters
+        self.parameters = tuple(parameters)
 
     def __str__(self):
         return (
@@ -51,17 +105,56 @@ class Method(object):
             f'parameters={format_list(self.parameters)}'
         )
 
-class Parameter(object):
-    
-    def __init__(self, name, description, location, required, type, format, default_value, collection_format):
-        self.name = name
+"""
+Restrictions on the values of a parameter (JSON schema validation keywords).
+Keywords the parameter does not use are None. The items of arrays have their
+own type and constraints.
+"""
+class Constraints(Model):
+    __slots__ = (
+        'pattern', 'enum', 'minimum', 'maximum', 'exclusive_minimum', 'exclusive_maximum',
+        'min_length', 'max_length', 'min_items', 'max_items', 'unique_items', 'multiple_of',
+        'items_type', 'items'
+    )
+
+    def __init__(self, pattern=None, enum=None, minimum=None, maximum=None, exclusive_minimum=None, exclusive_maximum=None,
+                 min_length=None, max_length=None, min_items=None, max_items=None, unique_items=None, multiple_of=None,
+                 items_type=None, items=None):
+        self.pattern = pattern
+        self.enum = tuple(enum) if enum is not None else None
+        self.minimum = minimum
+        self.maximum = maximum
+        self.exclusive_minimum = exclusive_minimum
+        self.exclusive_maximum = exclusive_maximum
+        self.min_length = min_length
+        self.max_length = max_length
+        self.min_items = min_items
+        self.max_items = max_items
+        self.unique_items = unique_items
+        self.multiple_of = multiple_of
+        self.items_type = items_type
+        self.items: Optional[Constraints] = items
+
+    def __str__(self):
+        return f"Constraints({', '.join(f'{name}={getattr(self, name)}' for name in self.__slots__ if getattr(self, name) is not None)})"
+
+class Parameter(Model):
+    __slots__ = ('name', 'description', 'location', 'required', 'type', 'format', 'default_value', 'collection_format', 'constraints')
+
+    def __init__(self, name, description, location, required, type, format, default_value, collection_format, constraints=None):
+        self.name = intern_string(name)
         self.description = description
-        self.location = location
+        self.location = intern_string(location)
         self.required = required
-        self.type = type
-        self.format = format
+        self.type = intern_string(type)
+        self.format = intern_string(format)
         self.default_value = default_value
-        self.collection_format = collection_format
+        self.collection_format = intern_string(collection_format)
+        self.constraints: Optional[Constraints] = constraints
+
+    def _hash_values(self) -> tuple:
+        # Default values and enums may be unhashable (lists, objects), so they only take part in equality.
+        return (self.name, self.description, self.location, self.required, self.type, self.format, self.collection_format)
 
     def __str__(self):
         return (
@@ -69,3 +162,113 @@ class Parameter(object):
             f'required={self.required}, type={self.type}, format={self.format}, '
             f'default_value={self.default_value}, collection_format={self.collection_format}'
         )
+
+"""
+Read-only sequence of endpoints that are built on first access and kept afterwards.
+Holds on to the validated path items until every endpoint has been built, so looking
+up a handful of operations in a large specification only builds those endpoints.
+Endpoints are built under a lock, so specifications may be shared between threads.
+"""
+class LazyEndpoints(Sequence):
+    __slots__ = ('_urls', '_items', '_endpoints', '_build', '_find_operation_ids', '_positions', '_operations', '_remaining', '_lock')
+
+    def __init__(self, items: dict, build: Callable[[str, dict], Endpoint], find_operation_ids: Callable[[dict], Iterable[str]]):
+        self._urls = tuple(items)
+        self._items = items
+        self._endpoints = [None] * len(self._urls)
+        self._build = build
+        self._find_operation_ids = find_operation_ids
+        self._positions = None
+        self._operations = None
+        self._remaining = len(self._urls)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._materialize(position) for position in range(*index.indices(len(self._urls))))
+
+        if index < 0:
+            index += len(self._urls)
+
+        if not 0 <= index < len(self._urls):
+            raise IndexError('Endpoint index out of range.')
+
+        return self._materialize(index)
+
+    def __iter__(self):
+        for index in range(len(self._urls)):
+            yield self._materialize(index)
+
+    def __reduce__(self):
+        # Pickled (e.g. cached) specifications hold plain tuples.
+        return tuple, (tuple(self),)
+
+    def __repr__(self):
+        return f'LazyEndpoints(count={len(self._urls)}, materialized={self.materialized_count})'
+
+    @property
+    def materialized_count(self) -> int:
+        return len(self._urls) - self._remaining
+
+    @property
+    def urls(self) -> Tuple[str, ...]:
+        return self._urls
+
+    def get(self, url: str) -> Optional[Endpoint]:
+        if self._positions is None:
+            self._positions = {url: index for index, url in enumerate(self._urls)}
+
+        index = self._positions.get(url)
+        return self._materialize(index) if index is not None else None
+
+    def find_method(self, operation_id: str) -> Optional[Tuple[Endpoint, Method]]:
+        if self._operations is None:
+            # Path items are dropped once every endpoint is built, which may happen meanwhile.
+            with self._lock:
+                if self._operations is None:
+                    operations = {}
+
+                    for index, url in enumerate(self._urls):
+                        if self._endpoints[index] is not None:
+                            ids = (method.operation_id for method in self._endpoints[index].methods)
+                        else:
+                            ids = self._find_operation_ids(self._items[url])
+
+                        for id in ids:
+                            operations.setdefault(id, index)
+
+                    self._operations = operations
+
+        index = self._operations.get(operation_id)
+
+        if index is None:
+            return None
+
+        endpoint = self._materialize(index)
+        return endpoint, next(method for method in endpoint.methods if method.operation_id == operation_id)
+
+    def _materialize(self, index: int) -> Endpoint:
+        endpoint = self._endpoints[index]
+
+        if endpoint is not None:
+            return endpoint
+
+        # Builders are not thread-safe, and every endpoint must only be counted once.
+        with self._lock:
+            endpoint = self._endpoints[index]
+
+            if endpoint is None:
+                url = self._urls[index]
+                endpoint = self._endpoints[index] = self._build(url, self._items[url])
+                self._remaining -= 1
+
+                if self._remaining == 0:
+                    # Everything is built, so the validated data is no longer needed.
+                    self._items = None
+                    self._build = None
+                    self._find_operation_ids = None
+
+        return endpoint
@@ -0,0 +1,210 @@
+from apispecs.base.exceptions import ReferenceException
+from contextvars import ContextVar
+from typing import Dict, Optional, Protocol, Tuple
+from urllib.parse import unquote
+import os
+
+# Other documents are read raw, so their references always use the key of the format.
+EXTERNAL_REF_KEY = '$ref'
+
+def escape_pointer_token(token: str) -> str:
+    return token.replace('~', '~0').replace('/', '~1')
+
+def unescape_pointer_token(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+def normalize_refs(document, location: str):
+    """
+    Rewrites every reference of a document read from `location` to an absolute one
+    (`/specs/common.yaml#/definitions/Error`), so its fragments can be resolved
+    without knowing which document they came from.
+    """
+    paths: Dict[str, str] = {}
+    directory = os.path.dirname(location)
+    stack = [document]
+
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+
+        if kind is dict:
+            ref = value.get(EXTERNAL_REF_KEY)
+
+            if type(ref) is str:
+                path, _, pointer = ref.partition('#')
+
+                if not path:
+                    value[EXTERNAL_REF_KEY] = f'{location}#{pointer}'
+                elif '://' not in path:
+                    if path not in paths:
+                        paths[path] = os.path.realpath(os.path.join(directory, unquote(path)))
+
+                    value[EXTERNAL_REF_KEY] = f'{paths[path]}#{pointer}'
+
+            stack.extend(value.values())
+        elif kind is list:
+            stack.extend(value)
+
+    return document
+
+class DocumentLoader(Protocol):
+
+    def load(self, path: str):
+        pass
+
+"""
+Other documents a specification read from `location` may refer to, loaded through
+`loader` (e.g. a `DocumentCache`, shared by every specification that is loaded).
+Only documents inside `root` (the directory of the specification by default) may be
+referred to, once symbolic links are resolved.
+"""
+class ExternalDocuments(object):
+
+    def __init__(self, location: str, loader: DocumentLoader, root: Optional[str] = None):
+        self.location = os.path.realpath(location)
+        self.loader = loader
+        self.root = os.path.realpath(root) if root is not None else os.path.dirname(self.location)
+        self._paths: Dict[str, str] = {}
+        self._documents: Dict[str, object] = {}
+
+    def find_path(self, path: str) -> str:
+        try:
+            return self._paths[path]
+        except KeyError:
+            pass
+
+        if '://' in path:
+            raise ReferenceException(f'Remote references are not supported, got {path}.')
+
+        resolved = os.path.realpath(os.path.join(os.path.dirname(self.location), unquote(path)))
+
+        if os.path.commonpath((self.root, resolved)) != self.root:
+            raise ReferenceException(f'Referenced documents must be in {self.root}, got {path}.')
+
+        self._paths[path] = resolved
+        return resolved
+
+    def load(self, path: str):
+        # Every document is looked up once per specification, even if it changes meanwhile.
+        if path not in self._documents:
+            self._documents[path] = self.loader.load(path)
+
+        return self._documents[path]
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._documents)
+
+# Documents the specification being loaded may refer to, so builders can resolve them from inside `Schema.load`.
+active_external_documents: ContextVar[Optional[ExternalDocuments]] = ContextVar('active_external_documents', default=None)
+
+"""
+Resolves JSON pointers against a document (`#/definitions/Pet`) and, given the documents
+it may refer to, against other documents (`common.yaml#/definitions/Error`).
+The index is built once per document and shared by the whole model build,
+so every pointer is walked at most once no matter how many times it is used.
+Chains of references are followed, across documents too, and cycles are reported
+instead of recursing forever.
+"""
+class ReferenceIndex(object):
+
+    def __init__(self, root: dict, ref_key: str = 'ref', documents: Optional[ExternalDocuments] = None):
+        self.root = root
+        self.ref_key = ref_key
+        self.documents = documents
+        # Targets and the path of the document holding them, None for the root document.
+        self._resolved: Dict[str, Tuple[object, Optional[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._resolved)
+
+    def is_ref(self, item) -> bool:
+        return isinstance(item, dict) and self.ref_key in item
+
+    def resolve(self, ref: str):
+        return self.locate(ref)[0]
+
+    def locate(self, ref: str) -> Tuple[object, Optional[str]]:
+        """
+        Resolves a reference to its target and the path of the document holding it,
+        None when the target is part of the root document.
+        """
+        try:
+            return self._resolved[ref]
+        except KeyError:
+            pass
+
+        original = ref
+        seen = []
+        location, pointer = self._split(ref)
+        key = self._format(location, pointer)
+
+        while key not in self._resolved:
+            seen.append(key)
+            target = self._walk(location, pointer, ref)
+            ref_key = self.ref_key if location is None else EXTERNAL_REF_KEY
+
+            if not isinstance(target, dict) or ref_key not in target:
+                self._resolved[key] = (target, location)
+                break
+
+            ref = target[ref_key]
+            location, pointer = self._split(ref)
+            key = self._format(location, pointer)
+
+            if key in seen:
+                raise ReferenceException(f'Circular reference {" -> ".join(seen + [key])} found.')
+
+        result = self._resolved[key]
+
+        for chained in seen:
+            self._resolved[chained] = result
+
+        self._resolved[original] = result
+        return result
+
+    def resolve_item(self, item):
+        if self.is_ref(item):
+            return self.resolve(item[self.ref_key])
+
+        return item
+
+    def walk(self, ref: str):
+        return self._walk(*self._split(ref), ref)
+
+    def _split(self, ref: str) -> Tuple[Optional[str], str]:
+        if not isinstance(ref, str):
+            raise ReferenceException(f'References must be strings, got {ref}.')
+
+        path, _, pointer = ref.partition('#')
+
+        if not path:
+            return None, pointer
+
+        if self.documents is None:
+            raise ReferenceException(f'References must begin from the root (#), got {ref}.')
+
+        path = self.documents.find_path(path)
+        return (None if path == self.documents.location else path), pointer
+
+    def _format(self, location: Optional[str], pointer: str) -> str:
+        return f'{location or ""}#{pointer}'
+
+    def _walk(self, location: Optional[str], pointer: str, ref: str):
+        if pointer and not pointer.startswith('/'):
+            raise ReferenceException(f'Invalid reference {ref} found.')
+
+        data = self.root if location is None else self.documents.load(location)
+
+        for token in pointer.split('/')[1:]:
+            token = unescape_pointer_token(token)
+
+            try:
+                if isinstance(data, list):
+                    data = data[int(token)]
+                else:
+                    data = data[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ReferenceException(f'Invalid reference {ref} found.')
+
+        return data
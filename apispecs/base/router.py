@@ -0,0 +1,150 @@
+from apispecs.base.models.specification import Specification, Endpoint, Method
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+import re
+
+TEMPLATE_PARAMETER = re.compile(r'\{([^{}]+)\}')
+
+"""
+Result of matching a request against the router.
+`method` is None when the path matched but the endpoint has no such method.
+"""
+class RouteMatch(object):
+    __slots__ = ('endpoint', 'method', 'path_parameters')
+
+    def __init__(self, endpoint: Endpoint, method: Optional[Method], path_parameters: Dict[str, str]):
+        self.endpoint = endpoint
+        self.method = method
+        self.path_parameters = path_parameters
+
+    def __str__(self):
+        return f'RouteMatch(url={self.endpoint.url}, method={self.method and self.method.method}, path_parameters={self.path_parameters})'
+
+class _Route(object):
+    __slots__ = ('endpoint', 'methods', 'names')
+
+    def __init__(self, endpoint: Endpoint, names: Tuple[str, ...]):
+        self.endpoint = endpoint
+        self.methods = {method.method.lower(): method for method in endpoint.methods}
+        self.names = names
+
+class _Node(object):
+    __slots__ = ('literals', 'patterns', 'parameter', 'route')
+
+    def __init__(self):
+        self.literals: Dict[str, _Node] = {}
+        # Segments mixing text and parameters (`{name}.json`), tried in insertion order.
+        self.patterns: List[Tuple[re.Pattern, _Node]] = []
+        self.parameter: Optional[_Node] = None
+        self.route: Optional[_Route] = None
+
+"""
+Matches concrete request paths to the endpoints of a specification.
+Path templates are compiled into a trie of segments, so a lookup costs time proportional
+to the number of segments in the path instead of the number of endpoints. Literal segments
+win over templated ones, e.g. `/pets/mine` is preferred to `/pets/{petId}`.
+"""
+class Router(object):
+
+    def __init__(self, specification: Specification, base_path: str = ''):
+        self.base_path = base_path.rstrip('/')
+        self._root = _Node()
+
+        for endpoint in specification.endpoints:
+            self.add(endpoint)
+
+    def add(self, endpoint: Endpoint):
+        node = self._root
+        names = []
+
+        for segment in self._split(endpoint.url):
+            parameters = TEMPLATE_PARAMETER.findall(segment)
+
+            if not parameters:
+                node = node.literals.setdefault(segment, _Node())
+            elif TEMPLATE_PARAMETER.fullmatch(segment):
+                if node.parameter is None:
+                    node.parameter = _Node()
+
+                node = node.parameter
+            else:
+                pattern = re.compile(''.join(
+                    '([^/]+?)' if index % 2 else re.escape(part)
+                    for index, part in enumerate(TEMPLATE_PARAMETER.split(segment))
+                ) + '$')
+                child = next((child for existing, child in node.patterns if existing.pattern == pattern.pattern), None)
+
+                if child is None:
+                    child = _Node()
+                    node.patterns.append((pattern, child))
+
+                node = child
+
+            names.extend(parameters)
+
+        # The first endpoint registered for a template wins, like the first matching path item would.
+        if node.route is None:
+            node.route = _Route(endpoint, tuple(names))
+
+    def match(self, method: str, path: str) -> Optional[RouteMatch]:
+        path = path.split('?', 1)[0]
+
+        if self.base_path:
+            if path != self.base_path and not path.startswith(self.base_path + '/'):
+                return None
+
+            path = path[len(self.base_path):]
+
+        values = []
+        route = self._find(self._root, self._split(path), 0, values)
+
+        if route is None:
+            return None
+
+        return RouteMatch(
+            route.endpoint,
+            route.methods.get(method.lower()),
+            {name: unquote(value) for name, value in zip(route.names, values)}
+        )
+
+    def _find(self, node: _Node, segments: List[str], index: int, values: List[str]) -> Optional[_Route]:
+        if index == len(segments):
+            return node.route
+
+        segment = segments[index]
+        child = node.literals.get(segment)
+
+        if child is not None:
+            route = self._find(child, segments, index + 1, values)
+
+            if route is not None:
+                return route
+
+        for pattern, child in node.patterns:
+            match = pattern.match(segment)
+
+            if match is not None:
+                size = len(values)
+                values.extend(match.groups())
+                route = self._find(child, segments, index + 1, values)
+
+                if route is not None:
+                    return route
+
+                del values[size:]
+
+        if node.parameter is not None and segment:
+            values.append(segment)
+            route = self._find(node.parameter, segments, index + 1, values)
+
+            if route is not None:
+                return route
+
+            values.pop()
+
+        return None
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        path = path.strip('/')
+        return path.split('/') if path else []
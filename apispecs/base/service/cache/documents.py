@@ -0,0 +1,97 @@
+from apispecs.base.reference import normalize_refs
+from apispecs.base.exceptions import ReferenceException
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Tuple
+import os
+
+"""
+In-memory cache of the documents specifications refer to (`common.yaml#/definitions/Error`),
+keyed by canonical path, so documents shared by many specifications are read and parsed once.
+At most `max_documents` documents are kept, least recently used ones are dropped first.
+A document is read again when its file changed. Cached documents are shared between loads
+and must not be modified.
+"""
+class DocumentCache(object):
+
+    def __init__(self, max_documents: int = 128):
+        if max_documents < 1:
+            raise ValueError('The cache must hold at least 1 document.')
+
+        self.max_documents = max_documents
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Canonical path -> (modification time, size, document).
+        self._documents: 'OrderedDict[str, Tuple[int, int, object]]' = OrderedDict()
+        self._lock = Lock()
+        # Held while a document is read, so concurrent loads of one document parse it once.
+        self._loading: Dict[str, Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def load(self, path: str):
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            raise ReferenceException(f'Failed to read referenced document {path}: {e}')
+
+        document = self._get(path, stat)
+        if document is not None:
+            return document
+
+        with self._lock:
+            loading = self._loading.setdefault(path, Lock())
+
+        with loading:
+            document = self._get(path, stat)
+
+            if document is None:
+                document = self._read(path)
+
+                with self._lock:
+                    self.misses += 1
+                    self._documents[path] = (stat.st_mtime_ns, stat.st_size, document)
+                    self._documents.move_to_end(path)
+
+                    while len(self._documents) > self.max_documents:
+                        self._documents.popitem(last=False)
+                        self.evictions += 1
+
+            with self._lock:
+                self._loading.pop(path, None)
+
+        return document
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'documents': len(self._documents)}
+
+    def _get(self, path: str, stat: os.stat_result):
+        with self._lock:
+            entry = self._documents.get(path)
+
+            if entry is None or entry[:2] != (stat.st_mtime_ns, stat.st_size):
+                return None
+
+            self._documents.move_to_end(path)
+            self.hits += 1
+            return entry[2]
+
+    def _read(self, path: str):
+        from apispecs.base.service.deserialization.formats import find_deserialize_service
+        from apispecs.base.service.deserialization.impl.base import map_file
+
+        service = find_deserialize_service(path)
+
+        try:
+            with map_file(path) as buffer:
+                document = service.deserialize_buffer_to_dict(buffer)
+        except OSError as e:
+            raise ReferenceException(f'Failed to read referenced document {path}: {e}')
+
+        return normalize_refs(document, path)
@@ -0,0 +1,166 @@
+from apispecs.base.models.specification import Specification
+from typing import Optional
+import apispecs
+import hashlib
+import pickle
+import tempfile
+import time
+import os
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Bumped whenever the pickled model layout changes, so stale entries are never loaded.
+CACHE_FORMAT_VERSION = '4'
+ENTRY_SUFFIX = '.spec'
+
+"""
+Content-addressed on-disk cache of built specifications.
+Entries are keyed by a hash of the raw input and the library version, written
+atomically (temporary file + rename) so several processes can share a directory,
+and evicted least-recently-used first once the cache grows past `max_size` bytes
+or an entry has not been used for `max_age` seconds.
+Entries are pickles, and loading a pickle runs code: whoever can write to the directory
+can run code in every process using it. The directory is created private (0700), and
+directories owned by another user or writable by others are refused.
+"""
+class SpecificationCache(object):
+
+    def __init__(self, directory: str, max_size: Optional[int] = None, max_age: Optional[float] = None, evict_interval: float = 60.0):
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+        self.evict_interval = evict_interval
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._last_eviction = 0.0
+
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._check_directory()
+
+    def make_key(self, data: bytes, namespace: str = '') -> str:
+        digest = hashlib.sha256()
+        digest.update(f'{apispecs.__version__}:{CACHE_FORMAT_VERSION}:{pickle.HIGHEST_PROTOCOL}:{namespace}\0'.encode())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Specification]:
+        path = self._path(key)
+
+        try:
+            with open(path, 'rb') as f:
+                specification = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # A corrupted or incompatible entry is dropped and treated as a miss.
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return specification
+
+    def put(self, key: str, specification: Specification):
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(specification, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            self._remove(temporary)
+            raise
+
+        self.stores += 1
+
+        if time.monotonic() - self._last_eviction >= self.evict_interval:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes expired entries and then the least recently used ones until the cache fits
+        in `max_size`. Only one process evicts at a time; others skip the pass.
+        """
+        self._last_eviction = time.monotonic()
+
+        if self.max_size is None and self.max_age is None:
+            return
+
+        with open(os.path.join(self.directory, '.lock'), 'a') as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return
+
+            entries = []
+            now = time.time()
+
+            with os.scandir(self.directory) as iterator:
+                for entry in iterator:
+                    if not entry.name.endswith(ENTRY_SUFFIX):
+                        continue
+
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+
+                    if self.max_age is not None and now - stat.st_mtime > self.max_age:
+                        self.evictions += self._remove(entry.path)
+                    else:
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            if self.max_size is not None:
+                size = sum(entry[1] for entry in entries)
+
+                for _, entry_size, path in sorted(entries):
+                    if size <= self.max_size:
+                        break
+
+                    self.evictions += self._remove(path)
+                    size -= entry_size
+
+    def clear(self):
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(ENTRY_SUFFIX):
+                    self._remove(entry.path)
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'stores': self.stores, 'evictions': self.evictions}
+
+    def _check_directory(self):
+        # Ownership and permissions are POSIX concepts.
+        if not hasattr(os, 'geteuid'):
+            return
+
+        stat = os.stat(self.directory)
+
+        if stat.st_uid != os.geteuid():
+            raise PermissionError(f'The cache directory {self.directory} is owned by another user.')
+
+        if stat.st_mode & 0o022:
+            raise PermissionError(f'The cache directory {self.directory} is writable by other users.')
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def _remove(self, path: str) -> int:
+        try:
+            os.remove(path)
+            return 1
+        except FileNotFoundError:
+            return 0
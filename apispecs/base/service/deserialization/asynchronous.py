@@ -0,0 +1,57 @@
+from apispecs.base.models.specification import Specification
+from apispecs.base.service.deserialization.service import AsyncByteStream
+from apispecs.base.service.deserialization.formats import find_deserialize_service
+from apispecs.base.exceptions import DeserializationException
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, Optional, Union
+import asyncio
+import os
+
+"""
+Deserializes specifications from asyncio code. Parsing, validation and the build run on
+`executor` (the loop's default thread pool when None; a process pool also spreads the work
+over several cores), at most `max_concurrency` specifications at a time, each one within
+`timeout` seconds including reading its stream.
+
+Cancelling a call cancels its work if it has not started yet; work already running on the
+executor cannot be interrupted, it finishes in the background and its result is dropped.
+An instance is bound to the event loop it is first used from.
+"""
+class AsyncDeserializeService(object):
+
+    def __init__(self, executor: Optional[Executor] = None, max_concurrency: Optional[int] = None, timeout: Optional[float] = None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError('Concurrency limit must be at least 1.')
+
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def deserialize_to_specification(self, stream: AsyncByteStream, format: str = '.json', trusted: bool = False, lazy: bool = False) -> Specification:
+        """
+        Deserializes an asynchronous byte stream; `format` is a file name or a bare extension.
+        """
+        service = find_deserialize_service(format)
+        return await self._run(service.deserialize_async_to_specification, stream, trusted, lazy)
+
+    async def deserialize_path_to_specification(self, path: Union[str, os.PathLike], trusted: bool = False, lazy: bool = False) -> Specification:
+        service = find_deserialize_service(os.fspath(path))
+        return await self._run(service.deserialize_async_path_to_specification, path, trusted, lazy)
+
+    async def _run(self, deserialize: Callable[..., Awaitable[Specification]], *args) -> Specification:
+        if self.max_concurrency is None:
+            return await self._wait(deserialize, *args)
+
+        # Created on first use: before Python 3.10 it binds to the current event loop when created.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            return await self._wait(deserialize, *args)
+
+    async def _wait(self, deserialize: Callable[..., Awaitable[Specification]], *args) -> Specification:
+        try:
+            return await asyncio.wait_for(deserialize(*args, executor=self.executor), self.timeout)
+        except asyncio.TimeoutError:
+            raise DeserializationException(f'Deserialization timed out after {self.timeout} seconds.')
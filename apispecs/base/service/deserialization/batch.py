@@ -0,0 +1,110 @@
+from apispecs.base.models.specification import Specification
+from apispecs.base.models.singleton import Singleton
+from apispecs.base.service.schema.service import SchemaService, AnyProvider
+from apispecs.base.service.deserialization.formats import find_deserialize_service
+from apispecs.providers import register_providers
+from apispecs.base.exceptions import DeserializationException
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+from itertools import islice
+from io import StringIO, TextIOBase
+import os
+
+Source = Union[str, os.PathLike, TextIOBase]
+
+"""
+Outcome of deserializing a single source of a batch.
+Exactly one of `specification` and `error` is set.
+"""
+class BatchResult(object):
+
+    def __init__(self, index: int, source: str, specification: Optional[Specification] = None, error: Optional[DeserializationException] = None):
+        self.index = index
+        self.source = source
+        self.specification = specification
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __str__(self):
+        return f'BatchResult(index={self.index}, source={self.source}, ok={self.ok}, error={self.error})'
+
+def _deserialize_source(index: int, source: str, text: Optional[str], format: str, trusted: bool) -> BatchResult:
+    try:
+        service = find_deserialize_service(format)
+
+        if text is not None:
+            return BatchResult(index, source, service.deserialize_to_specification(StringIO(text), trusted))
+
+        return BatchResult(index, source, service.deserialize_path_to_specification(source, trusted))
+    except OSError as e:
+        return BatchResult(index, source, error=DeserializationException(f'Failed to read {source}: {e}'))
+    except DeserializationException as e:
+        return BatchResult(index, source, error=e)
+    except Exception as e:
+        # Unexpected failures of a single source are reported like the others instead of aborting the batch.
+        return BatchResult(index, source, error=DeserializationException(f'Failed to deserialize {source}: {e!r}'))
+
+def _deserialize_chunk(chunk: List[tuple]) -> List[BatchResult]:
+    return [_deserialize_source(*item) for item in chunk]
+
+class BatchDeserializeService(metaclass=Singleton):
+
+    def deserialize_batch(
+        self,
+        sources: Iterable[Source],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 1,
+        default_format: str = '.json',
+        trusted: bool = False,
+        providers: Optional[Sequence[AnyProvider]] = None
+    ) -> Iterator[BatchResult]:
+        """
+        Deserializes many specifications over a pool of worker processes and yields
+        results in completion order. Paths pick their format by extension, streams by
+        their `name` attribute, falling back to `default_format`. Failures are reported
+        per source instead of aborting the batch.
+
+        Workers get the providers registered in this process, since the schema service
+        is not shared between processes.
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be at least 1.')
+
+        if providers is None:
+            providers = SchemaService().providers
+
+        max_workers = max_workers or os.cpu_count() or 1
+        items = self._prepare(sources, default_format, trusted)
+
+        with ProcessPoolExecutor(max_workers, initializer=register_providers, initargs=(list(providers),)) as executor:
+            pending = set()
+
+            # Keep a bounded amount of work in flight, so large batches of streams are not read upfront.
+            while True:
+                chunk = list(islice(items, chunk_size))
+
+                if chunk:
+                    pending.add(executor.submit(_deserialize_chunk, chunk))
+
+                if pending and (not chunk or len(pending) >= max_workers * 2):
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        yield from future.result()
+
+                if not chunk and not pending:
+                    break
+
+    def _prepare(self, sources: Iterable[Source], default_format: str, trusted: bool) -> Iterator[tuple]:
+        for index, source in enumerate(sources):
+            if isinstance(source, (str, os.PathLike)):
+                path = os.fspath(source)
+                yield index, path, None, path, trusted
+            else:
+                name = getattr(source, 'name', None)
+                name = name if isinstance(name, str) else f'<stream {index}>'
+                format = name if os.path.splitext(name)[1] else default_format
+                yield index, name, source.read(), format, trusted
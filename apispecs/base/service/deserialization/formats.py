@@ -0,0 +1,22 @@
+from apispecs.base.service.deserialization.service import DeserializeService
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from apispecs.base.service.deserialization.impl.yaml import YAMLDeserializeService
+from apispecs.base.exceptions import DeserializationException
+import os
+
+FORMATS = {
+    '.json': JSONDeserializeService,
+    '.yaml': YAMLDeserializeService,
+    '.yml': YAMLDeserializeService,
+}
+
+def find_deserialize_service(name: str) -> DeserializeService:
+    """
+    Finds the service for a file name or a bare extension (`.json`).
+    """
+    extension = (os.path.splitext(name)[1] or name).lower()
+
+    if extension not in FORMATS:
+        raise DeserializationException(f'Unknown specification format {extension or name}.')
+
+    return FORMATS[extension]()
@@ -1,17 +1,218 @@
 from apispecs.base.service.deserialization.service import DeserializeService
-from apispecs.base.models.specification import Specification
+from apispecs.base.models.specification import Endpoint, Specification
 from apispecs.base.service.schema.service import SchemaService
+from apispecs.base.service.deserialization.instrumentation import Instrumentation, active_instrumentation
+from apispecs.base.reference import ExternalDocuments, active_external_documents
 from apispecs.base.exceptions import DeserializationException
-from marshmallow.exceptions import ValidationError
-from io import TextIOBase
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Tuple, Union
+from io import StringIO, TextIOBase
+from contextlib import contextmanager
+from time import perf_counter
+import mmap
+import os
+
+# Only needed once a schema loads, a cache is configured or a specification is updated.
+if TYPE_CHECKING:
+    from apispecs.base.service.cache.documents import DocumentCache
+    from apispecs.base.service.cache.service import SpecificationCache
+    from apispecs.base.service.deserialization.incremental import IncrementalUpdate
+    from marshmallow import Schema
+
+# Amount of characters read from the beginning of a stream when sniffing its schema version.
+SNIFF_SIZE = 4096
+
+@contextmanager
+def map_file(path: Union[str, os.PathLike]):
+    """
+    Memory-maps a file for reading, so it can be decoded straight from its bytes.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
 
 class BaseDeserializeService(DeserializeService):
+    cache: Optional['SpecificationCache'] = None
+    # Receives per-stage timings; None disables instrumentation entirely.
+    instrumentation: Optional[Instrumentation] = None
+    # Documents referenced from specifications read from files (`common.yaml#/definitions/Error`).
+    # None rejects such references: otherwise any specification could make the service read the
+    # JSON and YAML files of the host. Set a `DocumentCache` to allow them. Specifications referring
+    # to other documents are not stored in `cache`, which could not tell when those documents change.
+    documents: Optional['DocumentCache'] = None
+    # Directory referenced documents must be in, the directory of the specification when None.
+    documents_root: Optional[str] = None
+
+    def deserialize_to_specification(self, stream: TextIOBase, trusted: bool = False, lazy: bool = False) -> Specification:
+        """
+        Deserializes and builds the specification. Trusted documents skip validation
+        and are built straight from the raw data; only use it for known-valid input.
+        Lazy specifications build each endpoint on first access (cached ones are always built).
+        """
+        with self.external_documents(getattr(stream, 'name', None)):
+            if self.cache is None:
+                return self.deserialize_uncached(stream, trusted, lazy)
+
+            text = stream.read()
+            return self.load_cached(text.encode('utf-8'), lambda: self.deserialize_uncached(StringIO(text), trusted), trusted)
+
+    def deserialize_buffer_to_specification(self, buffer: bytes, trusted: bool = False, lazy: bool = False) -> Specification:
+        if self.cache is None:
+            return self.deserialize_buffer(buffer, trusted, lazy)
+
+        return self.load_cached(buffer, lambda: self.deserialize_buffer(buffer, trusted), trusted)
+
+    def deserialize_path_to_specification(self, path: Union[str, os.PathLike], trusted: bool = False, lazy: bool = False) -> Specification:
+        with map_file(path) as buffer, self.external_documents(os.fspath(path)):
+            return self.deserialize_buffer_to_specification(buffer, trusted, lazy)
+
+    @contextmanager
+    def external_documents(self, location: Optional[str]):
+        """
+        Lets the specification read from `location` refer to other documents while it loads.
+        """
+        documents = self.find_external_documents(location)
+
+        if documents is None:
+            yield
+            return
 
-    def deserialize_to_specification(self, stream: TextIOBase) -> Specification:
+        token = active_external_documents.set(documents)
+        try:
+            yield
+        finally:
+            active_external_documents.reset(token)
+
+    def find_external_documents(self, location: Optional[str]) -> Optional[ExternalDocuments]:
+        if self.documents is None or not isinstance(location, str) or not os.path.isfile(location):
+            return None
+
+        return ExternalDocuments(location, self.documents, self.documents_root)
+
+    def stream_endpoints(self, stream: TextIOBase, trusted: bool = False) -> Iterator[Endpoint]:
+        """
+        Yields the endpoints of the specification one at a time while it is read, holding only the
+        top-level entries and the path item being built in memory (see `StreamingDeserializeService`).
+        Neither the cache nor instrumentation are used.
+        """
+        from apispecs.base.service.deserialization.streaming import StreamingDeserializeService
+
+        documents = self.find_external_documents(getattr(stream, 'name', None))
+        return StreamingDeserializeService().stream(self, stream, trusted, documents)
+
+    def stream_path_endpoints(self, path: Union[str, os.PathLike], trusted: bool = False) -> Iterator[Endpoint]:
+        with open(path, encoding='utf-8') as stream:
+            yield from self.stream_endpoints(stream, trusted)
+
+    def update_specification(self, previous: Specification, previous_stream: TextIOBase, stream: TextIOBase, trusted: bool = False) -> 'IncrementalUpdate':
+        """
+        Rebuilds `previous` from a new version of its source, reusing every endpoint
+        that is not affected by the change, and reports what changed. Specifications
+        referring to other documents must be loaded again instead.
+        """
+        from apispecs.base.service.deserialization.incremental import IncrementalDeserializeService
+
+        previous_fields = self.deserialize_to_dict(previous_stream)
         fields = self.deserialize_to_dict(stream)
-        schema = SchemaService().find_schema(fields)
+        return IncrementalDeserializeService().update(previous, previous_fields, fields, trusted)
+
+    def load_cached(self, data: bytes, load: Callable[[], Specification], trusted: bool = False) -> Specification:
+        # Trusted builds skip validation, so validating loads must never be served one.
+        key = self.cache.make_key(data, f'{type(self).__name__}:trusted={trusted}')
+        specification = self.measure('cache', self.cache.get, key, describe=lambda result: {'bytes': len(data), 'hit': result is not None})
+
+        if specification is None:
+            specification = load()
+            documents = active_external_documents.get()
 
+            if documents is None or not documents.loaded:
+                self.cache.put(key, specification)
+
+        return specification
+
+    def deserialize_uncached(self, stream: TextIOBase, trusted: bool = False, lazy: bool = False) -> Specification:
+        stream, schema = self.sniff_schema(stream, trusted, lazy)
+        fields = self.measure('deserialize', self.deserialize_to_dict, stream, describe=lambda _: {'bytes': self._position(stream)})
+        return self.load_specification(fields, schema, trusted, lazy)
+
+    def deserialize_buffer(self, buffer: bytes, trusted: bool = False, lazy: bool = False) -> Specification:
+        schema = self.sniff_head(buffer[:SNIFF_SIZE].decode('utf-8', 'ignore'), trusted, lazy)
+        fields = self.measure('deserialize', self.deserialize_buffer_to_dict, buffer, describe=lambda _: {'bytes': len(buffer)})
+        return self.load_specification(fields, schema, trusted, lazy)
+
+    def load_specification(self, fields: dict, schema: Optional['Schema'], trusted: bool = False, lazy: bool = False) -> Specification:
+        if schema is None:
+            schema = self.measure('find_schema', SchemaService().find_schema, fields, trusted, lazy, describe=lambda _: {'sniffed': False})
+
+        if self.instrumentation is None:
+            return self.load_schema(schema, fields)
+
+        token = active_instrumentation.set(self.instrumentation)
+        try:
+            return self.measure('load', self.load_schema, schema, fields, describe=lambda _: {'paths': len(fields.get('paths') or ())})
+        finally:
+            active_instrumentation.reset(token)
+
+    def load_schema(self, schema: 'Schema', fields: dict) -> Specification:
         try:
             return schema.load(fields)
-        except ValidationError as e:
-            raise DeserializationException(f'Failed to validate specification: {e}')
+        except Exception as e:
+            # Trusted loads never import marshmallow, so its error type is only looked up on failure.
+            from marshmallow.exceptions import ValidationError
+
+            if isinstance(e, ValidationError):
+                raise DeserializationException(f'Failed to validate specification: {e}')
+
+            raise
+
+    def measure(self, stage: str, function: Callable, *args, describe: Callable[[object], dict]):
+        """
+        Runs a stage of the pipeline, reporting its duration and the fields
+        `describe` derives from its result when instrumentation is enabled.
+        """
+        instrumentation = self.instrumentation
+
+        if instrumentation is None:
+            return function(*args)
+
+        start = perf_counter()
+        result = function(*args)
+        instrumentation.on_stage(stage, perf_counter() - start, describe(result))
+        return result
+
+    def sniff_schema(self, stream: TextIOBase, trusted: bool = False, lazy: bool = False) -> Tuple[TextIOBase, Optional['Schema']]:
+        """
+        Picks the schema from the beginning of the stream, so unsupported specifications
+        are rejected before they are parsed. Returns a stream positioned at the start of
+        the document and the schema, or None when the version could not be sniffed.
+        """
+        if stream.seekable():
+            start = stream.tell()
+            head = stream.read(SNIFF_SIZE)
+            stream.seek(start)
+        else:
+            head = stream.read(SNIFF_SIZE)
+            stream = StringIO(head + stream.read())
+
+        return stream, self.sniff_head(head, trusted, lazy)
+
+    def sniff_head(self, head: str, trusted: bool = False, lazy: bool = False) -> Optional['Schema']:
+        return self.measure('find_schema', self._sniff_head, head, trusted, lazy, describe=lambda schema: {'sniffed': schema is not None})
+
+    def _sniff_head(self, head: str, trusted: bool, lazy: bool) -> Optional['Schema']:
+        schema_service = SchemaService()
+        version = self.sniff_version(head, schema_service.families)
+
+        if version is None:
+            return None
+
+        return schema_service.find_schema_by_version(*version, trusted, lazy)
+
+    def _position(self, stream: TextIOBase) -> Optional[int]:
+        try:
+            return stream.tell() if stream.seekable() else None
+        except (OSError, ValueError):
+            return None
@@ -1,12 +1,191 @@
 from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.schema.sniffer import sniff_json_version
+from apispecs.base.service.deserialization.service import PATHS_KEY, Entry
 from .base import BaseDeserializeService
+from typing import Iterable, Iterator, Optional, Tuple
 from io import TextIOBase
 import json
+import re
+
+# Amount of characters read at once when a document is read incrementally.
+CHUNK_SIZE = 1 << 16
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Characters that may continue a number (`1.5e+10`).
+NUMBER_TAIL = re.compile(r'[-+.eE0-9]*')
+
+def import_orjson():
+    """
+    Imports orjson, an optional dependency (`pip install orjson`), once it is enabled:
+    importing it takes a noticeable part of a cold start.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    return orjson
+
+"""
+Reads a JSON document from a stream a value at a time, holding only the value being
+decoded and the unread part of the last chunk in memory.
+"""
+class JSONEntryReader(object):
+
+    def __init__(self, stream: TextIOBase, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        # Characters dropped from the beginning of the buffer, for error messages.
+        self.offset = 0
+        self.eof = False
+
+    def __iter__(self) -> Iterator[Entry]:
+        self.expect('{')
+
+        if self.peek() == '}':
+            self.position += 1
+        else:
+            while True:
+                key = self.read_key()
+
+                if key == PATHS_KEY and self.peek() == '{':
+                    self.position += 1
+                    yield PATHS_KEY, None, {}
+                    yield from self.read_paths()
+                else:
+                    yield key, None, self.read_value()
+
+                if self.expect(',}') == '}':
+                    break
+
+        if self.peek():
+            raise DeserializationException(f'Failed to deserialize JSON: extra data at character {self.offset + self.position}.')
+
+    def read_paths(self) -> Iterator[Entry]:
+        if self.peek() == '}':
+            self.position += 1
+            return
+
+        while True:
+            url = self.read_key()
+            yield PATHS_KEY, url, self.read_value()
+
+            if self.expect(',}') == '}':
+                return
+
+    def read_key(self) -> str:
+        key = self.read_value()
+
+        if not isinstance(key, str):
+            raise DeserializationException(f'Failed to deserialize JSON: expected a property name, got {key!r}.')
+
+        self.expect(':')
+        return key
+
+    def read_value(self):
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.decoder.JSONDecodeError as e:
+                # The value may continue in the next chunk; reading as much as is buffered
+                # already keeps decoding a large value linear.
+                if self.fill(len(self.buffer) - self.position):
+                    continue
+
+                raise DeserializationException(f'Failed to deserialize JSON: {e}')
+
+            # A number ending the chunk may continue in the next one, also when it was cut
+            # right after a `.`, an `e` or a sign, which the decoder stops before (`1.` decodes as 1).
+            if (end == len(self.buffer) or self.is_number_cut(value, end)) and self.fill():
+                continue
+
+            self.position = end
+            return value
+
+    def is_number_cut(self, value, end: int) -> bool:
+        return value.__class__ in (int, float) and NUMBER_TAIL.match(self.buffer, end).end() == len(self.buffer)
+
+    def expect(self, characters: str) -> str:
+        character = self.peek()
+
+        if not character or character not in characters:
+            raise DeserializationException(f'Failed to deserialize JSON: expected one of {characters!r} at character {self.offset + self.position}.')
+
+        self.position += 1
+        return character
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character, or an empty string at the end of the document.
+        """
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if not self.fill():
+                return ''
+
+    def fill(self, size: int = 0) -> bool:
+        if self.eof:
+            return False
+
+        chunk = self.stream.read(max(size, self.chunk_size))
+
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.offset += self.position
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
 
 class JSONDeserializeService(BaseDeserializeService):
+    # Decodes with orjson (when installed) instead of the standard library decoder. Documents orjson
+    # rejects (e.g. holding `NaN`) are decoded again by the standard one, which accepts them or reports
+    # the same errors as without orjson.
+    use_orjson: bool = False
+    # Amount of characters `iterate_entries` reads at once.
+    chunk_size: int = CHUNK_SIZE
 
     def deserialize_to_dict(self, stream: TextIOBase) -> dict:
         try:
+            orjson = import_orjson() if self.use_orjson else None
+
+            if orjson is not None:
+                text = stream.read()
+
+                try:
+                    return orjson.loads(text)
+                except orjson.JSONDecodeError:
+                    return json.loads(text)
+
             return json.load(stream)
         except json.decoder.JSONDecodeError as e:
             raise DeserializationException(f'Failed to deserialize JSON: {e}')
+
+    def deserialize_buffer_to_dict(self, buffer: bytes) -> dict:
+        try:
+            orjson = import_orjson() if self.use_orjson else None
+
+            if orjson is not None:
+                try:
+                    return orjson.loads(memoryview(buffer))
+                except orjson.JSONDecodeError:
+                    pass
+
+            return json.loads(bytes(buffer))
+        except (json.decoder.JSONDecodeError, UnicodeDecodeError) as e:
+            raise DeserializationException(f'Failed to deserialize JSON: {e}')
+
+    def iterate_entries(self, stream: TextIOBase) -> Iterator[Entry]:
+        return iter(JSONEntryReader(stream, self.chunk_size))
+
+    def sniff_version(self, head: str, families: Iterable[str]) -> Optional[Tuple[str, str]]:
+        return sniff_json_version(head, families)
@@ -1,12 +1,116 @@
 from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.schema.sniffer import sniff_yaml_version
+from apispecs.base.service.deserialization.service import PATHS_KEY, Entry
 from .base import BaseDeserializeService
-from io import TextIOBase
+from typing import Iterable, Iterator, Optional, Tuple
+from io import StringIO, TextIOBase
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import MappingEndEvent, MappingStartEvent
+from yaml.resolver import Resolver
 import yaml
 
+try:
+    from yaml.cyaml import CParser
+except ImportError:
+    CParser = None
+
+if CParser is not None:
+    """
+    Parses with libyaml but composes the nodes in Python, so a document can be
+    composed and constructed one node at a time.
+    """
+    class EntryLoader(CParser, Composer, SafeConstructor, Resolver):
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+else:
+    EntryLoader = yaml.SafeLoader
+
+def iterate_yaml_entries(loader) -> Iterator[Entry]:
+    # Stream and document start.
+    loader.get_event()
+    loader.get_event()
+
+    if not loader.check_event(MappingStartEvent):
+        raise DeserializationException('The specification must be a mapping.')
+
+    loader.get_event()
+
+    while not loader.check_event(MappingEndEvent):
+        key = read_node(loader)
+
+        if key == PATHS_KEY and loader.check_event(MappingStartEvent):
+            loader.get_event()
+            yield PATHS_KEY, None, {}
+
+            while not loader.check_event(MappingEndEvent):
+                url = read_node(loader)
+                yield PATHS_KEY, url, read_node(loader)
+
+            loader.get_event()
+        else:
+            yield key, None, read_node(loader)
+
+def read_node(loader):
+    return loader.construct_document(loader.compose_node(None, None))
+
+def find_python_error(data, start: Optional[int], error: yaml.YAMLError) -> yaml.YAMLError:
+    """
+    Parses a document libyaml rejected again with the pure Python loader and returns its error,
+    which names the problem more precisely. Streams are read again from `start`.
+    """
+    if start is not None:
+        data.seek(start)
+
+    try:
+        yaml.load(data, Loader=yaml.SafeLoader)
+    except yaml.YAMLError as e:
+        return e
+
+    return error
+
 class YAMLDeserializeService(BaseDeserializeService):
+    # Uses the libyaml bindings when PyYAML was built with them, the pure Python loader otherwise.
+    # Documents libyaml rejects are parsed again by the Python loader, so errors read the same either way.
+    loader: type = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    # Loader reading documents a node at a time, see `iterate_entries`.
+    entry_loader: type = EntryLoader
 
     def deserialize_to_dict(self, stream: TextIOBase) -> dict:
+        if self.loader is not yaml.SafeLoader and not stream.seekable():
+            # Read at once, so the document can be parsed again.
+            text = StringIO(stream.read())
+            text.name = getattr(stream, 'name', '<file>')
+            stream = text
+
+        return self.load(stream, stream.tell())
+
+    def deserialize_buffer_to_dict(self, buffer: bytes) -> dict:
+        return self.load(buffer, None)
+
+    def load(self, data, start: Optional[int]) -> dict:
         try:
-            return yaml.safe_load(stream)
+            return yaml.load(data, Loader=self.loader)
         except yaml.YAMLError as e:
-            raise DeserializationException(f'Failed to deserialize YAML: {e}')
+            error = e if self.loader is yaml.SafeLoader else find_python_error(data, start, e)
+            raise DeserializationException(f'Failed to deserialize YAML: {error}')
+
+    def iterate_entries(self, stream: TextIOBase) -> Iterator[Entry]:
+        start = stream.tell() if stream.seekable() else None
+        loader = self.entry_loader(stream)
+
+        try:
+            yield from iterate_yaml_entries(loader)
+        except yaml.YAMLError as e:
+            # Streams that cannot be read again keep the error of libyaml.
+            error = e if self.entry_loader is yaml.SafeLoader or start is None else find_python_error(stream, start, e)
+            raise DeserializationException(f'Failed to deserialize YAML: {error}')
+        finally:
+            loader.dispose()
+
+    def sniff_version(self, head: str, families: Iterable[str]) -> Optional[Tuple[str, str]]:
+        return sniff_yaml_version(head, families)
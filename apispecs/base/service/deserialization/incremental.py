@@ -0,0 +1,186 @@
+from apispecs.base.models.specification import Specification
+from apispecs.base.models.diff import SpecificationDiff, diff_specifications
+from apispecs.base.models.singleton import Singleton
+from apispecs.base.service.schema.service import SchemaService
+from apispecs.base.reference import ReferenceIndex, unescape_pointer_token
+from apispecs.base.exceptions import DeserializationException, ReferenceException
+from marshmallow.exceptions import ValidationError
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+REF_KEY = '$ref'
+MISSING = object()
+
+def collect_refs(value) -> Set[str]:
+    refs = set()
+    stack = [value]
+
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+
+        if kind is dict:
+            ref = value.get(REF_KEY)
+
+            if type(ref) is str:
+                refs.add(ref)
+
+            stack.extend(value.values())
+        elif kind is list:
+            stack.extend(value)
+
+    return refs
+
+def graft(target: dict, source: dict, ref: str):
+    """
+    Copies the value a local reference points to from `source` into the same place in `target`.
+    """
+    tokens = [unescape_pointer_token(token) for token in ref[1:].split('/')[1:]]
+
+    if not tokens:
+        return
+
+    for token in tokens[:-1]:
+        value = source[token]
+
+        # Containers other than mappings are copied whole.
+        if not isinstance(value, dict):
+            target[token] = value
+            return
+
+        target = target.setdefault(token, {})
+        source = value
+
+    target[tokens[-1]] = source[tokens[-1]]
+
+class IncrementalUpdate(object):
+
+    def __init__(self, specification: Specification, diff: SpecificationDiff, rebuilt: Tuple[str, ...]):
+        self.specification = specification
+        self.diff = diff
+        self.rebuilt = rebuilt
+
+    def __str__(self):
+        return f'IncrementalUpdate(rebuilt={len(self.rebuilt)}, diff={self.diff})'
+
+"""
+Rebuilds a specification after its source changed, re-validating and rebuilding only the
+path items that changed themselves or reference (directly or through other components)
+a component that changed. Every other endpoint is reused from the previous specification.
+Changes of other documents cannot be seen from the two versions of the source, so
+specifications whose path items refer to other documents are refused.
+"""
+class IncrementalDeserializeService(metaclass=Singleton):
+
+    def update(self, previous: Specification, previous_fields: dict, fields: dict, trusted: bool = False) -> IncrementalUpdate:
+        provider = SchemaService().find_fields_provider(fields)
+        old_paths = previous_fields.get('paths') or {}
+        new_paths = fields.get('paths') or {}
+
+        item_refs = {url: collect_refs(item) for url, item in new_paths.items()}
+        graph = self._build_graph(fields, item_refs.values())
+        external = next((ref for ref in graph if not ref.startswith('#')), None)
+
+        if external is not None:
+            raise DeserializationException(f'Specifications referring to other documents cannot be updated incrementally, got {external}.')
+
+        dirty = self._find_dirty(graph, ReferenceIndex(previous_fields, REF_KEY), ReferenceIndex(fields, REF_KEY))
+
+        previous_endpoints = {endpoint.url: endpoint for endpoint in previous.endpoints}
+        rebuilt = []
+
+        for url, item in new_paths.items():
+            if url not in old_paths or url not in previous_endpoints or item != old_paths[url] or not dirty.isdisjoint(item_refs[url]):
+                rebuilt.append(url)
+
+        reduced = {key: value for key, value in fields.items() if key not in provider.component_keys}
+        reduced['paths'] = {url: new_paths[url] for url in rebuilt}
+
+        for ref in self._closure(graph, (ref for url in rebuilt for ref in item_refs[url])):
+            try:
+                graft(reduced, fields, ref)
+            except (KeyError, IndexError, TypeError):
+                # Broken references are reported by the build itself.
+                pass
+
+        schema = provider.get_trusted_schema() if trusted else provider.get_schema()
+
+        try:
+            partial = schema.load(reduced)
+        except ValidationError as e:
+            raise DeserializationException(f'Failed to validate specification: {e}')
+
+        built = {endpoint.url: endpoint for endpoint in partial.endpoints}
+        specification = Specification(
+            title=partial.title,
+            description=partial.description,
+            license_name=partial.license_name,
+            license_url=partial.license_url,
+            version=partial.version,
+            base_url=partial.base_url,
+            endpoints=[built[url] if url in built else previous_endpoints[url] for url in new_paths]
+        )
+
+        return IncrementalUpdate(specification, diff_specifications(previous, specification, rebuilt), tuple(rebuilt))
+
+    def _build_graph(self, fields: dict, roots: Iterable[Set[str]]) -> Dict[str, Set[str]]:
+        """
+        Maps every reference reachable from the path items to the references its target contains.
+        """
+        index = ReferenceIndex(fields, REF_KEY)
+        graph = {}
+        queue = deque(ref for refs in roots for ref in refs)
+
+        while queue:
+            ref = queue.popleft()
+
+            if ref in graph:
+                continue
+
+            try:
+                graph[ref] = collect_refs(index.walk(ref))
+            except ReferenceException:
+                graph[ref] = set()
+
+            queue.extend(graph[ref] - graph.keys())
+
+        return graph
+
+    def _find_dirty(self, graph: Dict[str, Set[str]], old: ReferenceIndex, new: ReferenceIndex) -> Set[str]:
+        """
+        Finds the references whose target changed, directly or through the references it contains.
+        """
+        dependents = {}
+        for ref, children in graph.items():
+            for child in children:
+                dependents.setdefault(child, []).append(ref)
+
+        queue = deque(ref for ref in graph if self._lookup(old, ref) != self._lookup(new, ref))
+        dirty = set(queue)
+
+        while queue:
+            for dependent in dependents.get(queue.popleft(), ()):
+                if dependent not in dirty:
+                    dirty.add(dependent)
+                    queue.append(dependent)
+
+        return dirty
+
+    def _closure(self, graph: Dict[str, Set[str]], refs: Iterable[str]) -> List[str]:
+        seen = set()
+        stack = list(refs)
+
+        while stack:
+            ref = stack.pop()
+
+            if ref not in seen:
+                seen.add(ref)
+                stack.extend(graph.get(ref, ()))
+
+        return sorted(seen)
+
+    def _lookup(self, index: ReferenceIndex, ref: str):
+        try:
+            return index.walk(ref)
+        except ReferenceException:
+            return MISSING
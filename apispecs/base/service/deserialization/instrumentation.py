@@ -0,0 +1,61 @@
+from contextvars import ContextVar
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Optional
+
+# Only imported when logging instrumentation is used.
+if TYPE_CHECKING:
+    import logging
+
+"""
+Receives per-stage metrics of the deserialization pipeline.
+Stages are `cache`, `deserialize`, `find_schema`, `load` (validation and build) and
+`build` (the model build alone, reported by builders from inside `load`).
+The default implementation ignores everything.
+"""
+class Instrumentation(object):
+
+    def on_stage(self, stage: str, seconds: float, fields: Dict[str, object]):
+        pass
+
+class LoggingInstrumentation(Instrumentation):
+
+    def __init__(self, logger: Optional['logging.Logger'] = None, level: Optional[int] = None):
+        import logging
+
+        self.logger = logger or logging.getLogger('apispecs')
+        self.level = logging.DEBUG if level is None else level
+
+    def on_stage(self, stage: str, seconds: float, fields: Dict[str, object]):
+        if self.logger.isEnabledFor(self.level):
+            details = ' '.join(f'{key}={value}' for key, value in fields.items())
+            self.logger.log(self.level, f'{stage} took {seconds * 1000:.2f} ms {details}'.rstrip())
+
+"""
+Aggregates the number of calls, the total time and the sum of every numeric field per stage.
+"""
+class CounterInstrumentation(Instrumentation):
+
+    def __init__(self):
+        self._lock = Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    def on_stage(self, stage: str, seconds: float, fields: Dict[str, object]):
+        with self._lock:
+            counters = self._stages.setdefault(stage, {'calls': 0, 'seconds': 0.0})
+            counters['calls'] += 1
+            counters['seconds'] += seconds
+
+            for key, value in fields.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    counters[key] = counters.get(key, 0) + value
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {stage: dict(counters) for stage, counters in self._stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+# Instrumentation of the load in progress, so builders can report from inside `Schema.load`.
+active_instrumentation: ContextVar[Optional[Instrumentation]] = ContextVar('active_instrumentation', default=None)
@@ -1,7 +1,61 @@
 from apispecs.base.models.specification import Specification
 from apispecs.base.models.singleton import SingletonABCMeta
+from apispecs.base.service.schema.service import SchemaService, AnyProvider
+from apispecs.providers import register_providers
+from apispecs.base.exceptions import DeserializationException
 from abc import ABC, abstractmethod
-from io import TextIOBase
+from typing import TYPE_CHECKING, AsyncIterable, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple, Union
+from io import StringIO, TextIOBase
+import os
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Top-level key whose entries are streamed one at a time.
+PATHS_KEY = 'paths'
+
+# A top-level `(key, None, value)` entry, or a `('paths', url, path item)` one. A `paths` mapping is
+# announced by a `('paths', None, {})` entry before its items, so documents without one can be told apart.
+Entry = Tuple[str, Optional[str], object]
+
+# Amount of bytes requested per read from asynchronous streams.
+ASYNC_READ_SIZE = 2 ** 16
+
+class AsyncReader(Protocol):
+
+    async def read(self, size: int = -1) -> bytes:
+        pass
+
+# e.g. `asyncio.StreamReader`, an aiofiles file, or an async iterator of chunks like aiohttp's `iter_chunked`.
+AsyncByteStream = Union[AsyncReader, AsyncIterable[bytes]]
+
+async def read_async_stream(stream: AsyncByteStream) -> bytearray:
+    """
+    Reads an asynchronous byte stream to its end without blocking the event loop.
+    """
+    buffer = bytearray()
+
+    if hasattr(stream, 'read'):
+        while True:
+            chunk = await stream.read(ASYNC_READ_SIZE)
+
+            if not chunk:
+                break
+
+            buffer += chunk
+    else:
+        async for chunk in stream:
+            buffer += chunk
+
+    return buffer
+
+def _deserialize_buffer(service_type: type, buffer: bytes, trusted: bool, lazy: bool, providers: Sequence[AnyProvider]) -> Specification:
+    register_providers(providers)
+    return service_type().deserialize_buffer_to_specification(buffer, trusted, lazy)
+
+def _deserialize_path(service_type: type, path: Union[str, os.PathLike], trusted: bool, lazy: bool, providers: Sequence[AnyProvider]) -> Specification:
+    register_providers(providers)
+    return service_type().deserialize_path_to_specification(path, trusted, lazy)
 
 class DeserializeService(metaclass=SingletonABCMeta):
 
@@ -10,5 +64,59 @@ class DeserializeService(metaclass=SingletonABCMeta):
         pass
 
     @abstractmethod
-    def deserialize_to_specification(self, stream: TextIOBase) -> Specification:
+    def deserialize_to_specification(self, stream: TextIOBase, trusted: bool = False, lazy: bool = False) -> Specification:
+        pass
+
+    @abstractmethod
+    def deserialize_buffer_to_specification(self, buffer: bytes, trusted: bool = False, lazy: bool = False) -> Specification:
+        pass
+
+    @abstractmethod
+    def deserialize_path_to_specification(self, path: Union[str, os.PathLike], trusted: bool = False, lazy: bool = False) -> Specification:
         pass
+
+    def deserialize_buffer_to_dict(self, buffer: bytes) -> dict:
+        return self.deserialize_to_dict(StringIO(bytes(buffer).decode('utf-8')))
+
+    def sniff_version(self, head: str, families: Iterable[str]) -> Optional[Tuple[str, str]]:
+        return None
+
+    def iterate_entries(self, stream: TextIOBase) -> Iterator[Entry]:
+        """
+        Yields the top-level entries of a document and each path item on its own, in document order.
+        Formats that can parse incrementally only hold a single entry in memory; this default
+        implementation parses the whole document first.
+        """
+        fields = self.deserialize_to_dict(stream)
+
+        if not isinstance(fields, dict):
+            raise DeserializationException('The specification must be a mapping.')
+
+        for key, value in fields.items():
+            if key == PATHS_KEY and isinstance(value, dict):
+                yield key, None, {}
+
+                for url, item in value.items():
+                    yield key, url, item
+            else:
+                yield key, None, value
+
+    async def deserialize_async_to_specification(self, stream: AsyncByteStream, trusted: bool = False, lazy: bool = False, executor: Optional['Executor'] = None) -> Specification:
+        """
+        Reads an asynchronous byte stream without blocking the event loop and deserializes it
+        on `executor` (the loop's default thread pool when None). Process pools work too:
+        workers get the providers registered in this process, but not the service's cache
+        or instrumentation.
+        """
+        import asyncio
+
+        buffer = await read_async_stream(stream)
+        return await asyncio.get_running_loop().run_in_executor(executor, _deserialize_buffer, type(self), buffer, trusted, lazy, self._worker_providers())
+
+    async def deserialize_async_path_to_specification(self, path: Union[str, os.PathLike], trusted: bool = False, lazy: bool = False, executor: Optional['Executor'] = None) -> Specification:
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(executor, _deserialize_path, type(self), path, trusted, lazy, self._worker_providers())
+
+    def _worker_providers(self) -> List[AnyProvider]:
+        return SchemaService().providers
@@ -0,0 +1,129 @@
+from apispecs.base.models.specification import Endpoint
+from apispecs.base.models.singleton import Singleton
+from apispecs.base.service.schema.service import SchemaService
+from apispecs.base.service.deserialization.service import DeserializeService
+from apispecs.base.reference import ExternalDocuments, active_external_documents
+from apispecs.base.exceptions import DeserializationException, ReferenceException
+from collections import deque
+from typing import Iterator, List, Optional, Protocol, Tuple
+from io import TextIOBase
+
+class EndpointBuilder(Protocol):
+
+    def add(self, key: str, value):
+        """
+        Adds a top-level entry, in document order. `paths` is added as an empty mapping, its items are built instead.
+        """
+        pass
+
+    def build(self, url: str, item: dict) -> Endpoint:
+        pass
+
+    def finish(self):
+        """
+        Checks the specification once every entry was read.
+        """
+        pass
+
+"""
+Builds the endpoints of a specification one at a time while it is read, so only the top-level
+entries (`parameters`, `definitions`, ...) and the path item being built are held in memory.
+Path items are built as soon as they are read unless they refer to entries that were not
+read yet (e.g. `parameters` following `paths`) or the schema is not known yet. Such path
+items, and every one after them, are built once the whole document was read: seekable
+streams are read a second time, the path items of other streams are held until then.
+"""
+class StreamingDeserializeService(metaclass=Singleton):
+
+    def stream(self, service: DeserializeService, stream: TextIOBase, trusted: bool = False, documents: Optional[ExternalDocuments] = None) -> Iterator[Endpoint]:
+        start = stream.tell() if stream.seekable() else None
+        # Top-level entries read before the schema was known.
+        entries: List[Tuple[str, object]] = []
+        builder = None
+        # Index of the first path item that was not built when it was read.
+        deferred = None
+        pending = deque()
+        index = 0
+
+        for key, url, value in service.iterate_entries(stream):
+            if url is None:
+                if builder is not None:
+                    builder.add(key, value)
+                else:
+                    entries.append((key, value))
+                    builder = self.create_builder(entries, trusted, documents)
+
+                continue
+
+            endpoint = None
+
+            if deferred is None and builder is not None:
+                try:
+                    endpoint = builder.build(url, value)
+                except ReferenceException:
+                    # The reference may point into an entry that was not read yet, directly
+                    # or through another document; it is reported once every entry was read.
+                    pass
+
+            if endpoint is not None:
+                yield endpoint
+            else:
+                if deferred is None:
+                    deferred = index
+
+                if start is None:
+                    pending.append((url, value))
+
+            index += 1
+
+        if builder is None:
+            builder = self.create_builder(entries, trusted, documents, final=True)
+
+        builder.finish()
+
+        if deferred is None:
+            return
+
+        if start is None:
+            while pending:
+                yield builder.build(*pending.popleft())
+
+            return
+
+        stream.seek(start)
+        index = 0
+
+        for key, url, value in service.iterate_entries(stream):
+            if url is not None:
+                if index >= deferred:
+                    yield builder.build(url, value)
+
+                index += 1
+
+    def create_builder(self, entries: List[Tuple[str, object]], trusted: bool, documents: Optional[ExternalDocuments], final: bool = False) -> Optional[EndpointBuilder]:
+        """
+        Creates the builder once the entries tell the schema, returns None while they do not.
+        """
+        schema_service = SchemaService()
+        fields = dict(entries)
+
+        if not final and not any(family in fields for family in schema_service.families):
+            return None
+
+        provider = schema_service.find_fields_provider(fields)
+
+        # Builders look up the documents the specification may refer to when they are created.
+        token = active_external_documents.set(documents)
+        try:
+            builder = provider.create_endpoint_builder(trusted)
+        finally:
+            active_external_documents.reset(token)
+
+        if builder is None:
+            raise DeserializationException(f'{provider.family} {provider.major_version} specifications cannot be streamed.')
+
+        for key, value in entries:
+            builder.add(key, value)
+
+        entries.clear()
+        return builder
@@ -1,16 +1,140 @@
-from marshmallow import Schema
 from abc import ABC, abstractmethod
+from importlib import import_module
+from threading import RLock
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+# marshmallow is only imported once a provider builds its schemas.
+if TYPE_CHECKING:
+    from marshmallow import Schema
+    from apispecs.base.service.deserialization.streaming import EndpointBuilder
+
+# Guards the creation of cached schemas; lookups of created ones do not take it.
+_schema_lock = RLock()
+
+def bind_nested_schemas(schema: 'Schema', parents: Tuple[type, ...] = ()):
+    """
+    Creates the nested schemas marshmallow would otherwise create during the first load,
+    so shared schemas are not modified while threads load with them. Recursive schemas
+    are bound one level deep, deeper levels are still created on first use.
+    """
+    from marshmallow import Schema, fields
+
+    if not isinstance(schema, Schema) or type(schema) in parents:
+        return
+
+    parents = parents + (type(schema),)
+    stack = list(schema.fields.values())
+
+    while stack:
+        field = stack.pop()
+
+        if isinstance(field, fields.Nested):
+            bind_nested_schemas(field.schema, parents)
+        elif isinstance(field, fields.List):
+            stack.append(field.inner)
+        elif isinstance(field, fields.Tuple):
+            stack.extend(field.tuple_fields)
+        elif isinstance(field, fields.Mapping):
+            stack.extend(inner for inner in (field.key_field, field.value_field) if inner is not None)
 
 class SchemaProvider(ABC):
+    # Top-level key holding the specification version (e.g. `swagger`) and the major version it handles.
+    family: str = None
+    major_version: str = None
+    # Top-level keys that only hold components referenced through `$ref` (e.g. `definitions`).
+    component_keys: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self._schemas: Dict[Tuple[bool, bool], 'Schema'] = {}
 
-    @abstractmethod
     def is_schema_adequate(self, fields: dict) -> bool:
-        pass
+        return self.find_major_version(fields.get(self.family)) == self.major_version
+
+    def get_schema(self, lazy: bool = False) -> 'Schema':
+        """
+        Returns the validating schema. Schemas are created once per provider and
+        shared, `load` may be called on them from many threads at once.
+        """
+        return self._get_cached_schema(False, lazy)
+
+    def get_trusted_schema(self, lazy: bool = False) -> 'Schema':
+        return self._get_cached_schema(True, lazy)
 
     @abstractmethod
-    def get_schema(self) -> Schema:
+    def create_schema(self, lazy: bool = False) -> 'Schema':
+        """
+        Creates the validating schema. Providers import their schemas here, on first use:
+        the validating one pulls in marshmallow, the trusted one should not need it.
+        """
         pass
 
-    def find_major_version(self, version_string: str) -> str:
+    def create_trusted_schema(self, lazy: bool = False) -> 'Schema':
+        """
+        Creates a loader for documents that are known to be valid. Providers without
+        a faster path fall back to the validating schema.
+        """
+        return self.get_schema(lazy)
+
+    def create_endpoint_builder(self, trusted: bool = False) -> Optional['EndpointBuilder']:
+        """
+        Creates a builder of endpoints from single path items, for specifications that are
+        streamed. Providers that cannot build endpoints on their own return None.
+        """
+        return None
+
+    def _get_cached_schema(self, trusted: bool, lazy: bool) -> 'Schema':
+        key = (trusted, lazy)
+        schema = self._schemas.get(key)
+
+        if schema is None:
+            with _schema_lock:
+                schema = self._schemas.get(key)
+
+                if schema is None:
+                    # Trusted loaders skip marshmallow, or are validating schemas bound already.
+                    if trusted:
+                        schema = self.create_trusted_schema(lazy)
+                    else:
+                        schema = self.create_schema(lazy)
+                        bind_nested_schemas(schema)
+
+                    self._schemas[key] = schema
+
+        return schema
+
+    def __getstate__(self) -> dict:
+        # Cached schemas are rebuilt where the provider is unpickled, e.g. in worker processes.
+        state = dict(self.__dict__)
+        state['_schemas'] = {}
+        return state
+
+    @staticmethod
+    def find_major_version(version_string: str) -> str:
+        if isinstance(version_string, (int, float)) and not isinstance(version_string, bool):
+            version_string = str(version_string)
+
         if isinstance(version_string, str):
             return version_string.split('.')[0]
+
+"""
+Refers to a provider class by its import path (`package.module:ClassName`), so the provider,
+its schemas and their dependencies are only imported once its family is first looked up.
+"""
+class DeferredProvider(object):
+
+    def __init__(self, family: str, major_version: str, target: str):
+        self.family = family
+        self.major_version = major_version
+        self.target = target
+
+    def load(self) -> SchemaProvider:
+        module, _, name = self.target.partition(':')
+        provider = getattr(import_module(module), name)()
+
+        if (provider.family, provider.major_version) != (self.family, self.major_version):
+            raise ValueError(f'{self.target} provides {provider.family} {provider.major_version}, not {self.family} {self.major_version}.')
+
+        return provider
+
+    def __str__(self):
+        return f'DeferredProvider(family={self.family}, major_version={self.major_version}, target={self.target})'
@@ -1,19 +1,139 @@
 from apispecs.base.models.singleton import Singleton
-from apispecs.base.service.schema.provider import SchemaProvider
+from apispecs.base.service.schema.provider import SchemaProvider, DeferredProvider
 from apispecs.base.exceptions import UnknownSchemaException
-from collections.abc import Sequence
-from marshmallow import Schema
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+from threading import RLock
 
+if TYPE_CHECKING:
+    from marshmallow import Schema
+
+AnyProvider = Union[SchemaProvider, DeferredProvider]
+
+"""
+Registry of schema providers. The built-in providers are registered as deferred providers
+when the service is created and providers of other packages are discovered through the
+`apispecs.providers` entry points when a lookup misses, so nothing is imported until
+a family is actually used.
+"""
 class SchemaService(metaclass=Singleton):
-    _providers: Sequence[SchemaProvider] = []
+    # Providers indexed by (family, major version), e.g. ('swagger', '2').
+    # Registration replaces both collections under the lock, so lookups never lock.
+    _providers: Dict[Tuple[str, str], AnyProvider] = {}
+    _families: Tuple[str, ...] = ()
+    _discovered: bool = False
+    _lock = RLock()
+
+    def __init__(self):
+        from apispecs.providers import DEFAULT_PROVIDERS
+
+        for provider in DEFAULT_PROVIDERS:
+            self.register_provider(provider)
+
+    @property
+    def families(self) -> Tuple[str, ...]:
+        return self._families
+
+    @property
+    def providers(self) -> List[AnyProvider]:
+        """
+        Registered providers; the ones that were not used yet are still deferred.
+        """
+        return list(self._providers.values())
+
+    def register_provider(self, provider: AnyProvider):
+        """
+        Registers a provider unless one is already loaded for its family and major version.
+        Deferred providers that were not loaded yet are replaced.
+        """
+        key = (provider.family, provider.major_version)
+        cls = type(self)
+
+        with self._lock:
+            existing = cls._providers.get(key)
+
+            if existing is not provider and not isinstance(existing, SchemaProvider):
+                cls._providers = {**cls._providers, key: provider}
+
+            if provider.family not in cls._families:
+                cls._families = cls._families + (provider.family,)
+
+    def find_provider(self, family: str, version: str) -> Optional[SchemaProvider]:
+        key = (family, SchemaProvider.find_major_version(version))
+        provider = self._providers.get(key)
+
+        if provider is None and self._discover():
+            provider = self._providers.get(key)
+
+        if isinstance(provider, DeferredProvider):
+            return self._load(key)
+
+        return provider
+
+    def find_schema_by_version(self, family: str, version: str, trusted: bool = False, lazy: bool = False) -> 'Schema':
+        provider = self.find_provider(family, version)
+
+        if provider is None:
+            raise UnknownSchemaException(f'The specification schema {family} {version} is not supported.')
 
-    def register_provider(self, provider: SchemaProvider):
-        if provider not in self._providers:
-            self._providers.append(provider)
+        return self._get_schema(provider, trusted, lazy)
 
-    def find_schema(self, fields: dict) -> Schema:
-        for provider in self._providers:
-            if provider.is_schema_adequate(fields):
-                return provider.get_schema()
+    def find_fields_provider(self, fields: dict) -> SchemaProvider:
+        if isinstance(fields, dict):
+            provider = self._find_fields_provider(fields)
+
+            if provider is None and self._discover():
+                provider = self._find_fields_provider(fields)
+
+            if provider is not None:
+                return provider
 
         raise UnknownSchemaException('The specification schema could not be determined.')
+
+    def find_schema(self, fields: dict, trusted: bool = False, lazy: bool = False) -> 'Schema':
+        return self._get_schema(self.find_fields_provider(fields), trusted, lazy)
+
+    def _find_fields_provider(self, fields: dict) -> Optional[SchemaProvider]:
+        for family in self._families:
+            if family in fields:
+                provider = self.find_provider(family, fields[family])
+
+                if provider is not None:
+                    return provider
+
+        return None
+
+    def _get_schema(self, provider: SchemaProvider, trusted: bool, lazy: bool) -> 'Schema':
+        return provider.get_trusted_schema(lazy) if trusted else provider.get_schema(lazy)
+
+    def _load(self, key: Tuple[str, str]) -> SchemaProvider:
+        cls = type(self)
+
+        with self._lock:
+            provider = cls._providers[key]
+
+            if isinstance(provider, DeferredProvider):
+                provider = provider.load()
+                cls._providers = {**cls._providers, key: provider}
+
+            return provider
+
+    def _discover(self) -> bool:
+        """
+        Registers the entry point providers on the first lookup that misses.
+        Returns whether the lookup is worth retrying.
+        """
+        if self._discovered:
+            return False
+
+        from apispecs.providers import find_entry_point_providers
+
+        with self._lock:
+            if type(self)._discovered:
+                return False
+
+            for provider in find_entry_point_providers():
+                if (provider.family, provider.major_version) not in self._providers:
+                    self.register_provider(provider)
+
+            type(self)._discovered = True
+            return True
@@ -0,0 +1,56 @@
+from typing import Iterable, Optional, Tuple
+import json
+import re
+
+JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:,]')
+YAML_KEY = r'^(["\']?)({families})\1[ \t]*:[ \t]*(?:"([^"\n]*)"|\'([^\'\n]*)\'|([^\s#\'"]+))'
+
+"""
+Looks for a top-level version key (`"swagger": "2.0"`) in the beginning
+of a JSON document without parsing the whole document.
+"""
+def sniff_json_version(head: str, families: Iterable[str]) -> Optional[Tuple[str, str]]:
+    if not head.lstrip('\ufeff \t\r\n').startswith('{'):
+        return None
+
+    families = set(families)
+    depth = 0
+    previous = None
+    key = None
+
+    for match in JSON_TOKEN.finditer(head):
+        token = match.group()
+
+        if token in '{[':
+            depth += 1
+        elif token in '}]':
+            depth -= 1
+        elif token == ':':
+            key = previous if depth == 1 and previous is not None and previous[0] == '"' else None
+        elif token[0] == '"' and previous == ':' and key is not None:
+            name = json.loads(key)
+
+            if name in families:
+                return name, json.loads(token)
+
+        previous = token
+
+    return None
+
+"""
+Looks for a top-level version key (`swagger: '2.0'`) in the beginning
+of a YAML document. Top-level keys of a block mapping always start at
+the first column, so a line-anchored search is enough.
+"""
+def sniff_yaml_version(head: str, families: Iterable[str]) -> Optional[Tuple[str, str]]:
+    if head.lstrip('\ufeff \t\r\n').startswith('{'):
+        return sniff_json_version(head, families)
+
+    pattern = re.compile(YAML_KEY.format(families='|'.join(re.escape(family) for family in families)), re.MULTILINE)
+    match = pattern.search(head)
+
+    if match is None:
+        return None
+
+    version = next(group for group in match.group(3, 4, 5) if group is not None)
+    return match.group(2), version
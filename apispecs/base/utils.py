@@ -1,2 +1,7 @@
+from sys import intern
+
 def format_list(array):
     return f"[{', '.join([str(element) for element in array])}]"
+
+def intern_string(value):
+    return intern(value) if type(value) is str else value
@@ -0,0 +1,268 @@
+from apispecs.base.models.specification import Constraints, Endpoint, Method, Parameter
+from apispecs.base.exceptions import RequestValidationException
+from threading import Lock
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+import operator
+import re
+
+# Separators of the collection formats; `multi` values are repeated instead (`?id=1&id=2`).
+COLLECTION_SEPARATORS = {'csv': ',', 'ssv': ' ', 'tsv': '\t', 'pipes': '|'}
+BOOLEANS = {'true': True, 'false': False}
+# Index of the request source each parameter location reads from.
+SOURCES = {'path': 0, 'query': 1, 'header': 2, 'formData': 3, 'body': 4}
+EMPTY = {}
+
+# validate(path=None, query=None, headers=None, form=None, body=None) -> values by name
+Validator = Callable[..., Dict[str, object]]
+
+class _Invalid(Exception):
+    pass
+
+def effective_parameters(endpoint: Endpoint, method: Method) -> Tuple[Parameter, ...]:
+    """
+    Parameters of an operation; operation parameters override path-level ones with the same name and location.
+    """
+    parameters = {(parameter.name, parameter.location): parameter for parameter in endpoint.parameters}
+
+    for parameter in method.parameters:
+        parameters[(parameter.name, parameter.location)] = parameter
+
+    return tuple(parameters.values())
+
+def _boolean(value: str) -> bool:
+    return BOOLEANS[value.lower()]
+
+# Converters of raw strings by parameter type; other types (`string`, `file`) stay strings.
+CONVERTERS = {'integer': int, 'number': float, 'boolean': _boolean}
+
+def read_bound(bound, exclusive, tighter: Callable[[object, object], bool]) -> Tuple[object, bool]:
+    """
+    Reads a bound along with its exclusive keyword: a flag in Swagger 2 and OpenAPI 3.0,
+    the exclusive bound itself in OpenAPI 3.1, where both bounds may be set and the tighter one applies.
+    """
+    if exclusive is None or exclusive is True or exclusive is False:
+        return bound, bool(exclusive)
+
+    if bound is None or tighter(exclusive, bound):
+        return exclusive, True
+
+    return bound, False
+
+def compile_value(type: str, constraints: Constraints) -> Callable[[object], object]:
+    """
+    Compiles the conversion and checks of a single raw value (an array item, or the whole value
+    otherwise) into one function, with everything the checks need resolved beforehand.
+    """
+    convert = CONVERTERS.get(type)
+    # String keywords only apply to values that stay strings, numeric ones to numbers.
+    strings = convert is None
+    numbers = convert is int or convert is float
+
+    search = re.compile(constraints.pattern).search if strings and constraints.pattern is not None else None
+    min_length = constraints.min_length if strings else None
+    max_length = constraints.max_length if strings else None
+    minimum, exclusive_minimum = read_bound(constraints.minimum, constraints.exclusive_minimum, operator.ge) if numbers else (None, False)
+    maximum, exclusive_maximum = read_bound(constraints.maximum, constraints.exclusive_maximum, operator.le) if numbers else (None, False)
+    multiple_of = constraints.multiple_of if numbers else None
+    allowed = None
+
+    if constraints.enum is not None:
+        allowed = set()
+
+        for value in constraints.enum:
+            # Enum values of trusted documents are not strings necessarily.
+            value = ('true' if value else 'false') if isinstance(value, bool) else str(value)
+
+            try:
+                allowed.add(convert(value) if convert is not None else value)
+            except (ValueError, KeyError):
+                pass
+
+        allowed = frozenset(allowed)
+
+    check_strings = search is not None or min_length is not None or max_length is not None
+    check_numbers = minimum is not None or maximum is not None or bool(multiple_of)
+
+    def validate(value):
+        # Repeated values of scalar parameters: the last one wins.
+        if value.__class__ is list:
+            value = value[-1] if value else ''
+
+        if check_strings:
+            if search is not None and search(value) is None:
+                raise _Invalid(f'does not match {constraints.pattern}')
+
+            if min_length is not None and len(value) < min_length:
+                raise _Invalid(f'is shorter than {min_length}')
+
+            if max_length is not None and len(value) > max_length:
+                raise _Invalid(f'is longer than {max_length}')
+
+        if convert is not None:
+            try:
+                value = convert(value)
+            except (ValueError, KeyError):
+                raise _Invalid(f'is not a valid {type}')
+
+        if allowed is not None and value not in allowed:
+            raise _Invalid(f'is not one of {", ".join(map(str, constraints.enum))}')
+
+        if check_numbers:
+            if minimum is not None and (value <= minimum if exclusive_minimum else value < minimum):
+                raise _Invalid(f'is not greater than {minimum}' if exclusive_minimum else f'is less than {minimum}')
+
+            if maximum is not None and (value >= maximum if exclusive_maximum else value > maximum):
+                raise _Invalid(f'is not less than {maximum}' if exclusive_maximum else f'is greater than {maximum}')
+
+            if multiple_of and value % multiple_of != 0:
+                raise _Invalid(f'is not a multiple of {multiple_of}')
+
+        return value
+
+    return validate
+
+def compile_splitter(collection_format: str) -> Callable[[object], List[str]]:
+    if collection_format == 'multi':
+        return lambda value: value if type(value) is list else [value]
+
+    separator = COLLECTION_SEPARATORS.get(collection_format or 'csv', ',')
+
+    def split(value) -> List[str]:
+        if type(value) is list:
+            value = value[-1] if value else ''
+
+        return value.split(separator) if value else []
+
+    return split
+
+def compile_parameter(parameter: Parameter) -> Callable[[object], object]:
+    """
+    Compiles the conversion and checks of a parameter's raw value: a string, or a list
+    of strings for repeated values. Items of arrays are converted and checked by the type
+    and constraints of their `items`.
+    """
+    constraints = parameter.constraints or Constraints()
+
+    if parameter.location == 'body':
+        # The model does not describe bodies any further.
+        return lambda value: value
+
+    if parameter.type != 'array':
+        return compile_value(parameter.type, constraints)
+
+    validate_item = compile_value(constraints.items_type or 'string', constraints.items or Constraints())
+    split = compile_splitter(parameter.collection_format)
+    min_items, max_items, unique_items = constraints.min_items, constraints.max_items, constraints.unique_items
+
+    def validate(value):
+        items = [validate_item(item) for item in split(value)]
+
+        if min_items is not None and len(items) < min_items:
+            raise _Invalid(f'has fewer than {min_items} items')
+
+        if max_items is not None and len(items) > max_items:
+            raise _Invalid(f'has more than {max_items} items')
+
+        if unique_items and len(set(items)) != len(items):
+            raise _Invalid('has duplicate items')
+
+        return items
+
+    return validate
+
+def compile_validator(endpoint: Endpoint, method: Method) -> Validator:
+    """
+    Compiles the parameters of an operation into a function validating the parameters of a request,
+    `validate(path=None, query=None, headers=None, form=None, body=None)`. Sources map names
+    to raw strings, or lists of strings for repeated values; header names are matched case-insensitively.
+    Returns the converted values by name, or raises `RequestValidationException` listing every invalid parameter.
+    """
+    compiled = []
+    headers_used = False
+
+    for parameter in effective_parameters(endpoint, method):
+        location = parameter.location
+
+        if location not in SOURCES:
+            continue
+
+        key = parameter.name.lower() if location == 'header' else parameter.name
+        headers_used = headers_used or location == 'header'
+        # Parameters without a default hold an empty one.
+        missing = (location, parameter.required, parameter.default_value != '', parameter.default_value)
+        compiled.append((parameter.name, SOURCES[location], key, compile_parameter(parameter), missing))
+
+    compiled = tuple(compiled)
+    body_key = next((key for _, source, key, _, _ in compiled if source == SOURCES['body']), None)
+
+    def validate(path: Optional[Mapping] = None, query: Optional[Mapping] = None, headers: Optional[Mapping] = None,
+                 form: Optional[Mapping] = None, body: object = None) -> Dict[str, object]:
+        if headers and headers_used:
+            headers = {name.lower(): value for name, value in headers.items()}
+
+        sources = (path or EMPTY, query or EMPTY, headers or EMPTY, form or EMPTY, EMPTY if body is None else {body_key: body})
+        values = {}
+        errors = None
+
+        for name, source, key, convert, missing in compiled:
+            raw = sources[source].get(key)
+
+            if raw is not None:
+                try:
+                    values[name] = convert(raw)
+                    continue
+                except _Invalid as e:
+                    error = f'{missing[0]} parameter {name} {e}'
+            else:
+                location, required, has_default, default = missing
+
+                if not required:
+                    if has_default:
+                        values[name] = default
+
+                    continue
+
+                error = f'{location} parameter {name} is required'
+
+            if errors is None:
+                errors = []
+
+            errors.append(error)
+
+        if errors:
+            raise RequestValidationException(errors)
+
+        return values
+
+    return validate
+
+"""
+Validators of operations, compiled on first use and kept afterwards.
+Operations are looked up by the identity of their endpoint and method (e.g. those
+`Router.match` returns), which are kept alive with the validator so identities are
+never reused. The cache is meant to live as long as the specifications it validates.
+"""
+class RequestValidators(object):
+
+    def __init__(self):
+        self._validators: Dict[Tuple[int, int], Tuple[Endpoint, Method, Validator]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    def get(self, endpoint: Endpoint, method: Method) -> Validator:
+        key = (id(endpoint), id(method))
+        entry = self._validators.get(key)
+
+        if entry is None:
+            with self._lock:
+                entry = self._validators.get(key)
+
+                if entry is None:
+                    entry = self._validators[key] = (endpoint, method, compile_validator(endpoint, method))
+
+        return entry[2]
+
+    def validate(self, endpoint: Endpoint, method: Method, **sources) -> Dict[str, object]:
+        return self.get(endpoint, method)(**sources)
@@ -1,11 +1,23 @@
-from marshmallow import Schema
 from apispecs.base.service.schema.provider import SchemaProvider
-from apispecs.openapi3.schema.schema import OpenAPI3Schema
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from marshmallow import Schema
+    from apispecs.openapi3.schema.streaming import OpenAPI3EndpointBuilder
 
 class OpenAPI3SchemaProvider(SchemaProvider):
+    family = 'openapi'
+    major_version = '3'
+    component_keys = ('components',)
+
+    def create_schema(self, lazy: bool = False) -> 'Schema':
+        from apispecs.openapi3.schema.schema import OpenAPI3Schema
+        return OpenAPI3Schema(lazy=lazy)
 
-    def is_schema_adequate(self, fields: dict) -> bool:
-        return self.find_major_version(fields.get('openapi')) == '3'
+    def create_trusted_schema(self, lazy: bool = False) -> 'Schema':
+        from apispecs.openapi3.schema.builder import TrustedOpenAPI3Schema
+        return TrustedOpenAPI3Schema(lazy=lazy)
 
-    def get_schema(self) -> Schema:
-        return OpenAPI3Schema()
+    def create_endpoint_builder(self, trusted: bool = False) -> 'OpenAPI3EndpointBuilder':
+        from apispecs.openapi3.schema.streaming import OpenAPI3EndpointBuilder
+        return OpenAPI3EndpointBuilder(trusted)
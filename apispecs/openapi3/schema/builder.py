@@ -0,0 +1,97 @@
+from apispecs.base.models import specification
+from apispecs.base.builder import METHOD_TYPES, SpecificationBuilder, TrustedBuilder, TrustedSchema
+import re
+
+SERVER_VARIABLE = re.compile(r'\{([^{}]*)\}')
+# Styles of parameters that do not set one, by location.
+DEFAULT_STYLES = {'query': 'form', 'cookie': 'form', 'path': 'simple', 'header': 'simple'}
+# Collection formats of the array styles; exploded `form` arrays are repeated instead (`multi`).
+STYLE_COLLECTION_FORMATS = {'form': 'csv', 'simple': 'csv', 'spaceDelimited': 'ssv', 'pipeDelimited': 'pipes'}
+EMPTY = {}
+
+"""
+Builds the specification models from OpenAPI 3 data validated by `OpenAPI3Schema`.
+Parameters read their type and constraints from their schema, and request bodies
+become `body` parameters, so the models match those of the equivalent Swagger 2 document.
+"""
+class OpenAPI3Builder(SpecificationBuilder):
+    location_key = 'in_location'
+    request_body_key = 'request_body'
+    method_types = METHOD_TYPES + ('trace',)
+    external_objects_module = 'apispecs.openapi3.schema.schema'
+
+    def build_base_url(self) -> str:
+        servers = self.data.get('servers')
+
+        if not servers:
+            # Documents without servers are served from the root.
+            return '/'
+
+        variables = servers[0].get('variables') or EMPTY
+
+        def substitute(match) -> str:
+            variable = variables.get(match.group(1))
+            return match.group(0) if variable is None else str(variable['default'])
+
+        return SERVER_VARIABLE.sub(substitute, servers[0]['url'])
+
+    def build_method_parameters(self, item: dict) -> list:
+        parameters = super().build_method_parameters(item)
+
+        if self.request_body_key in item:
+            parameters.append(self.build_request_body(item[self.request_body_key]))
+
+        return parameters
+
+    def build_request_body(self, item: dict) -> specification.Parameter:
+        body = self.resolve(item, 'request_body')
+        self.parameter_references += 1
+        # Swagger 2 bodies are typed by their schema only, and so are these.
+        return self.share_parameter(('body', body.get('description', ''), 'body', body.get('required', False), '', '', '', '', None))
+
+    def parameter_values(self, item: dict) -> tuple:
+        schema = self.resolve_schema(item)
+        type = self.read_type(schema)
+
+        return (
+            item['name'],
+            item.get('description', ''),
+            item[self.location_key],
+            item.get('required', False),
+            type,
+            schema.get('format', ''),
+            schema.get('default', ''),
+            self.collection_format(item, type),
+            self.build_constraints(schema)
+        )
+
+    def resolve_schema(self, item: dict) -> dict:
+        schema = item.get('schema')
+
+        if schema is None:
+            # Parameters may describe their value with `content` instead.
+            media_type = next(iter((item.get('content') or EMPTY).values()), EMPTY)
+            schema = media_type.get('schema', EMPTY)
+
+        return self.resolve(schema, 'schema')
+
+    def collection_format(self, item: dict, type: str) -> str:
+        if type != 'array':
+            return ''
+
+        style = item.get('style') or DEFAULT_STYLES.get(item[self.location_key], 'simple')
+
+        if style == 'form' and item.get('explode', True):
+            return 'multi'
+
+        return STYLE_COLLECTION_FORMATS.get(style, '')
+
+class TrustedOpenAPI3Builder(TrustedBuilder, OpenAPI3Builder):
+    location_key = 'in'
+    request_body_key = 'requestBody'
+
+"""
+Loader with the same `load` interface as `OpenAPI3Schema` for trusted documents.
+"""
+class TrustedOpenAPI3Schema(TrustedSchema):
+    builder = TrustedOpenAPI3Builder
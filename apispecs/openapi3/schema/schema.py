@@ -1,4 +1,313 @@
-from marshmallow import Schema
+from marshmallow import Schema, fields, validate, pre_load, post_load, validates_schema, ValidationError, INCLUDE
+from apispecs.base.exceptions import ReferenceException
+from apispecs.base.fields import Number
+from apispecs.openapi3.schema.builder import OpenAPI3Builder
 
-class OpenAPI3Schema(Schema):
-    pass
+PARAMETER_LOCATIONS = ['query', 'header', 'path', 'cookie']
+PARAMETER_STYLES = ['matrix', 'label', 'form', 'simple', 'spaceDelimited', 'pipeDelimited', 'deepObject']
+SECURITY_SCHEME_TYPES = ['apiKey', 'http', 'mutualTLS', 'oauth2', 'openIdConnect']
+API_KEY_LOCATIONS = ['query', 'header', 'cookie']
+
+"""
+Base of the objects that may be extended with `x-` fields, which are dropped.
+"""
+class ExtensibleObject(Schema):
+
+    @pre_load
+    def remove_extensions(self, data, **kwargs):
+        if isinstance(data, dict) and any(key.startswith('x-') for key in data):
+            return {key: value for key, value in data.items() if not key.startswith('x-')}
+
+        return data
+
+class ReferenceObject(Schema):
+    ref = fields.Str(data_key = '$ref')
+
+    @staticmethod
+    def is_ref(data):
+        return 'ref' in data
+
+class ExternalDocumentationObject(ExtensibleObject):
+    description = fields.Str()
+    url = fields.Str(required = True)
+
+# Only the keywords that are read or hold other schemas are declared: every declared field
+# costs a lookup per object, annotations (`title`, `example`, `readOnly`...) are kept as they are.
+class SchemaObject(ReferenceObject):
+    # A list of types in OpenAPI 3.1.
+    type = fields.Raw()
+    format = fields.Str()
+    default = fields.Raw()
+    maximum = Number()
+    # Booleans in OpenAPI 3.0, numbers in 3.1.
+    exclusive_maximum = fields.Raw(data_key = 'exclusiveMaximum')
+    minimum = Number()
+    exclusive_minimum = fields.Raw(data_key = 'exclusiveMinimum')
+    max_length = Number(data_key = 'maxLength')
+    min_length = Number(data_key = 'minLength')
+    pattern = fields.Str()
+    max_items = Number(data_key = 'maxItems')
+    min_items = Number(data_key = 'minItems')
+    unique_items = fields.Boolean(data_key = 'uniqueItems')
+    enum = fields.List(fields.Raw)
+    multiple_of = Number(data_key = 'multipleOf')
+    items = fields.Nested('self')
+    properties = fields.Dict(keys = fields.Str(), values = fields.Nested('self'))
+    # A schema, or a boolean.
+    additional_properties = fields.Raw(data_key = 'additionalProperties')
+    all_of = fields.List(fields.Nested('self'), data_key = 'allOf')
+    one_of = fields.List(fields.Nested('self'), data_key = 'oneOf')
+    any_of = fields.List(fields.Nested('self'), data_key = 'anyOf')
+    not_schema = fields.Nested('self', data_key = 'not')
+
+    class Meta:
+        unknown = INCLUDE
+
+class ContactObject(ExtensibleObject):
+    name = fields.Str()
+    url = fields.Str()
+    email = fields.Str()
+
+class LicenseObject(ExtensibleObject):
+    name = fields.Str(required = True)
+    identifier = fields.Str()
+    url = fields.Str()
+
+class InfoObject(ExtensibleObject):
+    title = fields.Str(required = True)
+    summary = fields.Str()
+    description = fields.Str()
+    terms_of_service = fields.Str(data_key = 'termsOfService')
+    contact = fields.Nested(ContactObject)
+    license = fields.Nested(LicenseObject)
+    version = fields.Str(required = True)
+
+class ServerVariableObject(ExtensibleObject):
+    enum = fields.List(fields.Str)
+    default = fields.Str(required = True)
+    description = fields.Str()
+
+class ServerObject(ExtensibleObject):
+    url = fields.Str(required = True)
+    description = fields.Str()
+    variables = fields.Dict(keys = fields.Str(), values = fields.Nested(ServerVariableObject))
+
+class ExampleObject(ExtensibleObject, ReferenceObject):
+    summary = fields.Str()
+    description = fields.Str()
+    value = fields.Raw()
+    external_value = fields.Str(data_key = 'externalValue')
+
+class EncodingObject(ExtensibleObject):
+    content_type = fields.Str(data_key = 'contentType')
+    headers = fields.Dict(keys = fields.Str(), values = fields.Nested('apispecs.openapi3.schema.schema.HeaderObject'))
+    style = fields.Str(validate = validate.OneOf(PARAMETER_STYLES))
+    explode = fields.Boolean()
+    allow_reserved = fields.Boolean(data_key = 'allowReserved', default = False)
+
+class MediaTypeObject(ExtensibleObject):
+    schema = fields.Nested(SchemaObject)
+    example = fields.Raw()
+    examples = fields.Dict(keys = fields.Str(), values = fields.Nested(ExampleObject))
+    encoding = fields.Dict(keys = fields.Str(), values = fields.Nested(EncodingObject))
+
+class HeaderObject(ExtensibleObject, ReferenceObject):
+    description = fields.Str()
+    required = fields.Boolean(default = False)
+    deprecated = fields.Boolean(default = False)
+    style = fields.Str(validate = validate.OneOf(PARAMETER_STYLES))
+    explode = fields.Boolean()
+    schema = fields.Nested(SchemaObject)
+    content = fields.Dict(keys = fields.Str(), values = fields.Nested(MediaTypeObject))
+    example = fields.Raw()
+    examples = fields.Dict(keys = fields.Str(), values = fields.Nested(ExampleObject))
+
+class ParameterObject(HeaderObject):
+    name = fields.Str() # Required
+    in_location = fields.Str(data_key = 'in', validate = validate.OneOf(PARAMETER_LOCATIONS)) # Required
+    allow_empty_value = fields.Boolean(data_key = 'allowEmptyValue', default = False)
+    allow_reserved = fields.Boolean(data_key = 'allowReserved', default = False)
+
+    @validates_schema
+    def validate_ref_required(self, data, **kwargs):
+        if self.is_ref(data):
+            return
+
+        for key in ('name', 'in_location'):
+            if key not in data:
+                raise ValidationError(f'`{key}` must be set.')
+
+    @validates_schema
+    def validate_required(self, data, **kwargs):
+        if not self.is_ref(data) and data.get('in_location') == 'path' and data.get('required') is not True:
+            raise ValidationError('Required must be true if `in` is set to `path`.')
+
+    @validates_schema
+    def validate_schema(self, data, **kwargs):
+        if not self.is_ref(data) and ('schema' in data) == ('content' in data):
+            raise ValidationError('Exactly one of `schema` and `content` must be set.')
+
+class RequestBodyObject(ExtensibleObject, ReferenceObject):
+    description = fields.Str()
+    content = fields.Dict(keys = fields.Str(), values = fields.Nested(MediaTypeObject))
+    required = fields.Boolean(default = False)
+
+    @validates_schema
+    def validate_content(self, data, **kwargs):
+        if not self.is_ref(data) and 'content' not in data:
+            raise ValidationError('Content must be set.')
+
+class LinkObject(ExtensibleObject, ReferenceObject):
+    operation_ref = fields.Str(data_key = 'operationRef')
+    operation_id = fields.Str(data_key = 'operationId')
+    parameters = fields.Dict(keys = fields.Str(), values = fields.Raw())
+    request_body = fields.Raw(data_key = 'requestBody')
+    description = fields.Str()
+    server = fields.Nested(ServerObject)
+
+class ResponseObject(ExtensibleObject, ReferenceObject):
+    description = fields.Str()
+    headers = fields.Dict(keys = fields.Str(), values = fields.Nested(HeaderObject))
+    content = fields.Dict(keys = fields.Str(), values = fields.Nested(MediaTypeObject))
+    links = fields.Dict(keys = fields.Str(), values = fields.Nested(LinkObject))
+
+    @validates_schema
+    def validate_ref_required(self, data, **kwargs):
+        if not self.is_ref(data) and 'description' not in data:
+            raise ValidationError('Description must be set.')
+
+class OperationObject(ExtensibleObject):
+    tags = fields.List(fields.Str)
+    summary = fields.Str()
+    description = fields.Str()
+    external_docs = fields.Nested(ExternalDocumentationObject, data_key = 'externalDocs')
+    operation_id = fields.Str(data_key = 'operationId')
+    parameters = fields.List(fields.Nested(ParameterObject))
+    request_body = fields.Nested(RequestBodyObject, data_key = 'requestBody')
+    responses = fields.Dict(keys = fields.Str(), values = fields.Nested(ResponseObject))
+    # Path items by callback name and expression, not validated any further.
+    callbacks = fields.Dict(keys = fields.Str(), values = fields.Raw())
+    deprecated = fields.Boolean(default = False)
+    security = fields.List(fields.Dict(keys = fields.Str(), values = fields.List(fields.Str)))
+    servers = fields.List(fields.Nested(ServerObject))
+
+class PathItemObject(ExtensibleObject, ReferenceObject):
+    summary = fields.Str()
+    description = fields.Str()
+    get = fields.Nested(OperationObject)
+    put = fields.Nested(OperationObject)
+    post = fields.Nested(OperationObject)
+    delete = fields.Nested(OperationObject)
+    options = fields.Nested(OperationObject)
+    head = fields.Nested(OperationObject)
+    patch = fields.Nested(OperationObject)
+    trace = fields.Nested(OperationObject)
+    servers = fields.List(fields.Nested(ServerObject))
+    parameters = fields.List(fields.Nested(ParameterObject))
+
+class OAuthFlowObject(ExtensibleObject):
+    authorization_url = fields.Str(data_key = 'authorizationUrl')
+    token_url = fields.Str(data_key = 'tokenUrl')
+    refresh_url = fields.Str(data_key = 'refreshUrl')
+    scopes = fields.Dict(keys = fields.Str(), values = fields.Str(), required = True)
+
+class OAuthFlowsObject(ExtensibleObject):
+    implicit = fields.Nested(OAuthFlowObject)
+    password = fields.Nested(OAuthFlowObject)
+    client_credentials = fields.Nested(OAuthFlowObject, data_key = 'clientCredentials')
+    authorization_code = fields.Nested(OAuthFlowObject, data_key = 'authorizationCode')
+
+class SecuritySchemeObject(ExtensibleObject, ReferenceObject):
+    type = fields.Str(validate = validate.OneOf(SECURITY_SCHEME_TYPES))
+    description = fields.Str()
+    name = fields.Str()
+    in_location = fields.Str(data_key = 'in', validate = validate.OneOf(API_KEY_LOCATIONS))
+    scheme = fields.Str()
+    bearer_format = fields.Str(data_key = 'bearerFormat')
+    flows = fields.Nested(OAuthFlowsObject)
+    open_id_connect_url = fields.Str(data_key = 'openIdConnectUrl')
+
+    @validates_schema
+    def validate_type(self, data, **kwargs):
+        if not self.is_ref(data) and 'type' not in data:
+            raise ValidationError('Type must be set.')
+
+    @validates_schema
+    def validate_api_key(self, data, **kwargs):
+        if data.get('type') == 'apiKey' and ('name' not in data or 'in_location' not in data):
+            raise ValidationError('Name and in location must be set when using API key authentication.')
+
+    @validates_schema
+    def validate_scheme(self, data, **kwargs):
+        if data.get('type') == 'http' and 'scheme' not in data:
+            raise ValidationError('Scheme must be set when using HTTP authentication.')
+
+    @validates_schema
+    def validate_flows(self, data, **kwargs):
+        if data.get('type') == 'oauth2' and 'flows' not in data:
+            raise ValidationError('Flows must be set when using OAuth2 authentication.')
+
+    @validates_schema
+    def validate_open_id_connect_url(self, data, **kwargs):
+        if data.get('type') == 'openIdConnect' and 'open_id_connect_url' not in data:
+            raise ValidationError('OpenID Connect URL must be set when using OpenID Connect authentication.')
+
+# Fields are named after their keys, so `#/components/...` references resolve against the validated data.
+class ComponentsObject(ExtensibleObject):
+    schemas = fields.Dict(keys = fields.Str(), values = fields.Nested(SchemaObject))
+    responses = fields.Dict(keys = fields.Str(), values = fields.Nested(ResponseObject))
+    parameters = fields.Dict(keys = fields.Str(), values = fields.Nested(ParameterObject))
+    examples = fields.Dict(keys = fields.Str(), values = fields.Nested(ExampleObject))
+    requestBodies = fields.Dict(keys = fields.Str(), values = fields.Nested(RequestBodyObject))
+    headers = fields.Dict(keys = fields.Str(), values = fields.Nested(HeaderObject))
+    securitySchemes = fields.Dict(keys = fields.Str(), values = fields.Nested(SecuritySchemeObject))
+    links = fields.Dict(keys = fields.Str(), values = fields.Nested(LinkObject))
+    callbacks = fields.Dict(keys = fields.Str(), values = fields.Raw())
+    pathItems = fields.Dict(keys = fields.Str(), values = fields.Nested(PathItemObject))
+
+class TagObject(ExtensibleObject):
+    name = fields.Str(required = True)
+    description = fields.Str()
+    external_docs = fields.Nested(ExternalDocumentationObject, data_key = 'externalDocs')
+
+# Objects other documents may hold, validated when a specification refers to them.
+EXTERNAL_OBJECTS = {
+    'parameter': ParameterObject,
+    'path_item': PathItemObject,
+    'request_body': RequestBodyObject,
+    'schema': SchemaObject,
+}
+
+# https://github.com/OAI/OpenAPI-Specification/blob/main/versions/3.0.3.md#openapi-object
+class OpenAPI3Schema(ExtensibleObject):
+    openapi = fields.Str(required = True)
+    info = fields.Nested(InfoObject, required = True)
+    json_schema_dialect = fields.Str(data_key = 'jsonSchemaDialect')
+    servers = fields.List(fields.Nested(ServerObject))
+    paths = fields.Dict(keys = fields.Str(), values = fields.Nested(PathItemObject), required = True)
+    webhooks = fields.Dict(keys = fields.Str(), values = fields.Nested(PathItemObject))
+    components = fields.Nested(ComponentsObject)
+    security = fields.List(fields.Dict(keys = fields.Str(), values = fields.List(fields.Str)))
+    tags = fields.List(fields.Nested(TagObject))
+    external_docs = fields.Nested(ExternalDocumentationObject, data_key = 'externalDocs')
+
+    def __init__(self, lazy: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.lazy = lazy
+
+    @post_load
+    def make_schema(self, data, **kwargs):
+        try:
+            return OpenAPI3Builder(data).build_specification(self.lazy)
+        except ReferenceException as e:
+            raise ValidationError(str(e))
+
+"""
+Validates the top-level entries of a streamed specification without building it,
+its path items are validated and built one at a time by `OpenAPI3EndpointBuilder`.
+"""
+class OpenAPI3HeadSchema(OpenAPI3Schema):
+
+    # Not decorated, so it replaces the `post_load` hook and the validated data is returned as is.
+    def make_schema(self, data, **kwargs):
+        return data
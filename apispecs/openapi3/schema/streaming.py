@@ -0,0 +1,14 @@
+from apispecs.base.builder import SchemaEndpointBuilder
+from apispecs.openapi3.schema.builder import OpenAPI3Builder, TrustedOpenAPI3Builder
+
+"""
+Builds the endpoints of a streamed OpenAPI 3 specification one path item at a time.
+"""
+class OpenAPI3EndpointBuilder(SchemaEndpointBuilder):
+    builder = OpenAPI3Builder
+    trusted_builder = TrustedOpenAPI3Builder
+    required_keys = ('openapi', 'info', 'paths')
+
+    def create_schemas(self) -> tuple:
+        from apispecs.openapi3.schema.schema import OpenAPI3HeadSchema, PathItemObject
+        return OpenAPI3HeadSchema(), PathItemObject()
@@ -0,0 +1,51 @@
+from apispecs.base.service.schema.provider import DeferredProvider
+from typing import TYPE_CHECKING, List, Sequence
+
+if TYPE_CHECKING:
+    from apispecs.base.service.schema.service import AnyProvider
+
+# Entry point group other packages declare providers in, named `family.major_version`, e.g.
+# `asyncapi.2 = package.provider:AsyncAPI2SchemaProvider`.
+ENTRY_POINT_GROUP = 'apispecs.providers'
+
+DEFAULT_PROVIDERS = (
+    DeferredProvider('swagger', '2', 'apispecs.swagger2.provider:Swagger2SchemaProvider'),
+    DeferredProvider('openapi', '3', 'apispecs.openapi3.provider:OpenAPI3SchemaProvider'),
+)
+
+def register_default_providers():
+    """
+    Kept for compatibility, the schema service registers the default providers itself.
+    """
+    from apispecs.base.service.schema.service import SchemaService
+
+    schema_service = SchemaService()
+    for provider in DEFAULT_PROVIDERS:
+        schema_service.register_provider(provider)
+
+def register_providers(providers: Sequence['AnyProvider']):
+    """
+    Registers providers in the schema service of this process, e.g. in worker processes,
+    which do not share the schema service (and the providers registered at runtime).
+    """
+    from apispecs.base.service.schema.service import SchemaService
+
+    schema_service = SchemaService()
+    for provider in providers:
+        schema_service.register_provider(provider)
+
+def find_entry_point_providers() -> List[DeferredProvider]:
+    from importlib.metadata import entry_points
+
+    points = entry_points()
+    # `select` exists since Python 3.10, older versions return a dictionary of groups.
+    points = points.select(group=ENTRY_POINT_GROUP) if hasattr(points, 'select') else points.get(ENTRY_POINT_GROUP, ())
+    providers = []
+
+    for point in points:
+        family, _, major_version = point.name.rpartition('.')
+
+        if family and major_version:
+            providers.append(DeferredProvider(family, major_version, point.value))
+
+    return providers
@@ -1,11 +1,23 @@
-from marshmallow import Schema
 from apispecs.base.service.schema.provider import SchemaProvider
-from apispecs.swagger2.schema.schema import Swagger2Schema
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from marshmallow import Schema
+    from apispecs.swagger2.schema.streaming import Swagger2EndpointBuilder
 
 class Swagger2SchemaProvider(SchemaProvider):
+    family = 'swagger'
+    major_version = '2'
+    component_keys = ('parameters', 'definitions', 'responses')
+
+    def create_schema(self, lazy: bool = False) -> 'Schema':
+        from apispecs.swagger2.schema.schema import Swagger2Schema
+        return Swagger2Schema(lazy=lazy)
 
-    def is_schema_adequate(self, fields: dict) -> bool:
-        return self.find_major_version(fields.get('swagger')) == '2'
+    def create_trusted_schema(self, lazy: bool = False) -> 'Schema':
+        from apispecs.swagger2.schema.builder import TrustedSwagger2Schema
+        return TrustedSwagger2Schema(lazy=lazy)
 
-    def get_schema(self) -> Schema:
-        return Swagger2Schema()
+    def create_endpoint_builder(self, trusted: bool = False) -> 'Swagger2EndpointBuilder':
+        from apispecs.swagger2.schema.streaming import Swagger2EndpointBuilder
+        return Swagger2EndpointBuilder(trusted)
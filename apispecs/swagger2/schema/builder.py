@@ -0,0 +1,38 @@
+from apispecs.base.builder import SpecificationBuilder, TrustedBuilder, TrustedSchema
+from urllib.parse import urljoin
+
+"""
+Builds the specification models from Swagger 2 data validated by `Swagger2Schema`.
+"""
+class Swagger2Builder(SpecificationBuilder):
+    location_key = 'in_location'
+    collection_format_key = 'collection_format'
+    base_path_key = 'base_path'
+    external_objects_module = 'apispecs.swagger2.schema.schema'
+
+    def build_base_url(self) -> str:
+        return urljoin(self.data.get('host'), self.data.get(self.base_path_key))
+
+    def parameter_values(self, item: dict) -> tuple:
+        return (
+            item['name'],
+            item.get('description', ''),
+            item[self.location_key],
+            item.get('required', False),
+            item.get('type', ''),
+            item.get('format', ''),
+            item.get('default', ''),
+            item.get(self.collection_format_key, ''),
+            self.build_constraints(item)
+        )
+
+class TrustedSwagger2Builder(TrustedBuilder, Swagger2Builder):
+    location_key = 'in'
+    collection_format_key = 'collectionFormat'
+    base_path_key = 'basePath'
+
+"""
+Loader with the same `load` interface as `Swagger2Schema` for trusted documents.
+"""
+class TrustedSwagger2Schema(TrustedSchema):
+    builder = TrustedSwagger2Builder
@@ -1,6 +1,7 @@
 from marshmallow import Schema, fields, validate, validates, missing, post_load, validates_schema, ValidationError, INCLUDE
-from apispecs.base.models import specification
-from urllib.parse import urljoin
+from apispecs.base.exceptions import ReferenceException
+from apispecs.base.fields import Number
+from apispecs.swagger2.schema.builder import Swagger2Builder
 
 PARAMETER_LOCATIONS = ['query', 'header', 'path', 'formData', 'body']
 COLLECTION_FORMATS = ['csv', 'ssv', 'tsv', 'pipes', 'multi']
@@ -15,39 +16,23 @@ class ReferenceObject(Schema):
     @staticmethod
     def is_ref(data):
         return 'ref' in data
-    
-    @staticmethod
-    def resolve_ref(root, data):
-        ref = data['ref']
-        paths = ref.split('/\\')
-
-        if paths.pop(0) != '#':
-            raise ValidationError('References must begin from the root (#).')
-        
-        for path in paths:
-            try:
-                data = data[path]
-            except KeyError:
-                raise ValidationError(f'Invalid reference {ref} found.')
-        
-        return data
 
 class JSONBaseSchemaObject(Schema):
     format = fields.Str()
     collection_format = fields.Str(data_key = 'collectionFormat', validate = validate.OneOf(COLLECTION_FORMATS), default = 'csv')
     default = fields.Raw()
-    maximum = fields.Number()
+    maximum = Number()
     exclusive_maximum = fields.Boolean(data_key = 'exclusiveMaximum')
-    minimum = fields.Number()
+    minimum = Number()
     exclusive_minimum = fields.Boolean(data_key = 'exclusiveMinimum')
-    max_length = fields.Number(data_key = 'maxLength')
-    min_length = fields.Number(data_key = 'minLength')
+    max_length = Number(data_key = 'maxLength')
+    min_length = Number(data_key = 'minLength')
     pattern = fields.Str()
-    max_items = fields.Number(data_key = 'maxItems')
-    min_items = fields.Number(data_key = 'minItems')
+    max_items = Number(data_key = 'maxItems')
+    min_items = Number(data_key = 'minItems')
     unique_items = fields.Boolean(data_key = 'uniqueItems')
     enum = fields.List(fields.Str)
-    multiple_of = fields.Number(data_key = 'multipleOf')
+    multiple_of = Number(data_key = 'multipleOf')
 
     class Meta:
         unknown = INCLUDE
@@ -122,37 +107,19 @@ class ParameterObject(JSONSchemaObject):
 
     @validates_schema
     def validate_required(self, data, **kwargs):
-        if not self.is_ref(data) and data['in_location'] == 'path' and 'required' not in data:
+        if not self.is_ref(data) and data.get('in_location') == 'path' and 'required' not in data:
             raise ValidationError('Required must be true if `in` is set to `path`.')
     
     @validates_schema
     def validate_schema(self, data, **kwargs):
-        if not self.is_ref(data) and data['in_location'] == 'body' and 'schema' not in data:
+        if not self.is_ref(data) and data.get('in_location') == 'body' and 'schema' not in data:
             raise ValidationError('Schema must be set if `in` is set to `body`.')
 
     @validates_schema
     def validate_type(self, data, **kwargs):
-        if not self.is_ref(data) and data['in_location'] != 'body' and 'type' not in data:
+        if not self.is_ref(data) and data.get('in_location') != 'body' and 'type' not in data:
             raise ValidationError('Type must be set if `in` is not set to `body`.')
 
-    @staticmethod
-    def make_parameter(root, item):
-        if ReferenceObject.is_ref(item):
-            return ParameterObject.make_parameter(root, ReferenceObject.resolve_ref(root, item))
-        
-        parameter = specification.Parameter(
-            name=item['name'],
-            description=item.get('description', ''),
-            location=item['in_location'],
-            required=item.get('required', False),
-            type=item.get('type', ''),
-            format=item.get('format', ''),
-            default_value=item.get('default_value', ''),
-            collection_format=item.get('collection_format', '')
-        )
-
-        return parameter
-
 class HeaderObject(JSONSchemaObject):
     description = fields.Str()
 
@@ -184,19 +151,6 @@ class OperationObject(Schema):
     deprecated = fields.Boolean(default = False)
     security = fields.List(fields.Dict(keys=fields.Str(), values=fields.List(fields.Str))) 
 
-    @staticmethod
-    def make_method(root, type, item):
-        method = specification.Method(
-            method=type,
-            operation_id=item.get('operation_id', ''),
-            summary=item.get('summary', ''),
-            description=item.get('description', ''),
-            deprecated=item.get('deprecated', False),
-            parameters=[ParameterObject.make_parameter(root, parameter) for parameter in item.get('parameters', [])]
-        )
-
-        return method
-
 class PathItemObject(ReferenceObject):
     get = fields.Nested(OperationObject)
     put = fields.Nested(OperationObject)
@@ -206,21 +160,6 @@ class PathItemObject(ReferenceObject):
     head = fields.Nested(OperationObject)
     patch = fields.Nested(OperationObject)
     parameters = fields.List(fields.Nested(ParameterObject))
-    
-    @staticmethod
-    def make_endpoint(root, url, item):
-        if ReferenceObject.is_ref(item):
-            return PathItemObject.make_endpoint(root, url, ReferenceObject.resolve_ref(root, item))
-
-        types = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch')
-
-        endpoint = specification.Endpoint(
-            url=url,
-            parameters=[ParameterObject.make_parameter(root, parameter) for parameter in item.get('parameters', [])],
-            methods=[OperationObject.make_method(root, method, item[method]) for method in types if method in item]
-        )
-
-        return endpoint
 
 class SecuritySchemeObject(Schema):
     type = fields.Str(validate = validate.OneOf(SECURITY_SCHEME_TYPES), required = True)
@@ -262,6 +201,13 @@ class TagObject(Schema):
     description = fields.Str()
     external_docs = fields.Nested(ExternalDocumentationObject, data_key = 'externalDocs')
 
+# Objects other documents may hold, validated when a specification refers to them.
+EXTERNAL_OBJECTS = {
+    'parameter': ParameterObject,
+    'path_item': PathItemObject,
+    'schema': SchemaObject,
+}
+
 # https://github.com/OAI/OpenAPI-Specification/blob/main/versions/2.0.md#swagger-object
 class Swagger2Schema(Schema):
     swagger = fields.Str(required = True)
@@ -280,22 +226,23 @@ class Swagger2Schema(Schema):
     tags = fields.List(fields.Nested(TagObject))
     external_docs = fields.Nested(ExternalDocumentationObject, data_key = 'externalDocs')
 
+    def __init__(self, lazy: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.lazy = lazy
+
     @post_load
     def make_schema(self, data, **kwargs):
-        info = data['info']
-        license = info.get('license', {})
-        license_name = license.get('name', '')
-        license_url = license.get('url', '')
-        base_url = urljoin(data.get('host'), data.get('base_path'))
-
-        spec = specification.Specification(
-            title=info['title'],
-            description=info['description'],
-            license_name=license_name,
-            license_url=license_url,
-            version=info['version'],
-            base_url=base_url,
-            endpoints=[PathItemObject.make_endpoint(data, url, endpoint) for url, endpoint in data['paths'].items()]
-        )
-
-        return spec
+        try:
+            return Swagger2Builder(data).build_specification(self.lazy)
+        except ReferenceException as e:
+            raise ValidationError(str(e))
+
+"""
+Validates the top-level entries of a streamed specification without building it,
+its path items are validated and built one at a time by `Swagger2EndpointBuilder`.
+"""
+class Swagger2HeadSchema(Swagger2Schema):
+
+    # Not decorated, so it replaces the `post_load` hook and the validated data is returned as is.
+    def make_schema(self, data, **kwargs):
+        return data
@@ -0,0 +1,14 @@
+from apispecs.base.builder import SchemaEndpointBuilder
+from apispecs.swagger2.schema.builder import Swagger2Builder, TrustedSwagger2Builder
+
+"""
+Builds the endpoints of a streamed Swagger 2 specification one path item at a time.
+"""
+class Swagger2EndpointBuilder(SchemaEndpointBuilder):
+    builder = Swagger2Builder
+    trusted_builder = TrustedSwagger2Builder
+    required_keys = ('swagger', 'info', 'paths')
+
+    def create_schemas(self) -> tuple:
+        from apispecs.swagger2.schema.schema import Swagger2HeadSchema, PathItemObject
+        return Swagger2HeadSchema(), PathItemObject()
@@ -0,0 +1,89 @@
+from apispecs.base.export import ColumnarFile, export_specifications
+from apispecs.swagger2.schema.builder import TrustedSwagger2Builder
+from benchmarks.generator import SpecificationGenerator
+from collections import Counter
+from tempfile import TemporaryDirectory
+import argparse
+import pickle
+import time
+import os
+
+"""
+Aggregates a catalog of generated specifications (operations per method, deprecated
+operations, parameters per location) by walking the built models, by unpickling and
+walking them like a persisted catalog would be, and from a columnar export mapped back
+from disk, and reports the time each takes and the size of the files.
+"""
+
+def aggregate_models(specifications: list) -> dict:
+    methods = Counter()
+    locations = Counter()
+    deprecated = 0
+
+    for specification in specifications:
+        for endpoint in specification.endpoints:
+            for parameter in endpoint.parameters:
+                locations[parameter.location] += 1
+
+            for method in endpoint.methods:
+                methods[method.method] += 1
+                deprecated += method.deprecated
+
+                for parameter in method.parameters:
+                    locations[parameter.location] += 1
+
+    return {'methods': dict(methods), 'locations': dict(locations), 'deprecated': deprecated}
+
+def aggregate_columns(path: str) -> dict:
+    with ColumnarFile(path) as columns:
+        operations, parameters = columns['operations'], columns['parameters']
+        # Counting runs over the integer ids, only the distinct values are decoded.
+        methods = {columns.string(id): count for id, count in Counter(operations['method']).items()}
+        locations = {columns.string(id): count for id, count in Counter(parameters['location']).items()}
+        return {'methods': methods, 'locations': locations, 'deprecated': sum(operations['deprecated'])}
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks aggregating specifications from a columnar export.')
+    parser.add_argument('--specifications', type=int, default=200)
+    parser.add_argument('--paths', type=int, default=200)
+    parser.add_argument('--operations-per-path', type=int, default=3)
+    arguments = parser.parse_args()
+
+    specifications = [
+        TrustedSwagger2Builder(SpecificationGenerator(paths=arguments.paths, operations_per_path=arguments.operations_per_path, seed=seed).swagger2()).build_specification()
+        for seed in range(arguments.specifications)
+    ]
+
+    with TemporaryDirectory() as directory:
+        pickled = os.path.join(directory, 'catalog.pickle')
+        exported = os.path.join(directory, 'catalog.columns')
+
+        with open(pickled, 'wb') as f:
+            pickle.dump(specifications, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        _, seconds = timed(export_specifications, specifications, exported)
+        print(f'Exported {arguments.specifications} specifications in {seconds:.3f}s')
+        print(f'Sizes: pickle {os.path.getsize(pickled) / 2 ** 20:.2f} MiB, columns {os.path.getsize(exported) / 2 ** 20:.2f} MiB')
+
+        def load_and_aggregate():
+            with open(pickled, 'rb') as f:
+                return aggregate_models(pickle.load(f))
+
+        expected, seconds = timed(aggregate_models, specifications)
+        print(f'Walking built models: {seconds * 1000:.1f} ms')
+
+        result, seconds = timed(load_and_aggregate)
+        assert result == expected
+        print(f'Unpickling and walking models: {seconds * 1000:.1f} ms')
+
+        result, seconds = timed(aggregate_columns, exported)
+        assert result == expected
+        print(f'Mapping and aggregating columns: {seconds * 1000:.1f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+from apispecs.swagger2.schema.builder import TrustedSwagger2Builder
+from benchmarks.generator import SpecificationGenerator
+import argparse
+import tracemalloc
+import time
+import gc
+
+"""
+Builds generated Swagger 2 specifications with and without sharing identical parameters,
+and reports the build time, the memory the built specification retains, and how many
+parameters were referenced compared to how many distinct ones were built.
+"""
+
+class UnsharedBuilder(TrustedSwagger2Builder):
+    share_parameters = False
+
+def measure(builder_type: type, document: dict, repeat: int) -> dict:
+    timings = []
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        builder_type(document).build_specification()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        builder = builder_type(document)
+        specification = builder.build_specification()
+        # The builder and its indexes are dropped, only the specification stays alive.
+        references, unique = builder.parameter_references, builder.unique_parameters
+        del builder
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del specification
+    return {'seconds': min(timings), 'retained': retained, 'references': references, 'unique': unique}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks sharing identical parameters between endpoints.')
+    parser.add_argument('--paths', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--operations-per-path', type=int, default=4)
+    parser.add_argument('--shared-parameters', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    arguments = parser.parse_args()
+
+    for paths in arguments.paths:
+        document = SpecificationGenerator(paths=paths, operations_per_path=arguments.operations_per_path, shared_parameters=arguments.shared_parameters).swagger2()
+
+        for name, builder_type in (('unshared', UnsharedBuilder), ('shared', TrustedSwagger2Builder)):
+            result = measure(builder_type, document, arguments.repeat)
+            print(
+                f"{paths:>7} paths {name:>8} {result['seconds'] * 1000:9.2f} ms {result['retained'] / 2 ** 20:8.2f} MiB retained "
+                f"{result['references']:>8} parameters referenced {result['unique']:>8} built"
+            )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+import random
+
+METHODS = ('get', 'post', 'put', 'delete', 'patch', 'options', 'head')
+TYPES = (('integer', 'int32'), ('integer', 'int64'), ('string', None), ('boolean', None), ('number', 'double'))
+
+"""
+Deterministic generator of synthetic Swagger 2 and OpenAPI 3 specifications.
+The same parameters and seed always produce the same document.
+"""
+class SpecificationGenerator(object):
+
+    def __init__(self, paths: int = 1000, operations_per_path: int = 2, shared_parameters: int = 20, definitions: int = 50, definition_depth: int = 3, seed: int = 0):
+        self.paths = paths
+        self.operations_per_path = min(operations_per_path, len(METHODS))
+        self.shared_parameters = shared_parameters
+        self.definitions = definitions
+        self.definition_depth = definition_depth
+        self.seed = seed
+
+    def swagger2(self) -> dict:
+        generator = random.Random(self.seed)
+
+        return {
+            'swagger': '2.0',
+            'info': self._info(),
+            'host': 'api.example.com',
+            'basePath': '/v1',
+            'schemes': ['https'],
+            'consumes': ['application/json'],
+            'produces': ['application/json'],
+            'paths': {url: self._swagger2_path_item(generator, index, url) for index, url in self._urls(generator)},
+            'parameters': {f'Shared{index}': self._swagger2_parameter(generator, f'shared{index}', 'query') for index in range(self.shared_parameters)},
+            'definitions': self._definitions(generator, '#/definitions'),
+            'responses': {'NotFound': {'description': 'Not found.'}},
+        }
+
+    def openapi3(self) -> dict:
+        generator = random.Random(self.seed)
+
+        return {
+            'openapi': '3.0.3',
+            'info': self._info(),
+            'servers': [{'url': 'https://api.example.com/v1'}],
+            'paths': {url: self._openapi3_path_item(generator, index, url) for index, url in self._urls(generator)},
+            'components': {
+                'parameters': {f'Shared{index}': self._openapi3_parameter(generator, f'shared{index}', 'query') for index in range(self.shared_parameters)},
+                'schemas': self._definitions(generator, '#/components/schemas'),
+                'responses': {'NotFound': {'description': 'Not found.'}},
+            },
+        }
+
+    def _info(self) -> dict:
+        return {
+            'title': f'Synthetic API ({self.paths} paths)',
+            'description': 'Generated for benchmarking.',
+            'license': {'name': 'MIT', 'url': 'https://opensource.org/licenses/MIT'},
+            'version': '1.0.0',
+        }
+
+    def _urls(self, generator: random.Random):
+        for index in range(self.paths):
+            resource = f'resource{index % 97}'
+
+            if index % 3 == 0:
+                yield index, f'/{resource}/items{index}'
+            elif index % 3 == 1:
+                yield index, f'/{resource}/{{id}}/items{index}'
+            else:
+                yield index, f'/{resource}/{{id}}/items{index}/{{itemId}}'
+
+    def _definitions(self, generator: random.Random, prefix: str) -> dict:
+        definitions = {}
+
+        for index in range(self.definitions):
+            for depth in range(self.definition_depth):
+                properties = {
+                    'id': {'type': 'integer', 'format': 'int64'},
+                    'name': {'type': 'string', 'maxLength': generator.randint(8, 256)},
+                    'tags': {'type': 'array', 'items': {'type': 'string'}},
+                }
+
+                if depth + 1 < self.definition_depth:
+                    properties['child'] = {'$ref': f'{prefix}/Model{index}Level{depth + 1}'}
+
+                definitions[f'Model{index}Level{depth}'] = {'type': 'object', 'required': ['id'], 'properties': properties}
+
+        return definitions
+
+    def _shared_refs(self, generator: random.Random, prefix: str) -> list:
+        count = min(self.shared_parameters, generator.randint(0, 3))
+        return [{'$ref': f'{prefix}/Shared{index}'} for index in generator.sample(range(self.shared_parameters), count)]
+
+    def _path_names(self, url: str) -> list:
+        return [segment[1:-1] for segment in url.split('/') if segment.startswith('{')]
+
+    def _operation(self, generator: random.Random, index: int, method: str) -> dict:
+        return {
+            'operationId': f'{method}Operation{index}',
+            'summary': f'{method.upper()} operation {index}',
+            'description': 'Synthetic operation.',
+            'tags': [f'tag{index % 13}'],
+        }
+
+    def _swagger2_parameter(self, generator: random.Random, name: str, location: str) -> dict:
+        type, format = generator.choice(TYPES)
+        parameter = {'name': name, 'in': location, 'type': type, 'description': f'The {name} parameter.'}
+
+        if format is not None:
+            parameter['format'] = format
+
+        if location == 'path':
+            parameter['required'] = True
+
+        return parameter
+
+    def _swagger2_path_item(self, generator: random.Random, index: int, url: str) -> dict:
+        item = {'parameters': [self._swagger2_parameter(generator, name, 'path') for name in self._path_names(url)]}
+        model = f'#/definitions/Model{generator.randrange(max(self.definitions, 1))}Level0'
+
+        for method in METHODS[:self.operations_per_path]:
+            operation = self._operation(generator, index, method)
+            operation['parameters'] = [self._swagger2_parameter(generator, 'filter', 'query')] + self._shared_refs(generator, '#/parameters')
+            operation['responses'] = {'200': {'description': 'OK.', 'schema': {'$ref': model}}, '404': {'$ref': '#/responses/NotFound'}}
+            item[method] = operation
+
+        return item
+
+    def _openapi3_parameter(self, generator: random.Random, name: str, location: str) -> dict:
+        type, format = generator.choice(TYPES)
+        schema = {'type': type}
+
+        if format is not None:
+            schema['format'] = format
+
+        parameter = {'name': name, 'in': location, 'description': f'The {name} parameter.', 'schema': schema}
+
+        if location == 'path':
+            parameter['required'] = True
+
+        return parameter
+
+    def _openapi3_path_item(self, generator: random.Random, index: int, url: str) -> dict:
+        item = {'parameters': [self._openapi3_parameter(generator, name, 'path') for name in self._path_names(url)]}
+        model = f'#/components/schemas/Model{generator.randrange(max(self.definitions, 1))}Level0'
+
+        for method in METHODS[:self.operations_per_path]:
+            operation = self._operation(generator, index, method)
+            operation['parameters'] = [self._openapi3_parameter(generator, 'filter', 'query')] + self._shared_refs(generator, '#/components/parameters')
+            operation['responses'] = {
+                '200': {'description': 'OK.', 'content': {'application/json': {'schema': {'$ref': model}}}},
+                '404': {'$ref': '#/components/responses/NotFound'},
+            }
+            item[method] = operation
+
+        return item
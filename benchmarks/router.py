@@ -0,0 +1,65 @@
+from apispecs.base.models.specification import Specification, Endpoint, Method
+from apispecs.base.router import Router
+import argparse
+import random
+import re
+import time
+
+def generate_specification(routes: int, seed: int = 0) -> Specification:
+    generator = random.Random(seed)
+    endpoints = []
+
+    for index in range(routes):
+        resource = f'resource{index // 10}'
+
+        if index % 3 == 0:
+            url = f'/api/{resource}/items{index}'
+        elif index % 3 == 1:
+            url = f'/api/{resource}/{{id}}/items{index}'
+        else:
+            url = f'/api/{resource}/{{id}}/items{index}/{{itemId}}'
+
+        method = Method(generator.choice(('get', 'post', 'put')), f'op{index}', '', '', False, [])
+        endpoints.append(Endpoint(url, [], [method]))
+
+    return Specification('Benchmark', '', '', '', '1', '', endpoints)
+
+def make_request(endpoint: Endpoint, generator: random.Random) -> tuple:
+    path = re.sub(r'\{[^}]+\}', lambda _: str(generator.randrange(10 ** 6)), endpoint.url)
+    return endpoint.methods[0].method.upper(), path
+
+def linear_match(compiled: list, method: str, path: str):
+    for pattern, endpoint in compiled:
+        if pattern.match(path):
+            return endpoint
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the throughput of the path-template router.')
+    parser.add_argument('--routes', type=int, default=10000)
+    parser.add_argument('--requests', type=int, default=100000)
+    parser.add_argument('--linear-requests', type=int, default=500)
+    arguments = parser.parse_args()
+
+    generator = random.Random(1)
+    specification = generate_specification(arguments.routes)
+    requests = [make_request(generator.choice(specification.endpoints), generator) for _ in range(arguments.requests)]
+
+    start = time.perf_counter()
+    router = Router(specification)
+    print(f'Compiled {arguments.routes} routes in {time.perf_counter() - start:.3f}s')
+
+    start = time.perf_counter()
+    for method, path in requests:
+        router.match(method, path)
+    elapsed = time.perf_counter() - start
+    print(f'Router: {len(requests) / elapsed:,.0f} matches/s')
+
+    compiled = [(re.compile('^' + re.sub(r'\\\{[^}]+\\\}', '[^/]+', re.escape(endpoint.url)) + '$'), endpoint) for endpoint in specification.endpoints]
+    start = time.perf_counter()
+    for method, path in requests[:arguments.linear_requests]:
+        linear_match(compiled, method, path)
+    elapsed = time.perf_counter() - start
+    print(f'Linear regex scan: {arguments.linear_requests / elapsed:,.0f} matches/s')
+
+if __name__ == '__main__':
+    main()
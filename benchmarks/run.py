@@ -0,0 +1,173 @@
+from apispecs.providers import register_default_providers
+from apispecs.base.service.schema.service import SchemaService
+from apispecs.base.service.schema.provider import bind_nested_schemas
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from apispecs.swagger2.schema.schema import Swagger2HeadSchema
+from apispecs.swagger2.schema.builder import Swagger2Builder
+from apispecs.openapi3.schema.schema import OpenAPI3HeadSchema
+from apispecs.openapi3.schema.builder import OpenAPI3Builder
+from benchmarks.generator import SpecificationGenerator
+from marshmallow import ValidationError
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+import apispecs
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import json
+import time
+import gc
+
+"""
+Times each stage of the loading pipeline on generated specifications:
+raw deserialization, provider selection, marshmallow validation and the model build,
+plus the trusted loader, and reports throughput and peak memory per stage.
+"""
+
+# Schemas validating a whole document without building it, and the builders of their output,
+# so validation and the build are timed on their own through public interfaces only.
+VALIDATED_BUILDS = {
+    'swagger2': (Swagger2HeadSchema, Swagger2Builder),
+    'openapi3': (OpenAPI3HeadSchema, OpenAPI3Builder),
+}
+
+def measure(function: Callable, repeat: int) -> dict:
+    timings = []
+    result = None
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'seconds': min(timings), 'peak_bytes': peak, 'result': result}
+
+def run_family(family: str, document: dict, repeat: int) -> List[dict]:
+    data = json.dumps(document).encode('utf-8')
+    size = len(data)
+    paths = len(document['paths'])
+    schema_service = SchemaService()
+    results = []
+
+    def record(stage: str, measurement: dict, error: Optional[str] = None):
+        seconds = measurement['seconds'] if measurement else None
+        results.append({
+            'family': family,
+            'stage': stage,
+            'paths': paths,
+            'bytes': size,
+            'seconds': seconds,
+            'paths_per_second': paths / seconds if seconds else None,
+            'megabytes_per_second': size / seconds / 2 ** 20 if seconds else None,
+            'peak_bytes': measurement['peak_bytes'] if measurement else None,
+            'error': error,
+        })
+
+    deserialize = measure(lambda: JSONDeserializeService().deserialize_buffer_to_dict(data), repeat)
+    record('deserialize', deserialize)
+    fields = deserialize['result']
+
+    # The first lookup imports the provider and creates its schemas, which is not what this stage times.
+    schema_service.find_schema(fields)
+    record('find_schema', measure(lambda: schema_service.find_schema(fields), repeat))
+
+    schema_type, builder_type = VALIDATED_BUILDS[family]
+    schema = schema_type()
+    bind_nested_schemas(schema)
+
+    try:
+        validation = measure(lambda: schema.load(fields), repeat)
+    except ValidationError as e:
+        record('validate', None, f'{len(e.messages)} invalid fields')
+        record('build', None, 'skipped, the document does not validate')
+    else:
+        record('validate', validation)
+        validated = validation['result']
+        record('build', measure(lambda: builder_type(validated).build_specification(), repeat))
+
+    trusted = schema_service.find_schema(fields, trusted=True)
+    try:
+        record('trusted_load', measure(lambda: trusted.load(fields), repeat))
+    except Exception as e:
+        record('trusted_load', None, f'{type(e).__name__}: {str(e)[:80]}')
+
+    return results
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: List[dict], baseline_path: str):
+    with open(baseline_path) as f:
+        baseline = {(result['family'], result['stage'], result['paths']): result for result in json.load(f)['results']}
+
+    print(f'\nCompared to {baseline_path} (ratio < 1 is faster):')
+
+    for result in results:
+        previous = baseline.get((result['family'], result['stage'], result['paths']))
+
+        if previous and previous['seconds'] and result['seconds'] is not None:
+            print(f"  {result['family']:>8} {result['stage']:>12} {result['paths']:>7} paths: {result['seconds'] / previous['seconds']:.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks the specification loading pipeline.')
+    parser.add_argument('--paths', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--operations-per-path', type=int, default=2)
+    parser.add_argument('--shared-parameters', type=int, default=20)
+    parser.add_argument('--definitions', type=int, default=50)
+    parser.add_argument('--definition-depth', type=int, default=3)
+    parser.add_argument('--families', nargs='+', default=['swagger2', 'openapi3'], choices=['swagger2', 'openapi3'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Writes the results as JSON to this file.')
+    parser.add_argument('--compare', help='Compares the results with a previously written JSON file.')
+    arguments = parser.parse_args()
+
+    register_default_providers()
+    results = []
+
+    for paths in arguments.paths:
+        generator = SpecificationGenerator(
+            paths=paths,
+            operations_per_path=arguments.operations_per_path,
+            shared_parameters=arguments.shared_parameters,
+            definitions=arguments.definitions,
+            definition_depth=arguments.definition_depth,
+            seed=arguments.seed
+        )
+
+        for family in arguments.families:
+            for result in run_family(family, getattr(generator, family)(), arguments.repeat):
+                results.append(result)
+                seconds = f"{result['seconds'] * 1000:10.2f} ms" if result['seconds'] is not None else ' ' * 13
+                peak = f"{result['peak_bytes'] / 2 ** 20:8.2f} MiB" if result['peak_bytes'] is not None else ''
+                print(f"{family:>8} {result['stage']:>12} {paths:>7} paths {seconds} {peak} {result['error'] or ''}")
+
+    if arguments.output:
+        with open(arguments.output, 'w') as f:
+            json.dump({
+                'revision': git_revision(),
+                'version': apispecs.__version__,
+                'python': platform.python_version(),
+                'created': datetime.now(timezone.utc).isoformat(),
+                'parameters': {key: value for key, value in vars(arguments).items() if key not in ('output', 'compare')},
+                'results': results,
+            }, f, indent=2)
+
+    if arguments.compare:
+        compare(results, arguments.compare)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+from apispecs.base.service.deserialization.formats import find_deserialize_service
+from benchmarks.generator import SpecificationGenerator
+from tempfile import TemporaryDirectory
+import argparse
+import tracemalloc
+import time
+import json
+import yaml
+import gc
+import os
+
+"""
+Reads generated Swagger 2 specifications from files, once loading the whole specification
+and once streaming its endpoints (each endpoint is dropped right away, like a consumer
+handing them on would), and reports the time taken and the peak of memory allocated.
+"""
+
+def measure(function) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        count = function()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'seconds': seconds, 'peak': peak, 'endpoints': count}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks streaming endpoints against loading whole specifications.')
+    parser.add_argument('--paths', type=int, nargs='+', default=[1000, 5000])
+    parser.add_argument('--formats', nargs='+', default=['.json', '.yaml'])
+    parser.add_argument('--trusted', action='store_true')
+    arguments = parser.parse_args()
+
+    with TemporaryDirectory() as directory:
+        for paths in arguments.paths:
+            document = SpecificationGenerator(paths=paths).swagger2()
+
+            for format in arguments.formats:
+                path = os.path.join(directory, f'{paths}{format}')
+
+                with open(path, 'w') as f:
+                    if format == '.json':
+                        json.dump(document, f)
+                    else:
+                        yaml.safe_dump(document, f, sort_keys=False)
+
+                service = find_deserialize_service(format)
+                size = os.path.getsize(path)
+                modes = (
+                    ('load', lambda: len(service.deserialize_path_to_specification(path, arguments.trusted).endpoints)),
+                    ('stream', lambda: sum(1 for _ in service.stream_path_endpoints(path, arguments.trusted))),
+                )
+
+                for name, function in modes:
+                    result = measure(function)
+                    print(
+                        f"{paths:>7} paths {format:>5} {size / 2 ** 20:7.2f} MiB {name:>6} {result['seconds'] * 1000:10.2f} ms "
+                        f"{result['peak'] / 2 ** 20:8.2f} MiB peak {result['endpoints']:>7} endpoints"
+                    )
+
+if __name__ == '__main__':
+    main()
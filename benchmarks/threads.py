@@ -0,0 +1,60 @@
+from apispecs.providers import register_default_providers
+from apispecs.base.service.schema.service import SchemaService
+from benchmarks.generator import SpecificationGenerator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import argparse
+import os
+import sys
+import time
+
+"""
+Loads the same specification from many threads at once, with one shared prebuilt schema
+per provider and, for comparison, with a new schema per load like providers used to return.
+Every load result is compared with a reference load, so sharing schemas can not silently
+produce different specifications.
+"""
+
+def run(load: Callable[[], object], expected: object, threads: int, loads: int) -> float:
+    def work(_):
+        if load() != expected:
+            raise AssertionError('A concurrent load produced a different specification.')
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        for _ in executor.map(work, range(loads)):
+            pass
+
+    return loads / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description='Stress-tests concurrent schema loads.')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--loads', type=int, default=200)
+    # Small documents by default: that is where building schemas on every load costs the most.
+    parser.add_argument('--paths', type=int, default=5)
+    parser.add_argument('--shared-parameters', type=int, default=2)
+    parser.add_argument('--definitions', type=int, default=2)
+    parser.add_argument('--definition-depth', type=int, default=1)
+    arguments = parser.parse_args()
+
+    register_default_providers()
+    document = SpecificationGenerator(
+        paths=arguments.paths,
+        shared_parameters=arguments.shared_parameters,
+        definitions=arguments.definitions,
+        definition_depth=arguments.definition_depth
+    ).swagger2()
+    provider = SchemaService().find_fields_provider(document)
+    expected = provider.create_schema().load(document)
+
+    # Schemas cost the same for every document, so the speedup shrinks as documents grow.
+    print(f'{arguments.paths} paths, {arguments.loads} loads per run, Python {sys.version.split()[0]}, {os.cpu_count()} CPUs')
+
+    for threads in arguments.threads:
+        fresh = run(lambda: provider.create_schema().load(document), expected, threads, arguments.loads)
+        shared = run(lambda: provider.get_schema().load(document), expected, threads, arguments.loads)
+        print(f'{threads:>4} threads {fresh:10.1f} loads/s fresh schemas {shared:10.1f} loads/s shared schemas {shared / fresh:6.2f}x')
+
+if __name__ == '__main__':
+    main()
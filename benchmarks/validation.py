@@ -0,0 +1,149 @@
+from apispecs.base.models.specification import Specification, Endpoint, Method, Parameter, Constraints
+from apispecs.base.validation import RequestValidators, effective_parameters, COLLECTION_SEPARATORS, BOOLEANS
+from apispecs.base.exceptions import RequestValidationException
+import argparse
+import random
+import time
+import re
+
+"""
+Validates generated requests against the operations of a generated specification, once
+interpreting the parameter models on every request and once with validators compiled
+per operation, and reports the requests validated per second.
+"""
+
+def generate_specification(endpoints: int, seed: int = 0) -> Specification:
+    generator = random.Random(seed)
+    built = []
+
+    for index in range(endpoints):
+        path = [Parameter('id', '', 'path', True, 'integer', 'int64', '', '', Constraints(minimum=1))]
+        parameters = [
+            Parameter('limit', '', 'query', False, 'integer', 'int32', 20, '', Constraints(minimum=1, maximum=100)),
+            Parameter('sort', '', 'query', False, 'string', '', '', '', Constraints(enum=('name', 'created', 'updated'))),
+            Parameter('name', '', 'query', False, 'string', '', '', '', Constraints(pattern=r'^[a-z0-9-]+$', max_length=64)),
+            Parameter('tags', '', 'query', False, 'array', '', '', generator.choice(('csv', 'pipes', 'multi')), Constraints(max_items=5)),
+            Parameter('X-Request-Id', '', 'header', True, 'string', '', '', '', Constraints(min_length=8)),
+            Parameter('verbose', '', 'query', False, 'boolean', '', False, '', None),
+        ]
+        built.append(Endpoint(f'/resource{index}/{{id}}', path, [Method('get', f'get{index}', '', '', False, parameters)]))
+
+    return Specification('Benchmark', '', '', '', '1', '', built)
+
+def generate_request(endpoint: Endpoint, generator: random.Random) -> dict:
+    tags = [f'tag{generator.randrange(100)}' for _ in range(generator.randint(0, 4))]
+    collection_format = next(parameter for parameter in endpoint.methods[0].parameters if parameter.name == 'tags').collection_format
+
+    return {
+        'path': {'id': str(generator.randrange(1, 10 ** 6))},
+        'query': {
+            'limit': str(generator.randint(1, 100)),
+            'sort': generator.choice(('name', 'created', 'updated')),
+            'name': f'item-{generator.randrange(1000)}',
+            'tags': tags if collection_format == 'multi' else COLLECTION_SEPARATORS.get(collection_format, ',').join(tags),
+            'verbose': generator.choice(('true', 'false')),
+        },
+        'headers': {'X-Request-Id': f'{generator.getrandbits(64):016x}'},
+    }
+
+def interpret(endpoint: Endpoint, method: Method, path=None, query=None, headers=None) -> dict:
+    """
+    Validates a request by walking the parameter models, like validators did before they were compiled.
+    """
+    sources = {'path': path or {}, 'query': query or {}, 'header': {name.lower(): value for name, value in (headers or {}).items()}}
+    values = {}
+    errors = []
+
+    for parameter in effective_parameters(endpoint, method):
+        source = sources.get(parameter.location, {})
+        raw = source.get(parameter.name.lower() if parameter.location == 'header' else parameter.name)
+
+        if raw is None:
+            if parameter.required:
+                errors.append(f'{parameter.location} parameter {parameter.name} is required')
+            continue
+
+        constraints = parameter.constraints or Constraints()
+        items = None
+
+        if parameter.type == 'array':
+            items = raw if parameter.collection_format == 'multi' else raw.split(COLLECTION_SEPARATORS.get(parameter.collection_format or 'csv'))
+            value = items
+        elif parameter.type == 'integer':
+            value = int(raw)
+        elif parameter.type == 'number':
+            value = float(raw)
+        elif parameter.type == 'boolean':
+            value = BOOLEANS[raw.lower()]
+        else:
+            value = raw
+
+        if constraints.enum is not None and value not in [str(item) for item in constraints.enum]:
+            errors.append(f'{parameter.name} is not allowed')
+        if constraints.pattern is not None and re.search(constraints.pattern, value) is None:
+            errors.append(f'{parameter.name} does not match')
+        if constraints.min_length is not None and len(value) < constraints.min_length:
+            errors.append(f'{parameter.name} is too short')
+        if constraints.max_length is not None and len(value) > constraints.max_length:
+            errors.append(f'{parameter.name} is too long')
+        if constraints.minimum is not None and value < constraints.minimum:
+            errors.append(f'{parameter.name} is too small')
+        if constraints.maximum is not None and value > constraints.maximum:
+            errors.append(f'{parameter.name} is too large')
+        if items is not None and constraints.max_items is not None and len(items) > constraints.max_items:
+            errors.append(f'{parameter.name} has too many items')
+
+        values[parameter.name] = value
+
+    if errors:
+        raise RequestValidationException(errors)
+
+    return values
+
+def measure(validators: dict, requests: list, repeat: int) -> dict:
+    """
+    Times every validator on the same requests, alternating between them on every
+    repetition so that they are equally affected by the noise of the machine.
+    """
+    timings = {name: [] for name in validators}
+
+    for _ in range(repeat):
+        for name, validate in validators.items():
+            start = time.perf_counter()
+            for endpoint, method, request in requests:
+                validate(endpoint, method, request)
+            timings[name].append(time.perf_counter() - start)
+
+    return {name: len(requests) / min(values) for name, values in timings.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the throughput of request validation.')
+    parser.add_argument('--endpoints', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    arguments = parser.parse_args()
+
+    generator = random.Random(1)
+    specification = generate_specification(arguments.endpoints)
+    requests = []
+
+    for _ in range(arguments.requests):
+        endpoint = generator.choice(specification.endpoints)
+        requests.append((endpoint, endpoint.methods[0], generate_request(endpoint, generator)))
+
+    validators = RequestValidators()
+    start = time.perf_counter()
+    for endpoint in specification.endpoints:
+        validators.get(endpoint, endpoint.methods[0])
+    print(f'Compiled {len(validators)} operations in {time.perf_counter() - start:.3f}s')
+
+    results = measure({
+        'Interpreted': lambda endpoint, method, request: interpret(endpoint, method, **request),
+        'Compiled': lambda endpoint, method, request: validators.get(endpoint, method)(**request),
+    }, requests, arguments.repeat)
+
+    for name, rate in results.items():
+        print(f"{name}: {rate:,.0f} requests/s ({rate / results['Interpreted']:.2f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+# Marks the repository root for pytest, so `apispecs` and `benchmarks` import from the checkout.
@@ -0,0 +1,84 @@
+from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.deserialization.asynchronous import AsyncDeserializeService
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+import asyncio
+import json
+import os
+import time
+import pytest
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+DOCUMENT = json.dumps({
+    'swagger': '2.0',
+    'info': {'title': 'Async', 'version': '1.0.0'},
+    'paths': {'/pets': {'get': {'operationId': 'listPets', 'responses': {}}}},
+}).encode()
+
+async def chunks(data: bytes, delay: float = 0):
+    for start in range(0, len(data), 16):
+        await asyncio.sleep(delay)
+        yield data[start:start + 16]
+
+"""
+Thread pool recording how many tasks run at once, each one held for `delay` seconds.
+"""
+class CountingExecutor(ThreadPoolExecutor):
+
+    def __init__(self, delay: float):
+        super().__init__(8)
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self._lock = Lock()
+
+    def submit(self, function, *args, **kwargs):
+        def run():
+            with self._lock:
+                self.running += 1
+                self.peak = max(self.peak, self.running)
+
+            try:
+                time.sleep(self.delay)
+                return function(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        return super().submit(run)
+
+def test_stream_and_path():
+    async def main():
+        service = AsyncDeserializeService()
+        return await service.deserialize_to_specification(chunks(DOCUMENT)), await service.deserialize_path_to_specification(os.path.join(DATA, 'swagger2.json'))
+
+    from_stream, from_path = asyncio.run(main())
+
+    assert from_stream.endpoints[0].url == '/pets'
+    assert from_path == JSONDeserializeService().deserialize_path_to_specification(os.path.join(DATA, 'swagger2.json'))
+
+def test_timeout_covers_reading_the_stream():
+    async def main():
+        service = AsyncDeserializeService(timeout=0.05)
+        await service.deserialize_to_specification(chunks(DOCUMENT, delay=1))
+
+    with pytest.raises(DeserializationException, match='timed out after 0.05 seconds'):
+        asyncio.run(main())
+
+@pytest.mark.parametrize('limit', [1, 2])
+def test_concurrency_limit(limit):
+    with CountingExecutor(delay=0.05) as executor:
+        async def main():
+            service = AsyncDeserializeService(executor, max_concurrency=limit)
+            return await asyncio.gather(*(service.deserialize_to_specification(chunks(DOCUMENT)) for _ in range(6)))
+
+        results = asyncio.run(main())
+
+    assert len(results) == 6
+    assert executor.peak == limit
+
+def test_invalid_limit():
+    with pytest.raises(ValueError):
+        AsyncDeserializeService(max_concurrency=0)
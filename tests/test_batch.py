@@ -0,0 +1,54 @@
+from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.deserialization.batch import BatchDeserializeService
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from io import StringIO
+import json
+import os
+import pytest
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+def named_stream(text: str, name: str) -> StringIO:
+    stream = StringIO(text)
+    stream.name = name
+    return stream
+
+def test_failing_sources_are_reported_per_source(tmp_path):
+    missing = tmp_path / 'missing.json'
+    sources = [
+        os.path.join(DATA, 'swagger2.json'),
+        missing,
+        named_stream('{"swagger": "2.0", "info": ', 'truncated.json'),
+        os.path.join(DATA, 'openapi3.yml'),
+        named_stream('{"swagger": "1.2", "info": {}, "paths": {}}', 'unsupported.json'),
+    ]
+
+    results = sorted(BatchDeserializeService().deserialize_batch(sources, max_workers=2), key=lambda result: result.index)
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.ok for result in results] == [True, False, False, True, False]
+    assert results[0].specification == JSONDeserializeService().deserialize_path_to_specification(os.path.join(DATA, 'swagger2.json'))
+    assert results[3].specification.title
+
+    for result in (results[1], results[2], results[4]):
+        assert result.specification is None
+        assert isinstance(result.error, DeserializationException)
+
+    assert results[1].source == str(missing)
+    assert str(missing) in str(results[1].error)
+    assert results[2].source == 'truncated.json'
+    assert 'not supported' in str(results[4].error)
+
+def test_invalid_source_does_not_abort_its_chunk():
+    valid = json.dumps({'swagger': '2.0', 'info': {'title': 'Batch', 'version': '1.0.0'}, 'paths': {}})
+    invalid = json.dumps({'swagger': '2.0', 'info': {'title': 'Batch'}, 'paths': {}})
+    sources = [named_stream(valid, 'a.json'), named_stream(invalid, 'b.json'), named_stream(valid, 'c.json')]
+
+    results = sorted(BatchDeserializeService().deserialize_batch(sources, max_workers=1, chunk_size=3), key=lambda result: result.index)
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert 'version' in str(results[1].error)
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        list(BatchDeserializeService().deserialize_batch([], chunk_size=0))
@@ -0,0 +1,79 @@
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from benchmarks.generator import SpecificationGenerator
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from threading import Barrier
+import json
+import random
+import sys
+import pytest
+
+THREADS = 8
+
+DOCUMENTS = {
+    family: json.dumps(getattr(SpecificationGenerator(paths=30, shared_parameters=5, definitions=5, definition_depth=2, seed=3), family)())
+    for family in ('swagger2', 'openapi3')
+}
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    # Threads switch far more often than usual, so races show up within a few loads.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+def run_concurrently(work) -> list:
+    barrier = Barrier(THREADS)
+
+    def start(index: int):
+        barrier.wait()
+        return work(index)
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        return list(executor.map(start, range(THREADS)))
+
+def load(family: str, trusted: bool = False, lazy: bool = False):
+    return JSONDeserializeService().deserialize_to_specification(StringIO(DOCUMENTS[family]), trusted, lazy)
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_concurrent_loads_match_a_single_threaded_load(trusted):
+    expected = {family: load(family, trusted) for family in DOCUMENTS}
+    families = sorted(DOCUMENTS)
+
+    def work(index: int):
+        # Both families at once, so providers and their shared schemas are looked up concurrently.
+        for round in range(4):
+            family = families[(index + round) % len(families)]
+            assert load(family, trusted) == expected[family]
+
+    run_concurrently(work)
+
+@pytest.mark.parametrize('family', sorted(DOCUMENTS))
+def test_shared_lazy_specification(family):
+    expected = load(family)
+    operations = {method.operation_id: (endpoint, method) for endpoint in expected.endpoints for method in endpoint.methods}
+    specification = load(family, lazy=True)
+
+    def work(index: int) -> dict:
+        generator = random.Random(index)
+        urls = [endpoint.url for endpoint in expected.endpoints]
+        ids = list(operations)
+        generator.shuffle(urls)
+        generator.shuffle(ids)
+        built = {}
+
+        for url, operation_id in zip(urls, ids):
+            built[url] = specification.get_endpoint(url)
+            assert specification.find_method(operation_id) == operations[operation_id]
+
+        return built
+
+    results = run_concurrently(work)
+
+    assert list(specification.endpoints) == list(expected.endpoints)
+    assert specification.endpoints.materialized_count == len(expected.endpoints)
+
+    # Every endpoint was built once, every thread got the same object.
+    for endpoint in specification.endpoints:
+        assert all(result[endpoint.url] is endpoint for result in results)
@@ -0,0 +1,63 @@
+from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from apispecs.base.service.deserialization.impl.yaml import YAMLDeserializeService
+from io import StringIO
+import copy
+import json
+import pytest
+import yaml
+
+INVALID_YAML = ['a: [1, 2\nb: 3', 'a:\n\tb: 1', 'swagger: "2.0"\npaths:\n  /a: {get: [1\n']
+INVALID_JSON = ['{"a": [1, 2}', '{"a": 1,}', '{"a": tru}', '']
+
+"""
+Stream that cannot be read again, like a pipe.
+"""
+class UnseekableStream(StringIO):
+
+    def seekable(self) -> bool:
+        return False
+
+def error_of(load, *args) -> str:
+    with pytest.raises(DeserializationException) as info:
+        load(*args)
+
+    return str(info.value)
+
+def yaml_error(data) -> str:
+    with pytest.raises(yaml.YAMLError) as info:
+        yaml.load(data, Loader=yaml.SafeLoader)
+
+    return f'Failed to deserialize YAML: {info.value}'
+
+@pytest.mark.parametrize('document', INVALID_YAML)
+def test_yaml_errors_match_the_python_loader(document):
+    service = YAMLDeserializeService()
+
+    assert error_of(service.deserialize_to_dict, StringIO(document)) == yaml_error(StringIO(document))
+    assert error_of(service.deserialize_buffer_to_dict, document.encode()) == yaml_error(document.encode())
+    assert error_of(lambda: list(service.iterate_entries(StringIO(document)))) == yaml_error(StringIO(document))
+
+@pytest.mark.parametrize('document', INVALID_YAML)
+def test_yaml_errors_of_unseekable_streams_keep_their_name(document):
+    stream = UnseekableStream(document)
+    stream.name = 'spec.yml'
+    expected = StringIO(document)
+    expected.name = 'spec.yml'
+
+    assert error_of(YAMLDeserializeService().deserialize_to_dict, stream) == yaml_error(expected)
+
+@pytest.mark.parametrize('document', INVALID_JSON + ['{"a": NaN}'])
+def test_json_results_and_errors_do_not_depend_on_orjson(document):
+    pytest.importorskip('orjson')
+    service = JSONDeserializeService()
+    accelerated = copy.copy(service)
+    accelerated.use_orjson = True
+
+    for name, data in (('deserialize_to_dict', lambda: StringIO(document)), ('deserialize_buffer_to_dict', document.encode)):
+        try:
+            expected = getattr(service, name)(data())
+        except DeserializationException as e:
+            assert error_of(getattr(accelerated, name), data()) == str(e)
+        else:
+            assert json.dumps(getattr(accelerated, name)(data())) == json.dumps(expected)
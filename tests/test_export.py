@@ -0,0 +1,87 @@
+from apispecs.base.export import ColumnarFile, export_specifications
+from apispecs.base.models.specification import Specification, Endpoint, Method, Parameter
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+import os
+import pytest
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+def parameter(name: str, location: str = 'query', required: bool = False) -> Parameter:
+    return Parameter(name, '', location, required, 'string', '', '', '')
+
+SMALL = Specification('Pets ünïcode', 'Small', 'MIT', '', '2.0', '/v1', [
+    Endpoint('/pets/{id}', [parameter('id', 'path', True)], [
+        Method('get', 'getPet', 'Get a pet', '', False, [parameter('fields')]),
+        Method('delete', 'deletePet', '', '', True, []),
+    ]),
+    Endpoint('/pets', [], [Method('get', 'listPets', '', '', False, [parameter('petsLimit'), parameter('pet')])]),
+])
+
+@pytest.fixture
+def specifications() -> list:
+    service = JSONDeserializeService()
+    return [SMALL] + [service.deserialize_path_to_specification(os.path.join(DATA, name)) for name in ('swagger2.json', 'openapi3.json')]
+
+def test_write_and_read_back(tmp_path, specifications):
+    path = tmp_path / 'specs.col'
+
+    assert export_specifications(specifications, path) == 3
+
+    with ColumnarFile(path) as columns:
+        specification_rows = columns['specifications']
+        assert list(columns.strings(specification_rows['title'])) == [specification.title for specification in specifications]
+        assert list(columns.strings(specification_rows['base_url'])) == [specification.base_url for specification in specifications]
+
+        endpoints = columns['endpoints']
+        assert list(columns.strings(endpoints['url'])) == [endpoint.url for specification in specifications for endpoint in specification.endpoints]
+        assert list(endpoints['specification']) == [index for index, specification in enumerate(specifications) for _ in specification.endpoints]
+
+        operations = columns['operations']
+        methods = [method for specification in specifications for endpoint in specification.endpoints for method in endpoint.methods]
+        assert list(columns.strings(operations['operation_id'])) == [method.operation_id for method in methods]
+        assert list(operations['deprecated']) == [int(method.deprecated) for method in methods]
+
+        parameters = columns['parameters']
+        expected = []
+        endpoint_index = operation_index = 0
+
+        for specification in specifications:
+            for endpoint in specification.endpoints:
+                # Parameters of path items have no operation.
+                expected.extend((endpoint_index, -1, parameter.name, parameter.location, int(parameter.required)) for parameter in endpoint.parameters)
+
+                for method in endpoint.methods:
+                    expected.extend((endpoint_index, operation_index, parameter.name, parameter.location, int(parameter.required)) for parameter in method.parameters)
+                    operation_index += 1
+
+                endpoint_index += 1
+
+        assert list(zip(
+            parameters['endpoint'], parameters['operation'], columns.strings(parameters['name']),
+            columns.strings(parameters['location']), parameters['required']
+        )) == expected
+
+def test_find_string(tmp_path):
+    path = tmp_path / 'specs.col'
+    export_specifications([SMALL], path)
+
+    with ColumnarFile(path) as columns:
+        id = columns.find_string('getPet')
+        assert id is not None and columns.string(id) == 'getPet'
+        assert columns.string(columns.find_string('Pets ünïcode')) == 'Pets ünïcode'
+        # `pet` is a whole string as well as a part of others.
+        assert columns.string(columns.find_string('pet')) == 'pet'
+        # Parts of strings, or spanning several strings, are not strings.
+        assert columns.find_string('Pet') is None
+        assert columns.find_string('petsLim') is None
+        assert columns.find_string('missing') is None
+        # The empty string is always id 0.
+        assert columns.find_string('') == 0
+        assert columns.string(0) == ''
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / 'other.col'
+    path.write_bytes(b'not a columnar file')
+
+    with pytest.raises(ValueError, match='Not a columnar'):
+        ColumnarFile(path)
@@ -0,0 +1,65 @@
+from apispecs.base.exceptions import DeserializationException, ReferenceException
+from apispecs.base.service.cache.documents import DocumentCache
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+import copy
+import json
+import pytest
+
+def write(path, document: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document))
+    return path
+
+def specification(ref: str) -> dict:
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'External', 'version': '1.0.0'},
+        'paths': {'/pets': {'get': {'parameters': [{'$ref': ref}], 'responses': {}}}},
+    }
+
+@pytest.fixture
+def service():
+    service = copy.copy(JSONDeserializeService())
+    service.documents = DocumentCache()
+    return service
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_relative_reference(tmp_path, service, trusted):
+    write(tmp_path / 'common' / 'parameters.json', {'limit': {'name': 'limit', 'in': 'query', 'type': 'integer', 'default': 10}})
+    path = write(tmp_path / 'spec.json', specification('common/parameters.json#/limit'))
+
+    parameter = service.deserialize_path_to_specification(path, trusted).endpoints[0].methods[0].parameters[0]
+
+    assert (parameter.name, parameter.default_value) == ('limit', 10)
+
+def test_references_are_rejected_by_default(tmp_path):
+    write(tmp_path / 'common.json', {'limit': {'name': 'limit', 'in': 'query', 'type': 'integer'}})
+    path = write(tmp_path / 'spec.json', specification('common.json#/limit'))
+
+    with pytest.raises((DeserializationException, ReferenceException), match='must begin from the root'):
+        JSONDeserializeService().deserialize_path_to_specification(path, trusted=True)
+
+def test_cross_document_cycle(tmp_path, service):
+    write(tmp_path / 'a.json', {'limit': {'$ref': 'b.json#/limit'}})
+    write(tmp_path / 'b.json', {'limit': {'$ref': 'a.json#/limit'}})
+    path = write(tmp_path / 'spec.json', specification('a.json#/limit'))
+
+    with pytest.raises(ReferenceException, match='Circular reference'):
+        service.deserialize_path_to_specification(path, trusted=True)
+
+@pytest.mark.parametrize('ref', ['../secrets.json#/limit', '%2E%2E/secrets.json#/limit', 'link/secrets.json#/limit'])
+def test_traversal_outside_the_root_is_rejected(tmp_path, service, ref):
+    write(tmp_path / 'secrets.json', {'limit': {'name': 'password', 'in': 'query', 'type': 'string', 'default': 'hunter2'}})
+    (tmp_path / 'specs').mkdir()
+    (tmp_path / 'specs' / 'link').symlink_to(tmp_path)
+    path = write(tmp_path / 'specs' / 'spec.json', specification(ref))
+
+    with pytest.raises((DeserializationException, ReferenceException), match='must be in'):
+        service.deserialize_path_to_specification(path, trusted=True)
+
+def test_root_may_be_widened(tmp_path, service):
+    write(tmp_path / 'shared.json', {'limit': {'name': 'limit', 'in': 'query', 'type': 'integer'}})
+    path = write(tmp_path / 'specs' / 'spec.json', specification('../shared.json#/limit'))
+    service.documents_root = str(tmp_path)
+
+    assert service.deserialize_path_to_specification(path, trusted=True).endpoints[0].methods[0].parameters[0].name == 'limit'
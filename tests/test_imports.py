@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_importing_the_services_defers_optional_and_heavy_modules():
+    # A fresh interpreter, the test session has imported everything already.
+    code = (
+        'import sys\n'
+        'import apispecs.base.service.deserialization.impl.json\n'
+        'import apispecs.base.service.deserialization.impl.yaml\n'
+        'print(sorted(name for name in ("orjson", "marshmallow") if name in sys.modules))\n'
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == '[]'
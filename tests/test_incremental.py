@@ -0,0 +1,68 @@
+from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from io import StringIO
+import copy
+import json
+import pytest
+
+DOCUMENT = {
+    'swagger': '2.0',
+    'info': {'title': 'Incremental', 'version': '1.0.0'},
+    'parameters': {
+        'Limit': {'$ref': '#/parameters/BaseLimit'},
+        'BaseLimit': {'name': 'limit', 'in': 'query', 'type': 'integer', 'maximum': 10},
+        'Sort': {'name': 'sort', 'in': 'query', 'type': 'string'},
+    },
+    'paths': {
+        '/pets': {'get': {'operationId': 'listPets', 'parameters': [{'$ref': '#/parameters/Limit'}], 'responses': {}}},
+        '/owners': {'get': {'operationId': 'listOwners', 'parameters': [{'$ref': '#/parameters/Sort'}], 'responses': {}}},
+        '/toys': {'get': {'operationId': 'listToys', 'responses': {}}},
+    },
+}
+
+def update(document: dict, change, trusted: bool = False):
+    service = JSONDeserializeService()
+    previous_text = json.dumps(document)
+    previous = service.deserialize_to_specification(StringIO(previous_text), trusted)
+    changed = copy.deepcopy(document)
+    change(changed)
+    result = service.update_specification(previous, StringIO(previous_text), StringIO(json.dumps(changed)), trusted)
+    return previous, result, service.deserialize_to_specification(StringIO(json.dumps(changed)), trusted)
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_change_through_a_reference_chain_marks_dependents_dirty(trusted):
+    def change(document):
+        document['parameters']['BaseLimit']['maximum'] = 20
+
+    previous, result, expected = update(DOCUMENT, change, trusted)
+
+    assert result.rebuilt == ('/pets',)
+    assert result.specification == expected
+    # Endpoints that do not depend on the change are reused as they are.
+    assert result.specification.endpoints[1] is previous.endpoints[1]
+    assert result.specification.endpoints[2] is previous.endpoints[2]
+    assert 'maximum=20' in str(result.diff)
+
+def test_changed_path_item_is_rebuilt():
+    def change(document):
+        document['paths']['/toys']['get']['summary'] = 'Toys'
+
+    previous, result, expected = update(DOCUMENT, change)
+
+    assert result.rebuilt == ('/toys',)
+    assert result.specification == expected
+
+def test_unchanged_source_reuses_every_endpoint():
+    previous, result, _ = update(DOCUMENT, lambda document: None)
+
+    assert result.rebuilt == ()
+    assert all(new is old for new, old in zip(result.specification.endpoints, previous.endpoints))
+
+def test_references_to_other_documents_are_refused():
+    document = copy.deepcopy(DOCUMENT)
+    document['paths']['/toys']['get']['parameters'] = [{'$ref': 'common.json#/parameters/Page'}]
+    service = JSONDeserializeService()
+    previous = service.deserialize_to_specification(StringIO(json.dumps(DOCUMENT)))
+
+    with pytest.raises(DeserializationException, match='other documents'):
+        service.update_specification(previous, StringIO(json.dumps(DOCUMENT)), StringIO(json.dumps(document)))
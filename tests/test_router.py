@@ -0,0 +1,49 @@
+from apispecs.base.models.specification import Specification, Endpoint, Method
+from apispecs.base.router import Router
+import pytest
+
+def endpoint(url: str, *methods: str) -> Endpoint:
+    return Endpoint(url, [], [Method(method, f'{method}:{url}', '', '', False, []) for method in methods])
+
+ENDPOINTS = [
+    endpoint('/pets/{petId}', 'get', 'delete'),
+    endpoint('/pets/mine', 'get'),
+    endpoint('/pets/{petId}/photos/{photoId}.{format}', 'get'),
+    endpoint('/pets/mine/toys/{toyId}', 'get'),
+    endpoint('/', 'get'),
+]
+
+@pytest.fixture
+def router() -> Router:
+    return Router(Specification('Router', '', '', '', '1', '', ENDPOINTS), base_path='/v1/')
+
+@pytest.mark.parametrize('path, url, parameters', [
+    ('/v1/pets/mine', '/pets/mine', {}),
+    ('/v1/pets/42', '/pets/{petId}', {'petId': '42'}),
+    ('/v1/pets/a%20b/', '/pets/{petId}', {'petId': 'a b'}),
+    ('/v1/pets/7/photos/3.png?size=large', '/pets/{petId}/photos/{photoId}.{format}', {'petId': '7', 'photoId': '3', 'format': 'png'}),
+    ('/v1/pets/mine/toys/9', '/pets/mine/toys/{toyId}', {'toyId': '9'}),
+    ('/v1', '/', {}),
+])
+def test_match(router, path, url, parameters):
+    match = router.match('GET', path)
+
+    assert (match.endpoint.url, match.method.method, match.path_parameters) == (url, 'get', parameters)
+
+def test_literal_segment_beats_a_templated_one_in_any_order():
+    for endpoints in (ENDPOINTS, ENDPOINTS[::-1]):
+        router = Router(Specification('Router', '', '', '', '1', '', endpoints))
+
+        assert router.match('get', '/pets/mine').endpoint.url == '/pets/mine'
+        # Backtracks into the template when the literal branch has no route.
+        assert router.match('get', '/pets/mine/photos/1.jpg').path_parameters == {'petId': 'mine', 'photoId': '1', 'format': 'jpg'}
+
+@pytest.mark.parametrize('path', ['/v1/owners', '/v1/pets/1/photos', '/v1/pets/1/photos/1', '/v2/pets/1', '/v1pets/1', '/pets/1', '/v1/pets//'])
+def test_misses(router, path):
+    assert router.match('get', path) is None
+
+def test_missing_method_matches_the_endpoint_only(router):
+    match = router.match('POST', '/v1/pets/1')
+
+    assert match.endpoint.url == '/pets/{petId}'
+    assert match.method is None
@@ -0,0 +1,55 @@
+from apispecs.base.exceptions import UnknownSchemaException
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from apispecs.base.service.deserialization.impl.yaml import YAMLDeserializeService
+from apispecs.base.service.schema.sniffer import sniff_json_version, sniff_yaml_version
+from io import StringIO
+import pytest
+
+FAMILIES = ('swagger', 'openapi')
+
+@pytest.mark.parametrize('head, version', [
+    ('{"info": {"swagger": "1.0"}, "swagger": "2.0"', ('swagger', '2.0')),
+    ('﻿ {"openapi": "3.0.3", "paths": {', ('openapi', '3.0.3')),
+    ('{"paths": {"/swagger": {}}, "openapi": "3.1.0"}', ('openapi', '3.1.0')),
+    ('{"description": "\\"swagger\\": \\"2.0\\""}', None),
+    ('{"info": {"title": "Not a specification"}}', None),
+    ('["swagger", "2.0"]', None),
+])
+def test_json_version(head, version):
+    assert sniff_json_version(head, FAMILIES) == version
+
+@pytest.mark.parametrize('head, version', [
+    ('swagger: "2.0"\ninfo: {}\n', ('swagger', '2.0')),
+    ("# comment\nopenapi: '3.0.3'\n", ('openapi', '3.0.3')),
+    ('info:\n  swagger: "1.0"\nopenapi: 3.1.0 # latest\n', ('openapi', '3.1.0')),
+    ('{"swagger": "2.0"}', ('swagger', '2.0')),
+    ('info:\n  swagger: "2.0"\n', None),
+    ('title: Not a specification\n', None),
+])
+def test_yaml_version(head, version):
+    assert sniff_yaml_version(head, FAMILIES) == version
+
+@pytest.mark.parametrize('service, text', [
+    (JSONDeserializeService(), '{"swagger": "1.2", "apis": [ this is never parsed'),
+    (YAMLDeserializeService(), 'openapi: 4.0.0\npaths: [ this is never parsed'),
+])
+def test_unsupported_version_is_rejected_before_parsing(service, text, monkeypatch):
+    def deserialize_to_dict(*args):
+        raise AssertionError('The document was parsed.')
+
+    monkeypatch.setattr(service, 'deserialize_to_dict', deserialize_to_dict)
+    monkeypatch.setattr(service, 'deserialize_buffer_to_dict', deserialize_to_dict)
+
+    with pytest.raises(UnknownSchemaException, match='not supported'):
+        service.deserialize_to_specification(StringIO(text))
+
+    with pytest.raises(UnknownSchemaException, match='not supported'):
+        service.deserialize_buffer_to_specification(text.encode())
+
+@pytest.mark.parametrize('service, text', [
+    (JSONDeserializeService(), '{"info": {"title": "Not a specification"}, "paths": {}}'),
+    (YAMLDeserializeService(), 'info:\n  title: Not a specification\npaths: {}\n'),
+])
+def test_documents_without_version_are_rejected(service, text):
+    with pytest.raises(UnknownSchemaException, match='could not be determined'):
+        service.deserialize_to_specification(StringIO(text))
@@ -0,0 +1,99 @@
+from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.cache import service as cache_service
+from apispecs.base.service.cache.service import SpecificationCache
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService
+from io import StringIO
+import copy
+import json
+import os
+import pytest
+
+posix = pytest.mark.skipif(not hasattr(os, 'geteuid'), reason='POSIX permissions')
+
+def document(location: str = 'query') -> str:
+    return json.dumps({
+        'swagger': '2.0',
+        'info': {'title': 'Cached', 'version': '1.0.0'},
+        'paths': {'/pets': {'get': {'parameters': [{'name': 'limit', 'in': location, 'type': 'integer'}], 'responses': {}}}},
+    })
+
+@pytest.fixture
+def service(tmp_path):
+    service = copy.copy(JSONDeserializeService())
+    service.cache = SpecificationCache(str(tmp_path / 'cache'))
+    return service
+
+def entries(service) -> list:
+    return [name for name in os.listdir(service.cache.directory) if name.endswith('.spec')]
+
+def test_miss_then_hit(service):
+    first = service.deserialize_to_specification(StringIO(document()))
+    second = service.deserialize_to_specification(StringIO(document()))
+
+    assert first == second
+    assert service.cache.stats() == {'hits': 1, 'misses': 1, 'stores': 1, 'evictions': 0}
+    assert len(entries(service)) == 1
+
+def test_other_content_misses(service):
+    service.deserialize_to_specification(StringIO(document()))
+    service.deserialize_to_specification(StringIO(document('header')))
+
+    assert (service.cache.hits, service.cache.misses) == (0, 2)
+
+def test_format_version_bump_misses(service, monkeypatch):
+    service.deserialize_to_specification(StringIO(document()))
+    monkeypatch.setattr(cache_service, 'CACHE_FORMAT_VERSION', 'next')
+    service.deserialize_to_specification(StringIO(document()))
+
+    assert (service.cache.hits, service.cache.misses) == (0, 2)
+
+def test_trusted_and_validated_loads_are_kept_apart(service):
+    service.deserialize_to_specification(StringIO(document()), trusted=True)
+    service.deserialize_to_specification(StringIO(document()))
+
+    assert (service.cache.hits, service.cache.misses, len(entries(service))) == (0, 2, 2)
+
+    # A trusted build of an invalid document is never served to a validating load.
+    service.deserialize_to_specification(StringIO(document('nowhere')), trusted=True)
+
+    with pytest.raises(DeserializationException):
+        service.deserialize_to_specification(StringIO(document('nowhere')))
+
+def test_corrupted_entry_is_dropped(service):
+    service.deserialize_to_specification(StringIO(document()))
+    path = os.path.join(service.cache.directory, entries(service)[0])
+
+    with open(path, 'wb') as f:
+        f.write(b'not a pickle')
+
+    assert service.deserialize_to_specification(StringIO(document())).title == 'Cached'
+    assert (service.cache.hits, service.cache.misses, service.cache.stores) == (0, 2, 2)
+
+@posix
+def test_directory_is_created_private(tmp_path):
+    directory = tmp_path / 'cache'
+    SpecificationCache(str(directory))
+
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+@posix
+@pytest.mark.parametrize('mode', [0o777, 0o770, 0o702])
+def test_directory_writable_by_others_is_refused(tmp_path, mode):
+    directory = tmp_path / 'cache'
+    directory.mkdir()
+    directory.chmod(mode)
+
+    with pytest.raises(PermissionError, match='writable by other users'):
+        SpecificationCache(str(directory))
+
+@posix
+def test_directory_of_another_user_is_refused(tmp_path):
+    if os.geteuid() != 0:
+        pytest.skip('Changing the owner of a directory needs root.')
+
+    directory = tmp_path / 'cache'
+    directory.mkdir(mode=0o700)
+    os.chown(directory, 65534, 65534)
+
+    with pytest.raises(PermissionError, match='owned by another user'):
+        SpecificationCache(str(directory))
@@ -0,0 +1,121 @@
+from apispecs.base.exceptions import DeserializationException
+from apispecs.base.service.deserialization.impl.json import JSONDeserializeService, JSONEntryReader
+from apispecs.base.service.deserialization.impl.yaml import YAMLDeserializeService, EntryLoader, iterate_yaml_entries
+from io import StringIO
+import copy
+import json
+import os
+import pytest
+import yaml
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+SERVICES = {'.json': JSONDeserializeService, '.yml': YAMLDeserializeService}
+
+"""
+Text stream returning at most `size` characters per read, so values are cut at every possible place.
+"""
+class ChunkedStream(StringIO):
+
+    def __init__(self, text: str, size: int):
+        super().__init__(text)
+        self.size = size
+
+    def read(self, size: int = -1) -> str:
+        return super().read(self.size if size < 0 else min(size, self.size))
+
+def read_document(name: str) -> str:
+    with open(os.path.join(DATA, name)) as f:
+        return f.read()
+
+def stream(name: str, text: str, size: int, trusted: bool = False) -> list:
+    service = SERVICES[os.path.splitext(name)[1]]()
+
+    if isinstance(service, JSONDeserializeService):
+        # The JSON reader cuts values at its own chunk size.
+        service = copy.copy(service)
+        service.chunk_size = size
+        return list(service.stream_endpoints(StringIO(text), trusted))
+
+    # libyaml buffers the stream itself, short reads cut the document instead.
+    return list(service.stream_endpoints(ChunkedStream(text, size), trusted))
+
+@pytest.mark.parametrize('name', sorted(os.listdir(DATA)))
+def test_streamed_endpoints_match_full_load(name):
+    text = read_document(name)
+    service = SERVICES[os.path.splitext(name)[1]]()
+    expected = list(service.deserialize_to_specification(StringIO(text)).endpoints)
+    # Trusted builds are cheap, so every size is checked with them and validation with a few.
+    sizes = range(1, 65) if name.endswith('.json') else (1, 2, 3, 7, 64)
+
+    for size in sizes:
+        assert stream(name, text, size, trusted=True) == expected, size
+
+    for size in (1, 64):
+        assert stream(name, text, size) == expected, size
+
+def read_entries(reader) -> dict:
+    entries = {}
+
+    for key, url, value in reader:
+        if url is None:
+            entries[key] = value
+        else:
+            entries[key][url] = value
+
+    return entries
+
+ENTRIES = {
+    'count': 12.25,
+    'big': -1.5e+10,
+    'small': 1E-3,
+    'exponent': 2e5,
+    'flags': [True, False, None],
+    'text': 'a "quoted" \\ value',
+    'paths': {'/a': {'get': {'parameters': [{'name': 'a', 'in': 'query', 'type': 'number', 'maximum': 12.5}]}}, '/b': {}},
+    'last': 7,
+}
+
+@pytest.mark.parametrize('size', range(1, 17))
+def test_json_reader_values_cut_at_a_chunk_boundary(size):
+    # Numbers are written out so chunks also end right after their `.`, `e` and sign.
+    text = json.dumps(ENTRIES).replace('-15000000000.0', '-1.5e+10').replace('0.001', '1E-3').replace('200000.0', '2e5')
+    assert '-1.5e+10' in text and '1E-3' in text and '2e5' in text
+
+    assert read_entries(JSONEntryReader(StringIO(text), size)) == json.loads(text)
+
+@pytest.mark.parametrize('size', (1, 2, 3, 64))
+def test_yaml_reader_entries(size):
+    text = yaml.safe_dump(ENTRIES)
+
+    assert read_entries(iterate_yaml_entries(EntryLoader(ChunkedStream(text, size)))) == ENTRIES
+
+@pytest.mark.parametrize('extension', list(SERVICES))
+def test_missing_nested_required_field_is_rejected(extension):
+    document = {'swagger': '2.0', 'info': {'version': '1.0.0'}, 'paths': {}}
+    service = SERVICES[extension]()
+
+    with pytest.raises(DeserializationException, match='title'):
+        list(service.stream_endpoints(StringIO(json.dumps(document))))
+
+@pytest.mark.parametrize('extension', list(SERVICES))
+@pytest.mark.parametrize('document', [
+    {'swagger': '2.0', 'info': {'title': 'No paths', 'version': '1.0.0'}},
+    {'openapi': '3.0.3', 'info': {'title': 'No paths', 'version': '1.0.0'}},
+])
+@pytest.mark.parametrize('trusted', [False, True])
+def test_document_without_paths_is_rejected(extension, document, trusted):
+    service = SERVICES[extension]()
+    text = json.dumps(document)
+
+    with pytest.raises(DeserializationException):
+        service.deserialize_to_specification(StringIO(text), trusted)
+
+    with pytest.raises(DeserializationException, match='paths'):
+        list(service.stream_endpoints(StringIO(text), trusted))
+
+@pytest.mark.parametrize('extension', list(SERVICES))
+def test_empty_paths_are_accepted(extension):
+    document = {'openapi': '3.0.3', 'info': {'title': 'Empty', 'version': '1.0.0'}, 'paths': {}}
+
+    assert list(SERVICES[extension]().stream_endpoints(StringIO(json.dumps(document)))) == []
@@ -0,0 +1,18 @@
+from apispecs.swagger2.schema.schema import Swagger2Schema
+from marshmallow import ValidationError
+import pytest
+
+def document(parameter: dict) -> dict:
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'Parameters', 'version': '1.0.0'},
+        'paths': {'/pets': {'get': {'parameters': [parameter], 'responses': {}}}},
+    }
+
+def test_parameter_without_in_is_a_validation_error():
+    with pytest.raises(ValidationError, match='`in_location` must be set.'):
+        Swagger2Schema().load(document({'name': 'limit', 'type': 'integer'}))
+
+def test_path_parameter_must_be_required():
+    with pytest.raises(ValidationError, match='Required must be true'):
+        Swagger2Schema().load(document({'name': 'id', 'in': 'path', 'type': 'string'}))
@@ -0,0 +1,122 @@
+from apispecs.base.exceptions import ReferenceException
+from apispecs.swagger2.schema.schema import Swagger2Schema
+from apispecs.swagger2.schema.builder import TrustedSwagger2Schema
+from apispecs.openapi3.schema.schema import OpenAPI3Schema
+from apispecs.openapi3.schema.builder import TrustedOpenAPI3Schema
+from benchmarks.generator import SpecificationGenerator
+from marshmallow import ValidationError
+import copy
+import json
+import os
+import pytest
+import yaml
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+INFO = {'title': 'Equivalence', 'version': '1.0.0'}
+
+# Validating and trusted loaders of every family.
+LOADERS = {
+    'swagger2': (Swagger2Schema, TrustedSwagger2Schema),
+    'openapi3': (OpenAPI3Schema, TrustedOpenAPI3Schema),
+}
+
+def load_document(name: str) -> dict:
+    with open(os.path.join(DATA, name)) as f:
+        return json.load(f) if name.endswith('.json') else yaml.safe_load(f)
+
+def assert_equivalent(family: str, document: dict, lazy: bool = False):
+    schema, trusted_schema = LOADERS[family]
+    validated = schema(lazy=lazy).load(copy.deepcopy(document))
+    trusted = trusted_schema(lazy=lazy).load(copy.deepcopy(document))
+
+    assert list(validated.endpoints) == list(trusted.endpoints)
+    assert validated == trusted
+    assert str(validated) == str(trusted)
+
+@pytest.mark.parametrize('family, name', [
+    ('swagger2', 'swagger2.json'),
+    ('openapi3', 'openapi3.json'),
+    ('openapi3', 'openapi3.yml'),
+])
+def test_data_sample(family, name):
+    assert_equivalent(family, load_document(name))
+
+@pytest.mark.parametrize('family', list(LOADERS))
+@pytest.mark.parametrize('lazy', [False, True])
+@pytest.mark.parametrize('paths, operations_per_path, shared_parameters, seed', [
+    (50, 1, 0, 0),
+    (200, 2, 20, 1),
+    (100, 7, 5, 2),
+])
+def test_generated(family, paths, operations_per_path, shared_parameters, seed, lazy):
+    generator = SpecificationGenerator(paths=paths, operations_per_path=operations_per_path, shared_parameters=shared_parameters, seed=seed)
+    assert_equivalent(family, getattr(generator, family)(), lazy)
+
+def test_escaped_references():
+    document = {
+        'swagger': '2.0',
+        'info': INFO,
+        'basePath': '/v1',
+        'parameters': {
+            'a/b': {'name': 'slash', 'in': 'query', 'type': 'string', 'pattern': '^a'},
+            'c~d': {'name': 'tilde', 'in': 'header', 'type': 'integer', 'maximum': 10},
+            'chained': {'$ref': '#/parameters/a~1b'},
+        },
+        'paths': {
+            '/pets/{id}': {
+                'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'type': 'string'}, {'$ref': '#/parameters/c~0d'}],
+                'get': {'operationId': 'getPet', 'parameters': [{'$ref': '#/parameters/a~1b'}, {'$ref': '#/parameters/chained'}], 'responses': {}},
+            },
+            '/alias/{id}': {'$ref': '#/paths/~1pets~1{id}'},
+        },
+    }
+    assert_equivalent('swagger2', document)
+
+def test_openapi3_escaped_references():
+    document = {
+        'openapi': '3.0.3',
+        'info': INFO,
+        'servers': [{'url': 'https://{host}/v1', 'variables': {'host': {'default': 'api.example.com'}}}],
+        'components': {
+            'schemas': {'Ids': {'type': 'array', 'items': {'type': 'integer'}, 'maxItems': 3}},
+            'parameters': {
+                'a/b': {'name': 'ids', 'in': 'query', 'explode': False, 'schema': {'$ref': '#/components/schemas/Ids'}},
+                'c~d': {'name': 'tilde', 'in': 'header', 'schema': {'type': 'integer', 'maximum': 10}, 'x-internal': True},
+                'chained': {'$ref': '#/components/parameters/a~1b'},
+            },
+            'requestBodies': {'Pet': {'description': 'A pet.', 'required': True, 'content': {'application/json': {'schema': {'type': 'object'}}}}},
+        },
+        'paths': {
+            '/pets/{id}': {
+                'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}, {'$ref': '#/components/parameters/c~0d'}],
+                'get': {'operationId': 'getPet', 'parameters': [{'$ref': '#/components/parameters/a~1b'}, {'$ref': '#/components/parameters/chained'}], 'responses': {}},
+                'put': {'operationId': 'putPet', 'requestBody': {'$ref': '#/components/requestBodies/Pet'}, 'responses': {}},
+            },
+            '/alias/{id}': {'$ref': '#/paths/~1pets~1{id}'},
+        },
+    }
+    assert_equivalent('openapi3', document)
+
+@pytest.mark.parametrize('family, document', [
+    ('swagger2', {
+        'swagger': '2.0',
+        'info': INFO,
+        'parameters': {'A': {'$ref': '#/parameters/B'}, 'B': {'$ref': '#/parameters/A'}},
+        'paths': {'/a': {'get': {'parameters': [{'$ref': '#/parameters/A'}], 'responses': {}}}},
+    }),
+    ('openapi3', {
+        'openapi': '3.0.3',
+        'info': INFO,
+        'components': {'parameters': {'A': {'$ref': '#/components/parameters/B'}, 'B': {'$ref': '#/components/parameters/A'}}},
+        'paths': {'/a': {'get': {'parameters': [{'$ref': '#/components/parameters/A'}], 'responses': {}}}},
+    }),
+])
+def test_reference_cycles_are_rejected_by_both(family, document):
+    schema, trusted_schema = LOADERS[family]
+
+    with pytest.raises(ValidationError, match='Circular reference'):
+        schema().load(copy.deepcopy(document))
+
+    with pytest.raises(ReferenceException, match='Circular reference'):
+        trusted_schema().load(copy.deepcopy(document))
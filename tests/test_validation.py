@@ -0,0 +1,130 @@
+from apispecs.base.exceptions import RequestValidationException
+from apispecs.base.models.specification import Constraints, Endpoint, Method, Parameter
+from apispecs.base.validation import RequestValidators, compile_validator
+from apispecs.swagger2.schema.schema import Swagger2Schema
+from apispecs.swagger2.schema.builder import TrustedSwagger2Schema
+from apispecs.openapi3.schema.schema import OpenAPI3Schema
+from apispecs.openapi3.schema.builder import TrustedOpenAPI3Schema
+import copy
+import pytest
+
+INFO = {'title': 'Validation', 'version': '1.0.0'}
+
+LOADERS = [Swagger2Schema, TrustedSwagger2Schema, OpenAPI3Schema, TrustedOpenAPI3Schema]
+
+SWAGGER2 = {
+    'swagger': '2.0',
+    'info': INFO,
+    'paths': {'/pets/{id}': {
+        'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'type': 'integer', 'minimum': 1}],
+        'get': {'operationId': 'getPet', 'parameters': [
+            {'name': 'limit', 'in': 'query', 'type': 'integer', 'minimum': 1, 'maximum': 100, 'exclusiveMaximum': True, 'default': 20},
+            {'name': 'sort', 'in': 'query', 'type': 'string', 'enum': ['name', 'age']},
+            {'name': 'ids', 'in': 'query', 'type': 'array', 'collectionFormat': 'pipes', 'maxItems': 3, 'uniqueItems': True,
+             'items': {'type': 'integer', 'minimum': 1, 'maximum': 9}},
+            {'name': 'tags', 'in': 'query', 'type': 'array', 'collectionFormat': 'multi',
+             'items': {'type': 'string', 'enum': ['a', 'b'], 'pattern': '^[a-z]$'}},
+            {'name': 'X-Request-Id', 'in': 'header', 'required': True, 'type': 'string', 'minLength': 4},
+        ], 'responses': {}},
+    }},
+}
+
+OPENAPI3 = {
+    'openapi': '3.0.3',
+    'info': INFO,
+    'paths': {'/pets/{id}': {
+        'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'integer', 'minimum': 1}}],
+        'get': {'operationId': 'getPet', 'parameters': [
+            {'name': 'limit', 'in': 'query', 'schema': {'type': 'integer', 'minimum': 1, 'maximum': 100, 'exclusiveMaximum': True, 'default': 20}},
+            {'name': 'sort', 'in': 'query', 'schema': {'type': 'string', 'enum': ['name', 'age']}},
+            {'name': 'ids', 'in': 'query', 'style': 'pipeDelimited', 'explode': False,
+             'schema': {'type': 'array', 'maxItems': 3, 'uniqueItems': True, 'items': {'$ref': '#/components/schemas/Digit'}}},
+            {'name': 'tags', 'in': 'query', 'schema': {'type': 'array', 'items': {'type': 'string', 'enum': ['a', 'b'], 'pattern': '^[a-z]$'}}},
+            {'name': 'X-Request-Id', 'in': 'header', 'required': True, 'schema': {'type': 'string', 'minLength': 4}},
+        ], 'responses': {}},
+    }},
+    'components': {'schemas': {'Digit': {'type': 'integer', 'minimum': 1, 'maximum': 9}}},
+}
+
+def load_validator(loader):
+    document = SWAGGER2 if loader in (Swagger2Schema, TrustedSwagger2Schema) else OPENAPI3
+    endpoint = loader().load(copy.deepcopy(document)).endpoints[0]
+    return compile_validator(endpoint, endpoint.methods[0])
+
+def errors_of(validate, **sources) -> tuple:
+    with pytest.raises(RequestValidationException) as info:
+        validate(**sources)
+
+    return info.value.errors
+
+@pytest.mark.parametrize('loader', LOADERS)
+def test_valid_request_is_converted(loader):
+    validate = load_validator(loader)
+    values = validate(path={'id': '7'}, query={'ids': '1|2|3', 'tags': ['a', 'b'], 'sort': 'age'}, headers={'x-request-id': 'abcd'})
+
+    assert values == {'id': 7, 'limit': 20, 'sort': 'age', 'ids': [1, 2, 3], 'tags': ['a', 'b'], 'X-Request-Id': 'abcd'}
+
+@pytest.mark.parametrize('loader', LOADERS)
+def test_every_invalid_parameter_is_reported_with_integer_bounds(loader):
+    validate = load_validator(loader)
+    errors = errors_of(validate, path={'id': '0'}, query={'limit': '100', 'sort': 'size'}, headers={})
+
+    assert errors == (
+        'path parameter id is less than 1',
+        'query parameter limit is not less than 100',
+        'query parameter sort is not one of name, age',
+        'header parameter X-Request-Id is required',
+    )
+
+@pytest.mark.parametrize('loader', LOADERS)
+@pytest.mark.parametrize('query, error', [
+    ({'ids': '1|12'}, 'query parameter ids is greater than 9'),
+    ({'ids': '1|x'}, 'query parameter ids is not a valid integer'),
+    ({'ids': '1|2|3|4'}, 'query parameter ids has more than 3 items'),
+    ({'ids': '1|1'}, 'query parameter ids has duplicate items'),
+    ({'tags': ['a', 'c']}, 'query parameter tags is not one of a, b'),
+    ({'tags': ['a', 'bb']}, 'query parameter tags does not match ^[a-z]$'),
+])
+def test_array_items_are_checked_against_their_constraints(loader, query, error):
+    validate = load_validator(loader)
+
+    assert errors_of(validate, path={'id': '1'}, query=query, headers={'X-Request-Id': 'abcd'}) == (error,)
+
+def validator(type: str, constraints: Constraints):
+    endpoint = Endpoint('/values', [], [Method('get', 'getValues', '', '', False, [Parameter('value', '', 'query', True, type, '', '', '', constraints)])])
+    return RequestValidators().get(endpoint, endpoint.methods[0])
+
+@pytest.mark.parametrize('constraints, valid, invalid, error', [
+    # OpenAPI 3.1 gives the exclusive bounds themselves.
+    (Constraints(exclusive_minimum=5), '6', '5', 'is not greater than 5'),
+    (Constraints(exclusive_maximum=5), '4', '5', 'is not less than 5'),
+    # Along with an inclusive bound, the tighter one applies.
+    (Constraints(minimum=1, exclusive_minimum=5), '6', '5', 'is not greater than 5'),
+    (Constraints(minimum=5, exclusive_minimum=1), '5', '4', 'is less than 5'),
+    (Constraints(maximum=10, exclusive_maximum=5), '4', '5', 'is not less than 5'),
+    # Swagger 2 and OpenAPI 3.0 flags.
+    (Constraints(minimum=5, exclusive_minimum=True), '6', '5', 'is not greater than 5'),
+    (Constraints(minimum=5, exclusive_minimum=False), '5', '4', 'is less than 5'),
+    (Constraints(multiple_of=3), '9', '10', 'is not a multiple of 3'),
+])
+def test_numeric_bounds(constraints, valid, invalid, error):
+    validate = validator('integer', constraints)
+
+    assert validate(query={'value': valid}) == {'value': int(valid)}
+    assert errors_of(validate, query={'value': invalid}) == (f'query parameter value {error}',)
+
+def test_openapi31_numeric_exclusive_bound_is_loaded():
+    document = {
+        'openapi': '3.1.0',
+        'info': INFO,
+        'paths': {'/values': {'get': {'parameters': [
+            {'name': 'value', 'in': 'query', 'required': True, 'schema': {'type': ['integer', 'null'], 'exclusiveMinimum': 5}},
+        ], 'responses': {}}}},
+    }
+
+    for loader in (OpenAPI3Schema, TrustedOpenAPI3Schema):
+        endpoint = loader().load(copy.deepcopy(document)).endpoints[0]
+        validate = compile_validator(endpoint, endpoint.methods[0])
+
+        assert validate(query={'value': '6'}) == {'value': 6}
+        assert errors_of(validate, query={'value': '5'}) == ('query parameter value is not greater than 5',)